@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from pydantic import BaseModel
+
+
+# -------------------------
+# 📦 Request-scoped application context
+# -------------------------
+class ApplicationContext(BaseModel):
+    """Everything the agents' tools need about one application, loaded once per pipeline run.
+
+    Tools used to look up "the latest" HR and applicant rows on every call; a
+    concurrent submission could change which applicant that was mid-run.
+    """
+    app_id: str
+    applicant: dict = {}
+    resume_text: str = ""
+    hr: dict = {}  # newest HR entry for the applicant's position
+    job_document: str = ""
+
+    @classmethod
+    def load(cls, app_id: str) -> "ApplicationContext":
+        from chroma_db.db_handler import get_applicant_entry, get_applicant_document, get_position_entry
+
+        applicant = get_applicant_entry(app_id)
+        hr, job_document = get_position_entry(applicant.get("position"))
+        return cls(app_id=app_id, applicant=applicant, resume_text=get_applicant_document(app_id),
+                   hr=hr, job_document=job_document)
+
+    @classmethod
+    def latest(cls) -> Optional["ApplicationContext"]:
+        """Context for the newest application, for running an agent by hand from the CLI."""
+        from chroma_db.db_handler import get_latest_applicant_id
+
+        app_id = get_latest_applicant_id()
+        return cls.load(app_id) if app_id else None
+
+
+_current = ContextVar("application_context", default=None)
+
+
+@contextmanager
+def application_scope(context: Optional[ApplicationContext]):
+    """Make `context` the one every tool sees while an agent runs on this thread.
+
+    Without one (an agent run by hand from the CLI) the newest application is
+    loaded once for the whole scope.
+    """
+    token = _current.set(context or ApplicationContext.latest())
+    try:
+        yield _current.get()
+    finally:
+        _current.reset(token)
+
+
+def current_application() -> Optional[ApplicationContext]:
+    context = _current.get()
+    if context is None:
+        # Called outside any scope: load the newest application without leaving it behind on this thread
+        context = ApplicationContext.latest()
+    return context
@@ -0,0 +1,236 @@
+import argparse
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+import numpy as np
+from pydantic import BaseModel
+from agents.prescreen import PreScreenConfig, prescreen_batch, prescreen_stats, format_prescreen_report
+from agents.screening_store import screening_store
+from agents.structured_screening import build_screening_prompt, parse_verdict, request_verdict, format_verdict_report
+from llm_utils.llm_registry import get_client
+
+BATCH_WORKERS = int(os.getenv("BATCH_SCREENING_WORKERS", "8"))
+LLM_CONCURRENCY = int(os.getenv("BATCH_LLM_CONCURRENCY", "2"))  # match OLLAMA_NUM_PARALLEL on the server
+SCREENING_PROMPT_VERSION = "structured-v1"  # bump when the screening prompt or verdict schema changes
+
+
+# -------------------------
+# 📦 Per-candidate result
+# -------------------------
+class BatchScreeningResult(BaseModel):
+    app_id: str
+    name: Optional[str] = None
+    decision: Optional[str] = None  # "Eligible" / "Not eligible" / None when the LLM answer was unclear
+    score: float = 0.0
+    coverage: float = 0.0
+    missing_skills: list = []
+    interview_questions: list = []
+    fast_path: bool = False
+    cached: bool = False
+    report: str = ""
+    seconds: float = 0.0
+    generated_tokens: int = 0
+    error: Optional[str] = None
+
+    def metadata(self) -> dict:
+        # Chroma metadata only holds scalars
+        return {
+            "screening_decision": self.decision or "Needs review",
+            "screening_score": round(self.score, 4),
+            "screening_coverage": round(self.coverage, 4),
+            "screening_missing": ", ".join(self.missing_skills),
+            "screening_questions": " | ".join(self.interview_questions),
+            "screening_report": self.report,
+            "screened_at": datetime.now().isoformat(),
+        }
+
+    def stored(self) -> dict:
+        return self.model_dump(include={"decision", "score", "coverage", "missing_skills", "interview_questions",
+                                        "report"})
+
+
+class FifoSemaphore:
+    """Counting semaphore that hands out slots in arrival order.
+
+    threading.Semaphore lets the thread that just released re-acquire straight
+    away, which starves some candidates and blows up tail latency.
+    """
+
+    def __init__(self, value: int):
+        self._value = value
+        self._lock = threading.Lock()
+        self._waiters = deque()
+
+    def __enter__(self):
+        with self._lock:
+            if self._value > 0 and not self._waiters:
+                self._value -= 1
+                return self
+            turn = threading.Event()
+            self._waiters.append(turn)
+        turn.wait()  # the slot is handed over directly by __exit__
+        return self
+
+    def __exit__(self, *exc):
+        with self._lock:
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._value += 1
+
+
+def resume_context(app_id: str, job_text: str) -> str:
+    """The applicant's resume chunks most relevant to the job, for the prompt."""
+    from chroma_db.db_handler import query_resume_chunks
+
+    chunks = query_resume_chunks(app_id, job_text)
+    return "\n".join(f"[{chunk['section']}] {chunk['text']}" for chunk in chunks)
+
+
+def percentile(values: list, q: float) -> float:
+    return float(np.percentile(values, q)) if values else 0.0
+
+
+# -------------------------
+# 🚀 Batch screening
+# -------------------------
+def screen_batch(position_entry: dict, job_document: str, applicants: list, workers: int = BATCH_WORKERS,
+                 llm_concurrency: int = LLM_CONCURRENCY, config: PreScreenConfig = None, client=None,
+                 context_fn=None, store=screening_store):
+    """Screen many applicants for one position.
+
+    `applicants` is [(app_id, metadata, resume_text)]. The rule-based pre-screen
+    scores everyone in one vectorised pass; borderline candidates fan out over a
+    pool of `workers` threads, with at most `llm_concurrency` Ollama requests in
+    flight. `context_fn(app_id, job_text)` may return the resume excerpt for the
+    prompt. Pairs already in `store` are answered from it (pass None to disable).
+    Returns (results, summary).
+    """
+    from utils.resume_scoring import job_text_from_entry
+
+    client = client or get_client()
+    config = config or PreScreenConfig()
+    job_text = job_text_from_entry(position_entry, job_document)
+    llm_slots = FifoSemaphore(llm_concurrency)
+    batch_start = time.perf_counter()
+
+    results = [None] * len(applicants)
+    keys = [None] * len(applicants)
+    if store is not None:
+        version = store.version(SCREENING_PROMPT_VERSION, config)
+        for i, (app_id, meta, resume_text) in enumerate(applicants):
+            keys[i] = store.key(resume_text or "", job_text, version,
+                                (position_entry or {}).get("min_yoe"), meta.get("yoe"))
+            stored = store.get(keys[i])
+            if stored is not None:
+                results[i] = BatchScreeningResult(app_id=app_id, name=meta.get("name"), cached=True, **stored)
+    todo = [i for i in range(len(applicants)) if results[i] is None]
+
+    pre_results = prescreen_batch([applicants[i][1] for i in todo], [applicants[i][2] for i in todo],
+                                  position_entry, job_document, config)
+
+    def screen_one(applicant, pre):
+        app_id, meta, resume_text = applicant
+        start = time.perf_counter()
+        result = BatchScreeningResult(app_id=app_id, name=meta.get("name"), score=pre.score,
+                                      coverage=pre.coverage, missing_skills=pre.missing_skills)
+        if pre.fast_path:
+            prescreen_stats.record_fast_path(pre.decision)
+            result.decision, result.fast_path, result.report = pre.decision, True, format_prescreen_report(pre)
+        else:
+            try:
+                context = (context_fn(app_id, job_text) if context_fn else None) or resume_text or ""
+                prompt = build_screening_prompt(job_text, context, pre)
+                with llm_slots:
+                    llm_start = time.perf_counter()
+                    body = request_verdict(prompt, client)
+                    prescreen_stats.record_llm(time.perf_counter() - llm_start)
+                result.generated_tokens = body.get("eval_count", 0)
+                verdict = parse_verdict(body.get("response", ""))
+                if verdict is None:
+                    # Not stored or written back, so the next run screens this candidate again
+                    result.error = "LLM returned a verdict that does not match the schema"
+                else:
+                    result.decision, result.score = verdict.decision, verdict.score / 100
+                    result.missing_skills = verdict.missing_skills or pre.missing_skills
+                    result.interview_questions = verdict.interview_questions
+                    result.report = format_verdict_report(verdict)
+            except Exception as e:
+                result.error = str(e)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="batch-screening") as pool:
+        screened = list(pool.map(screen_one, [applicants[i] for i in todo], pre_results))
+    for i, result in zip(todo, screened):
+        results[i] = result
+        if store is not None and result.error is None:
+            store.put(keys[i], version, result.stored())
+
+    latencies = [r.seconds for r in results]
+    summary = {
+        "candidates": len(results),
+        "cached": sum(r.cached for r in results),
+        "fast_path": sum(r.fast_path for r in results),
+        "llm_calls": sum(not (r.fast_path or r.cached) for r in results),
+        "eligible": sum(r.decision == "Eligible" for r in results),
+        "errors": sum(r.error is not None for r in results),
+        "generated_tokens": sum(r.generated_tokens for r in results),
+        "p50_seconds": percentile(latencies, 50),
+        "p95_seconds": percentile(latencies, 95),
+        "wall_seconds": time.perf_counter() - batch_start,
+    }
+    return results, summary
+
+
+def screen_applicants(position: str, app_ids: list = None, write_back: bool = True, **kwargs):
+    """Load applicants for a position from Chroma, screen them and store the outcome in their metadata."""
+    from chroma_db.db_handler import (
+        get_position_entry, get_applicant_entry, get_applicant_documents, get_applicant_ids_for_position,
+        update_applicants_metadata
+    )
+
+    position_entry, job_document = get_position_entry(position)
+    app_ids = list(app_ids or get_applicant_ids_for_position(position))
+    documents = get_applicant_documents(app_ids)
+    applicants = [(app_id, get_applicant_entry(app_id), documents.get(app_id, "")) for app_id in app_ids]
+
+    results, summary = screen_batch(position_entry, job_document, applicants, context_fn=resume_context, **kwargs)
+    if write_back:
+        update_applicants_metadata({r.app_id: r.metadata() for r in results if r.error is None})
+    return results, summary
+
+
+# -------------------------
+# 🧰 CLI
+# -------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Screen a backlog of applicants for one position.")
+    parser.add_argument("--position", required=True, help="Position title as entered by HR")
+    parser.add_argument("--ids", nargs="*", help="Applicant ids (default: everyone who applied for the position)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS)
+    parser.add_argument("--llm-concurrency", type=int, default=LLM_CONCURRENCY,
+                        help="Maximum Ollama requests in flight")
+    parser.add_argument("--dry-run", action="store_true", help="Do not write results back to applicant metadata")
+    args = parser.parse_args()
+
+    results, summary = screen_applicants(args.position, args.ids, write_back=not args.dry_run,
+                                         workers=args.workers, llm_concurrency=args.llm_concurrency)
+    for r in sorted(results, key=lambda r: r.score, reverse=True):
+        path = "stored" if r.cached else "rules" if r.fast_path else "llm"
+        print(f"{r.app_id:<24} {r.name or '':<24} {r.decision or r.error or 'Needs review':<14} "
+              f"score {r.score:.2f} [{path}] {r.seconds:.2f}s")
+    print(
+        f"\n✅ Screened {summary['candidates']} candidates ({summary['cached']} from the results store, "
+        f"{summary['fast_path']} by rules, "
+        f"{summary['llm_calls']} by LLM, {summary['errors']} errors) in {summary['wall_seconds']:.1f}s; "
+        f"latency p50 {summary['p50_seconds']:.2f}s, p95 {summary['p95_seconds']:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
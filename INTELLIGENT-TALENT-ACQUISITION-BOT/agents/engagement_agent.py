@@ -1,6 +1,6 @@
 from crewai import Agent, Task, Crew
 from llm_utils.local_llm_runner import load_mistral_7b
-from chroma_db.db_handler import get_latest_applicant_entry
+from agents.application_context import ApplicationContext, application_scope, current_application
 from email_utils.send_email import send_engagement_email
 from langchain.tools import BaseTool
 from pydantic import BaseModel
@@ -25,8 +25,8 @@ class GenerateEngagementMessageTool(BaseTool):
 
     def _run(self, query: str = "") -> str:
         try:
-            applicant_data = get_latest_applicant_entry()
-            applicant = ApplicantInfo(**applicant_data)
+            context = current_application()
+            applicant = ApplicantInfo(**context.applicant) if context else ApplicantInfo()
 
             return (
                 f"Hi {applicant.name},\n\n"
@@ -51,8 +51,13 @@ class SendEngagementEmailTool(BaseTool):
 
     def _run(self, query: str = "") -> str:
         try:
-            # Format: "email;name"
-            email, name = query.split(";")
+            context = current_application()
+            if context and context.applicant.get("email"):
+                # The application on record wins over whatever address the model wrote
+                email, name = context.applicant["email"], context.applicant.get("name", "Candidate")
+            else:
+                # Format: "email;name"
+                email, name = query.split(";")
             send_engagement_email(email.strip(), name.strip())
             return f"✅ Engagement email sent to {name.strip()} at {email.strip()}."
         except Exception as e:
@@ -67,7 +72,7 @@ class SendEngagementEmailTool(BaseTool):
 # -------------------------
 class EngagementAgent:
     def __init__(self):
-        self.llm = load_mistral_7b()
+        self.llm = load_mistral_7b("engagement")
         self.agent = self._create_agent()
 
     def _create_agent(self):
@@ -91,22 +96,22 @@ class EngagementAgent:
             agent=self.agent
         )
 
+    def run(self, context: ApplicationContext = None):
+        crew = Crew(
+            agents=[self.agent],
+            tasks=[self.create_engagement_task()],
+            verbose=True
+        )
+        with application_scope(context):
+            return crew.kickoff()
+
 
 # -------------------------
 # 🚀 Run Engagement Agent
 # -------------------------
-def run_engagement_agent():
-    agent = EngagementAgent()
-    task = agent.create_engagement_task()
-
-    crew = Crew(
-        agents=[agent.agent],
-        tasks=[task],
-        verbose=True
-    )
-
-    result = crew.kickoff()
-    return result
+def run_engagement_agent(agent: EngagementAgent = None, context: ApplicationContext = None):
+    agent = agent or EngagementAgent()
+    return agent.run(context)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,84 @@
+import threading
+from chroma_db.db_handler import update_applicants_metadata
+from agents.application_context import ApplicationContext
+from utils.job_queue import JobQueue, StopPipeline
+
+# -------------------------
+# 🤖 Per-worker agent instances
+# -------------------------
+# CrewAI agents keep executor state while a crew runs, so each worker thread
+# builds its own set once and reuses it for every job it picks up.
+_local = threading.local()
+
+
+def _agent(kind: str):
+    agents = getattr(_local, "agents", None)
+    if agents is None:
+        agents = _local.agents = {}
+    if kind not in agents:
+        if kind == "engagement":
+            from agents.engagement_agent import EngagementAgent
+            agents[kind] = EngagementAgent()
+        else:
+            from agents.scheduling_agent import SchedulingAgent
+            agents[kind] = SchedulingAgent()
+    return agents[kind]
+
+
+# -------------------------
+# 🧩 Pipeline stages
+# -------------------------
+def load_context(payload: dict) -> ApplicationContext:
+    # One lookup of the application, its resume and its position per run; every stage shares it
+    return ApplicationContext.load(payload["app_id"])
+
+
+def screening_stage(payload: dict, results: dict, context: ApplicationContext) -> dict:
+    from agents.screening_agent import screen_applicant
+
+    result = screen_applicant(context.applicant, context.resume_text, app_id=context.app_id,
+                              position_entry=context.hr, job_document=context.job_document)
+    if result.error:
+        raise RuntimeError(result.error)  # retried by the queue
+    update_applicants_metadata({context.app_id: result.metadata()})
+
+    outcome = {**result.stored(), "eligible": result.decision == "Eligible"}
+    if not outcome["eligible"]:
+        # Nothing to engage or schedule; later stages are marked skipped
+        raise StopPipeline(outcome)
+    return outcome
+
+
+def engagement_stage(payload: dict, results: dict, context: ApplicationContext) -> str:
+    return str(_agent("engagement").run(context))
+
+
+def scheduling_stage(payload: dict, results: dict, context: ApplicationContext) -> str:
+    # The scheduling agent's tool notifies both HR and the applicant
+    return str(_agent("scheduling").run(context))
+
+
+PIPELINE_STAGES = [
+    ("screening", screening_stage),
+    ("engagement", engagement_stage),
+    ("scheduling", scheduling_stage),
+]
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_pipeline_queue() -> JobQueue:
+    """Process-wide queue; its worker threads start on the first enqueue."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue(PIPELINE_STAGES, name="pipeline", context_factory=load_context)
+        return _queue
+
+
+def enqueue_application(app_id: str, revision: str = "") -> int:
+    # One pipeline run per application version, however many times it is submitted or rerun.
+    # Resubmissions keep their app_id, so a changed resume is told apart by `revision`.
+    key = f"application:{app_id}" + (f":{revision}" if revision else "")
+    return get_pipeline_queue().enqueue(key, {"app_id": app_id})
@@ -0,0 +1,136 @@
+import os
+import threading
+from typing import Optional
+from pydantic import BaseModel, Field
+from utils.resume_scoring import ResumeScorer, job_text_from_entry
+
+
+# -------------------------
+# ⚙️ Thresholds
+# -------------------------
+class PreScreenConfig(BaseModel):
+    accept_threshold: float = Field(default=float(os.getenv("PRESCREEN_ACCEPT", "0.75")),
+                                    description="Blended score at or above which we accept without the LLM")
+    reject_threshold: float = Field(default=float(os.getenv("PRESCREEN_REJECT", "0.25")),
+                                    description="Blended score at or below which we reject without the LLM")
+    min_accept_coverage: float = Field(default=0.6, description="Skill coverage also required for a fast accept")
+    enforce_min_yoe: bool = Field(default=True, description="Reject outright when a known yoe is below the position's min_yoe")
+    default_llm_seconds: float = Field(default=60.0, description="Assumed LLM screening time until one is observed")
+
+
+class PreScreenResult(BaseModel):
+    decision: Optional[str] = None  # "Eligible" / "Not eligible", None means borderline → LLM
+    score: float = 0.0
+    coverage: float = 0.0
+    missing_skills: list = []
+    reason: str = ""
+
+    @property
+    def fast_path(self) -> bool:
+        return self.decision is not None
+
+
+# -------------------------
+# 📈 Fast-path statistics (process-wide)
+# -------------------------
+class PreScreenStats:
+    def __init__(self, default_llm_seconds: float = 60.0):
+        self._lock = threading.Lock()
+        self.fast_accept = 0
+        self.fast_reject = 0
+        self.sent_to_llm = 0
+        self.llm_seconds = 0.0
+        self.default_llm_seconds = default_llm_seconds
+
+    def record_fast_path(self, decision: str):
+        with self._lock:
+            if decision == "Eligible":
+                self.fast_accept += 1
+            else:
+                self.fast_reject += 1
+
+    def record_llm(self, seconds: float):
+        with self._lock:
+            self.sent_to_llm += 1
+            self.llm_seconds += seconds
+
+    def summary(self) -> dict:
+        with self._lock:
+            fast = self.fast_accept + self.fast_reject
+            total = fast + self.sent_to_llm
+            avg_llm = self.llm_seconds / self.sent_to_llm if self.sent_to_llm else self.default_llm_seconds
+            return {
+                "total": total,
+                "fast_accept": self.fast_accept,
+                "fast_reject": self.fast_reject,
+                "sent_to_llm": self.sent_to_llm,
+                "fast_path_fraction": fast / total if total else 0.0,
+                "avg_llm_seconds": avg_llm,
+                "estimated_seconds_saved": fast * avg_llm,
+            }
+
+
+prescreen_stats = PreScreenStats()
+
+
+# -------------------------
+# 🚦 Rule-based pre-screen
+# -------------------------
+def prescreen(applicant: dict, resume_text: str, position_entry: dict, job_document: str = "",
+              config: PreScreenConfig = None) -> PreScreenResult:
+    return prescreen_batch([applicant], [resume_text], position_entry, job_document, config)[0]
+
+
+def prescreen_batch(applicants: list, resume_texts: list, position_entry: dict, job_document: str = "",
+                    config: PreScreenConfig = None) -> list:
+    """Pre-screen many applicants for one position with a single vectorised scoring pass."""
+    config = config or PreScreenConfig()
+    results = [None] * len(applicants)
+    to_score = []
+
+    for i, (applicant, resume_text) in enumerate(zip(applicants, resume_texts)):
+        if not position_entry:
+            results[i] = PreScreenResult(decision="Not eligible",
+                                         reason=f"Position '{applicant.get('position')}' is not open.")
+            continue
+        if not resume_text:
+            results[i] = PreScreenResult(reason="No resume text; deferring to the LLM.")
+            continue
+        yoe = applicant.get("yoe")
+        min_yoe = position_entry.get("min_yoe")
+        # Bulk-ingested resumes have no yoe; leave them to the scorer and the LLM
+        if config.enforce_min_yoe and min_yoe is not None and yoe not in (None, "") and float(yoe) < float(min_yoe):
+            results[i] = PreScreenResult(decision="Not eligible",
+                                         reason=f"{float(yoe):g} years of experience, position requires {float(min_yoe):g}.")
+            continue
+        to_score.append(i)
+
+    if not to_score:
+        return results
+
+    scorer = ResumeScorer([job_text_from_entry(position_entry, job_document)])
+    scored = scorer.score([resume_texts[i] for i in to_score])
+    for row, i in enumerate(to_score):
+        score = float(scored["score"][row, 0])
+        coverage = float(scored["coverage"][row, 0])
+        _, _, missing = scorer.skill_breakdown(scored["resume_skills"], row, 0)
+
+        if score >= config.accept_threshold and coverage >= config.min_accept_coverage:
+            decision, reason = "Eligible", "Score above the accept threshold."
+        elif score <= config.reject_threshold:
+            decision, reason = "Not eligible", "Score below the reject threshold."
+        else:
+            decision, reason = None, "Borderline score; deferring to the LLM."
+
+        results[i] = PreScreenResult(decision=decision, score=score, coverage=coverage,
+                                     missing_skills=missing, reason=reason)
+    return results
+
+
+def format_prescreen_report(result: PreScreenResult) -> str:
+    return (
+        "## Screening Report (rule-based pre-screen)\n"
+        f"1. Skill Match Percentage: {result.coverage * 100:.1f}% (blended score {result.score:.2f})\n"
+        f"2. Missing Requirements: {', '.join(result.missing_skills) or 'None'}\n"
+        f"3. Final Recommendation: {result.decision} — {result.reason}\n"
+    )
@@ -1,7 +1,8 @@
 from crewai import Agent, Task, Crew
 from llm_utils.local_llm_runner import load_mistral_7b
-from chroma_db.db_handler import get_latest_hr_entry, get_latest_applicant_entry
+from agents.application_context import ApplicationContext, application_scope, current_application
 from email_utils.send_email import send_email_to_hr, send_email_to_applicant
+from utils.interview_scheduler import get_interview_scheduler, preferred_start, recruiter_key
 from langchain.tools import BaseTool
 from typing import Optional
 from pydantic import BaseModel
@@ -11,26 +12,38 @@ from pydantic import BaseModel
 # -------------------------
 class HRData(BaseModel):
     email: Optional[str] = None
+    recruiter_id: Optional[str] = None
+    timezone: Optional[str] = None
 
 class ApplicantData(BaseModel):
+    app_id: Optional[str] = None
     email: Optional[str] = None
     name: Optional[str] = None
     position: Optional[str] = None
     company: Optional[str] = None
+    free_date: Optional[str] = None
+    free_time: Optional[str] = None
+    timezone: Optional[str] = None
+    created_at: Optional[str] = None  # changes when the application is resubmitted
+
+def interview_parties():
+    """(HRData, ApplicantData) for the application being scheduled, from the run's context."""
+    context = current_application()
+    if context is None:
+        return HRData(), ApplicantData()
+    applicant = ApplicantData(**{**context.applicant, "app_id": context.app_id, "company": context.hr.get("company")})
+    return HRData(**context.hr), applicant
 
 # -------------------------
 # 🛠️ Tool 1: Fetch Interview Data
 # -------------------------
 class FetchInterviewDataTool(BaseTool):
     name : str = "FetchInterviewData"
-    description : str = "Fetch the latest HR and Applicant data from the database."
+    description : str = "Fetch the HR and applicant data for the application being scheduled."
 
     def _run(self, query: str = "") -> str:
         try:
-            hr_data_raw = get_latest_hr_entry()
-            applicant_data_raw = get_latest_applicant_entry()
-            hr_data = HRData(**hr_data_raw) if hr_data_raw else HRData()
-            applicant_data = ApplicantData(**applicant_data_raw) if applicant_data_raw else ApplicantData()
+            hr_data, applicant_data = interview_parties()
             return (
                 f"Fetched HR: {hr_data.email}\n"
                 f"Applicant: {applicant_data.name}, {applicant_data.email}, "
@@ -51,10 +64,7 @@ class ScheduleInterviewTool(BaseTool):
 
     def _run(self, query: str = "") -> str:
         try:
-            hr_data_raw = get_latest_hr_entry()
-            applicant_data_raw = get_latest_applicant_entry()
-            hr_info = HRData(**hr_data_raw) if hr_data_raw else HRData()
-            applicant_info = ApplicantData(**applicant_data_raw) if applicant_data_raw else ApplicantData()
+            hr_info, applicant_info = interview_parties()
 
             hr_email = hr_info.email
             applicant_email = applicant_info.email
@@ -65,15 +75,34 @@ class ScheduleInterviewTool(BaseTool):
             if not all([hr_email, applicant_email, candidate_name, job_role, company]):
                 return "❌ Missing required information for scheduling."
 
+            # Earliest slot free for both sides, from the applicant's stated availability onwards
+            recruiter = recruiter_key(hr_info.model_dump())
+            scheduler = get_interview_scheduler()
+            interview = scheduler.book(applicant_info.app_id or applicant_email, recruiter, applicant_email,
+                                       preferred_start(applicant_info.model_dump()),
+                                       hours=scheduler.availability(recruiter, hr_info.timezone),
+                                       revision=applicant_info.created_at)
+            if interview is None:
+                return f"❌ No free interview slot for {candidate_name} in the next few weeks."
+
             interview_link = "https://meet.google.com/test-interview-link"
-            proposed_slot = "Tomorrow at 11:00 AM IST"
+            hr_slot = interview.local(hr_info.timezone)
+            applicant_slot = interview.local(applicant_info.timezone)
 
-            hr_confirmed = send_email_to_hr(hr_email, candidate_name, proposed_slot, interview_link)
+            hr_confirmed = send_email_to_hr(
+                hr_email, f"Interview scheduled: {candidate_name} for {job_role}",
+                f"{candidate_name} ({applicant_email}) is booked for a {job_role} interview on {hr_slot}.<br>"
+                f"Meeting link: {interview_link}"
+            )
             if not hr_confirmed:
                 return f"⏳ Waiting for HR ({hr_email}) to confirm interview."
 
-            send_email_to_applicant(applicant_email, candidate_name, job_role, company, proposed_slot, interview_link)
-            return f"✅ Interview scheduled for {candidate_name} with {company} at {proposed_slot}."
+            send_email_to_applicant(
+                applicant_email, f"Your interview with {company}",
+                f"Hi {candidate_name}, your interview for {job_role} at {company} is on {applicant_slot}.<br>"
+                f"Meeting link: {interview_link}"
+            )
+            return f"✅ Interview scheduled for {candidate_name} with {company} at {applicant_slot}."
 
         except Exception as e:
             return f"❌ Error in scheduling interview: {e}"
@@ -86,7 +115,7 @@ class ScheduleInterviewTool(BaseTool):
 # -------------------------
 class SchedulingAgent:
     def __init__(self):
-        self.llm = load_mistral_7b()
+        self.llm = load_mistral_7b("scheduling")
         self.agent = self._create_agent()
 
     def _create_agent(self):
@@ -113,21 +142,21 @@ class SchedulingAgent:
             agent=self.agent
         )
 
+    def run(self, context: ApplicationContext = None):
+        crew = Crew(
+            agents=[self.agent],
+            tasks=[self.create_scheduling_task()],
+            verbose=True
+        )
+        with application_scope(context):
+            return crew.kickoff()
+
 # -------------------------
 # 🚀 Run the Scheduling Agent
 # -------------------------
-def run_scheduling_agent():
-    scheduler = SchedulingAgent()
-    task = scheduler.create_scheduling_task()
-    
-    crew = Crew(
-        agents=[scheduler.agent],
-        tasks=[task],
-        verbose=True
-    )
-
-    result = crew.kickoff()
-    return result
+def run_scheduling_agent(scheduler: SchedulingAgent = None, context: ApplicationContext = None):
+    scheduler = scheduler or SchedulingAgent()
+    return scheduler.run(context)
 
 if __name__ == "__main__":
     status = run_scheduling_agent()
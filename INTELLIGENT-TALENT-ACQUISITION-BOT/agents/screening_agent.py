@@ -3,40 +3,59 @@ from langchain.tools import BaseTool
 from pydantic import BaseModel, Field
 from typing import Optional, Dict
 from llm_utils.local_llm_runner import load_mistral_7b
-from chroma_db.db_handler import get_latest_hr_entry, get_latest_applicant_entry
+from chroma_db.db_handler import get_position_entry, query_resume_chunks
+from utils.resume_scoring import ResumeScorer, job_text_from_entry
+from agents.prescreen import PreScreenConfig
+from agents.batch_screening import BatchScreeningResult, screen_batch, resume_context
+from agents.application_context import ApplicationContext, application_scope, current_application
+
+RESUME_CONTEXT_CHUNKS = 4  # resume chunks handed to the LLM instead of the whole CV
 
 # -------------------------
 # 📦 Data models
 # -------------------------
 class HRData(BaseModel):
     job_description: Optional[str] = Field(default=None, description="HR's job requirements")
+    position: Optional[str] = Field(default=None, description="Open position title")
 
 class ApplicantData(BaseModel):
+    app_id: Optional[str] = Field(default=None, description="Applicant id in applicant_collection")
     resume_text: Optional[str] = Field(default=None, description="Applicant's resume content")
 
 # -------------------------
 # 🛠 Tool 1: Fetch HR + Applicant data
 # -------------------------
-def fetch_latest_entries() -> Dict[str, BaseModel]:
-    hr_data_raw = get_latest_hr_entry() or {}
-    applicant_data_raw = get_latest_applicant_entry() or {}
+def fetch_application_entries() -> Dict[str, BaseModel]:
+    # Served from the run's ApplicationContext; no database access here
+    context = current_application()
+    if context is None:
+        return {"hr": HRData(), "applicant": ApplicantData()}
     return {
-        "hr": HRData(**hr_data_raw),
-        "applicant": ApplicantData(**applicant_data_raw)
+        "hr": HRData(**context.hr),
+        "applicant": ApplicantData(app_id=context.app_id, resume_text=context.resume_text or None)
     }
 
 class FetchLatestEntriesTool(BaseTool):
     name: str = Field(default="fetch_records", frozen=True)
     description: str = Field(
-        default="Retrieves latest HR job post and applicant resume from database",
+        default="Retrieves the job post and the applicant's resume for the application being screened",
         frozen=True
     )
 
     def _run(self) -> str:  # Removed unused query parameter
-        data = fetch_latest_entries()
+        data = fetch_application_entries()
+        hr, applicant = data["hr"], data["applicant"]
+        job_text = job_text_from_entry(hr.model_dump())
+
+        # Only the resume sections most relevant to the job go into the prompt
+        chunks = query_resume_chunks(applicant.app_id, job_text, k=RESUME_CONTEXT_CHUNKS) if job_text else []
+        if chunks:
+            resume_excerpt = "\n".join(f"[{chunk['section']}] {chunk['text']}" for chunk in chunks)
+        else:
+            resume_excerpt = applicant.resume_text or 'Not available'
         return f"""
-        HR Job Description: {data['hr'].job_description or 'Not available'}
-        Applicant Resume: {data['applicant'].resume_text or 'Not available'}
+        HR Job Description: {hr.job_description or 'Not available'}
+        Applicant Resume (most relevant sections): {resume_excerpt}
         """
 
 # -------------------------
@@ -50,25 +69,25 @@ class AnalyzeResumeTool(BaseTool):
     )
 
     def _run(self) -> str:  # Fixed method signature
-        data = fetch_latest_entries()
+        data = fetch_application_entries()
         hr = data["hr"]
         applicant = data["applicant"]
 
-        if not hr.job_description or not applicant.resume_text:
+        job_text = job_text_from_entry(hr.model_dump())
+        if not job_text or not applicant.resume_text:
             return "Error: Missing required data for analysis"
 
-        job_desc = hr.job_description.lower()
-        resume = applicant.resume_text.lower()
+        scorer = ResumeScorer([job_text])
+        result = scorer.score([applicant.resume_text])
+        required_skills, found_skills, _ = scorer.skill_breakdown(result["resume_skills"], 0, 0)
 
-        required_skills = {"python", "sql", "machine learning"}  # Example skills
-        found_skills = [skill for skill in required_skills if skill in resume]
-        
-        match_percentage = len(found_skills) / len(required_skills) * 100
+        match_percentage = result["coverage"][0, 0] * 100
         return f"""
         📊 Match Analysis:
         - Required Skills: {', '.join(required_skills)}
         - Found Skills: {', '.join(found_skills) or 'None'}
         - Match Percentage: {match_percentage:.1f}%
+        - Keyword Relevance (BM25): {result["bm25"][0, 0] * 100:.1f}%
         """
 
 # -------------------------
@@ -76,7 +95,7 @@ class AnalyzeResumeTool(BaseTool):
 # -------------------------
 class ScreeningAgent:
     def __init__(self):  # Fixed constructor
-        self.llm = load_mistral_7b()
+        self.llm = load_mistral_7b("screening")
         self.agent = self._create_agent()
 
     def _create_agent(self):
@@ -114,21 +133,36 @@ class ScreeningAgent:
             agent=self.agent
         )
 
+    def run(self, context: ApplicationContext = None):
+        crew = Crew(
+            agents=[self.agent],
+            tasks=[self.create_screening_task()],
+            verbose=2,
+            memory=True
+        )
+        with application_scope(context):
+            return crew.kickoff()
+
 # -------------------------
 # 🚀 Main Runner
 # -------------------------
-def run_screening_agent():
-    screening = ScreeningAgent()
-    task = screening.create_screening_task()
-    
-    crew = Crew(
-        agents=[screening.agent],
-        tasks=[task],
-        verbose=2,
-        memory=True
-    )
-
-    return crew.kickoff()
+def run_screening_agent(screening: ScreeningAgent = None, context: ApplicationContext = None):
+    # Without a context the tools fall back to the newest application
+    screening = screening or ScreeningAgent()
+    return screening.run(context)
+
+def screen_applicant(applicant_data: dict, resume_text: str, config: PreScreenConfig = None,
+                     app_id: str = None, position_entry: dict = None, job_document: str = "") -> BatchScreeningResult:
+    """Screen one applicant: stored result, else rule-based pre-screen, else one schema-constrained LLM call.
+
+    The crew above stays available for interactive runs; the application
+    pipeline needs a decision it can branch on, not a free-text report.
+    """
+    if position_entry is None:
+        position_entry, job_document = get_position_entry(applicant_data.get("position"))
+    results, _ = screen_batch(position_entry, job_document, [(app_id or "", applicant_data, resume_text)],
+                              workers=1, config=config, context_fn=resume_context if app_id else None)
+    return results[0]
 
 if __name__ == "__main__":
     result = run_screening_agent()
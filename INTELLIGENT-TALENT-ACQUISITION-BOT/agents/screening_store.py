@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from llm_utils.ollama_client import OLLAMA_MODEL
+
+SCREENING_STORE_PATH = os.getenv("SCREENING_STORE_PATH", "data/screening_results.sqlite3")
+MEMORY_RESULTS = int(os.getenv("SCREENING_STORE_MEMORY", "10000"))
+
+
+# -------------------------
+# 🗄️ Screening results store
+# -------------------------
+class ScreeningStore:
+    """Screening outcomes keyed by hash(resume text, job text, min/applicant yoe, prompt version, model).
+
+    A record holds the decision, score, coverage and report. Changing the prompt
+    version, the pre-screen thresholds or the model changes every key, so stale
+    results are never returned. Lookups hit an in-memory LRU first, then the
+    SQLite primary key.
+    """
+
+    def __init__(self, path: str = SCREENING_STORE_PATH, model: str = OLLAMA_MODEL,
+                 memory_results: int = MEMORY_RESULTS):
+        self.model = model
+        self.memory_results = memory_results
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS screening_results "
+            "(key TEXT PRIMARY KEY, version TEXT NOT NULL, result TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def version(self, prompt_version: str, config=None) -> str:
+        thresholds = config.model_dump_json() if config is not None else ""
+        return hashlib.sha256(f"{prompt_version}\0{self.model}\0{thresholds}".encode("utf-8")).hexdigest()[:16]
+
+    def key(self, resume_text: str, job_text: str, version: str, min_yoe=None, yoe=None) -> str:
+        # The pre-screen rejects on experience before reading the resume, so both numbers are decision inputs
+        experience = "\0".join("" if value in (None, "") else f"{float(value):g}" for value in (min_yoe, yoe))
+        return hashlib.sha256(f"{version}\0{job_text}\0{resume_text}\0{experience}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return dict(self._memory[key])
+            row = self._conn.execute("SELECT result FROM screening_results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            result = json.loads(row[0])
+            self._remember(key, result)
+            return dict(result)
+
+    def put(self, key: str, version: str, result: dict):
+        """`result` has decision, score, coverage, missing_skills and report."""
+        with self._lock:
+            self._remember(key, result)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO screening_results (key, version, result, created_at) VALUES (?, ?, ?, ?)",
+                (key, version, json.dumps(result), time.time()),
+            )
+            self._conn.commit()
+
+    def _remember(self, key: str, result: dict):
+        self._memory[key] = dict(result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_results:
+            self._memory.popitem(last=False)
+
+    def prune(self, keep_versions: list) -> int:
+        """Drop rows written under any other prompt/model/threshold version. Returns rows removed."""
+        with self._lock:
+            marks = ",".join("?" * len(keep_versions)) or "''"
+            cur = self._conn.execute(f"DELETE FROM screening_results WHERE version NOT IN ({marks})", keep_versions)
+            self._conn.commit()
+            self._memory.clear()
+        return cur.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "cached_results": len(self._memory),
+            }
+
+
+screening_store = ScreeningStore()
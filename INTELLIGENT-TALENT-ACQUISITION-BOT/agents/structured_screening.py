@@ -0,0 +1,63 @@
+import os
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field, ValidationError
+from llm_utils.local_llm_runner import get_prompt_template
+from llm_utils.llm_registry import get_client, get_mode_config
+
+# "schema" constrains decoding to ScreeningVerdict (Ollama >= 0.5); "json" is plain JSON mode for older servers
+SCREENING_OUTPUT_FORMAT = os.getenv("SCREENING_OUTPUT_FORMAT", "schema")
+SCREENING_MAX_TOKENS = int(os.getenv("SCREENING_MAX_TOKENS", "256"))
+SCREENING_STOP = ["\n\n\n", "```"]  # JSON mode can trail whitespace until num_predict; cut it short
+RESUME_CONTEXT_CHARS = 3000
+MAX_QUESTIONS = 3
+
+
+# -------------------------
+# 📦 Screening verdict schema
+# -------------------------
+class ScreeningVerdict(BaseModel):
+    score: int = Field(ge=0, le=100, description="Overall fit for the job, 0-100")
+    decision: Literal["Eligible", "Not eligible"]
+    missing_skills: List[str] = Field(default_factory=list, description="Required skills the resume lacks")
+    interview_questions: List[str] = Field(default_factory=list, description="Up to 3 interview questions")
+    summary: str = Field(default="", description="One sentence justifying the decision")
+
+
+def build_screening_prompt(job_text: str, resume_context: str, pre) -> str:
+    return get_prompt_template("screening").format(user_input=(
+        f"Job description:\n{job_text}\n\n"
+        f"Candidate resume (most relevant sections):\n{resume_context[:RESUME_CONTEXT_CHARS]}\n\n"
+        f"Keyword pre-screen: skill coverage {pre.coverage * 100:.0f}%, "
+        f"missing {', '.join(pre.missing_skills) or 'none'}.\n\n"
+        "Respond with JSON only: "
+        '{"score": 0-100, "decision": "Eligible" or "Not eligible", "missing_skills": [...], '
+        f'"interview_questions": [at most {MAX_QUESTIONS}], "summary": "one sentence"}}'
+    ))
+
+
+def parse_verdict(text: str) -> Optional[ScreeningVerdict]:
+    try:
+        verdict = ScreeningVerdict.model_validate_json(text)
+    except ValidationError:
+        return None
+    verdict.interview_questions = verdict.interview_questions[:MAX_QUESTIONS]
+    return verdict
+
+
+def request_verdict(prompt: str, client=None) -> dict:
+    """One constrained completion. Returns Ollama's body; its "response" is the JSON verdict."""
+    output_format = ScreeningVerdict.model_json_schema() if SCREENING_OUTPUT_FORMAT == "schema" else "json"
+    options = {**get_mode_config("screening"), "temperature": 0.0,
+               "num_predict": SCREENING_MAX_TOKENS, "stop": SCREENING_STOP}
+    return (client or get_client()).generate(prompt, options=options, format=output_format)
+
+
+def format_verdict_report(verdict: ScreeningVerdict) -> str:
+    questions = "".join(f"\n   - {q}" for q in verdict.interview_questions) or " None"
+    return (
+        "## Screening Report\n"
+        f"1. Match Score: {verdict.score}%\n"
+        f"2. Missing Requirements: {', '.join(verdict.missing_skills) or 'None'}\n"
+        f"3. Final Recommendation: {verdict.decision} — {verdict.summary}\n"
+        f"4. Suggested Interview Questions:{questions}\n"
+    )
@@ -1,18 +1,24 @@
 import streamlit as st
 from chroma_db import db_handler
-from email_utils.send_email import send_email_to_hr, send_email_to_applicant
 from streamlit_chat import message
-from utils.chat_handler import process_user_input,chatbot_interface
+from utils.chat_handler import process_user_input,chatbot_interface,stream_user_input
 from utils.pdf_parser import extract_text_from_pdf
+from utils.pdf_cache import extraction_cache
 from utils.helper import save_uploaded_file
-from chroma_db.db_handler import get_all_open_positions
-from agents.screening_agent import ScreeningAgent
-from agents.engagement_agent import EngagementAgent
-from agents.scheduling_agent import SchedulingAgent
+from utils.app_cache import get_open_positions, get_available_positions
+from utils.app_cache import get_job_queue, get_upload_ingestion_queue
+from utils.timing import RerunTimer
+from utils.upload_pipeline import submit_application
+from agents.prescreen import prescreen_stats
+from agents.screening_store import screening_store
+from utils.interview_scheduler import TIMEZONES, INTERVIEW_TIMEZONE
 import os
 import base64
 
 st.set_page_config(page_title="Intelligent Talent Acquisition Assistant", layout="centered")
+timer = RerunTimer()
+# Picks up HR changes made from another process (seed_data, bulk_ingest, the lifecycle CLI)
+db_handler.check_hr_store()
 st.title("🤖 Intelligent Talent Acquisition Assistant")
 
 st.markdown("---")
@@ -32,19 +38,36 @@ with tabs[0]:
 
     user_input = st.chat_input("Say something...")
     if user_input:
-        response = chatbot_interface(user_input)
+        # Render tokens as they arrive instead of blocking on the full generation
+        message(user_input, is_user=True, key="streaming_user")
+        stream_metrics = {}
+        placeholder = st.empty()
+        response = ""
+        for token in stream_user_input(user_input, stream_metrics):
+            response += token
+            placeholder.markdown(response + "▌")
+        placeholder.empty()
         st.session_state.past.append(user_input)
-        st.session_state.generated.append(response)
+        st.session_state.generated.append(response.strip())
+        if stream_metrics.get("cached"):
+            st.caption(f"⚡ Answered from cache in {stream_metrics['total_seconds'] * 1000:.1f} ms")
+        else:
+            st.caption(
+                f"⏱️ {stream_metrics['prompt_tokens']} prompt tokens · "
+                f"first token in {stream_metrics['time_to_first_token']:.2f}s · "
+                f"{stream_metrics['tokens_per_second']:.1f} tokens/s"
+            )
 
     if st.session_state.generated:
         for i in range(len(st.session_state.generated) - 1, -1, -1):
             message(st.session_state.generated[i], key=str(i))
             message(st.session_state.past[i], is_user=True, key=f"{i}_user")
+    timer.lap("Chat tab")
 
 # Open Positions Tab
 with tabs[1]:
     st.subheader("📌 Available Open Positions")
-    open_positions = get_all_open_positions()
+    open_positions = get_open_positions()
 
     if open_positions and open_positions['documents']:
         for meta, doc in zip(open_positions['metadatas'], open_positions['documents']):
@@ -57,6 +80,7 @@ with tabs[1]:
             st.markdown("---")
     else:
         st.warning("No open positions found.")
+    timer.lap("Open positions tab")
 
 # Resume Upload Tab
 with tabs[2]:
@@ -67,6 +91,12 @@ with tabs[2]:
         resume_path = save_uploaded_file(resume_file)
         resume_text = extract_text_from_pdf(resume_path)
         st.success("✅ Resume uploaded successfully!")
+        cache_stats = extraction_cache.stats()
+        st.caption(
+            f"🗃️ Parse cache hit rate {cache_stats['hit_rate']:.0%}, "
+            f"{cache_stats['bytes_saved'] / 1024:.0f} KB of PDF not re-parsed"
+        )
+    timer.lap("Upload tab")
 
 # Global variables to hold state
 if 'user_type' not in st.session_state:
@@ -75,6 +105,12 @@ if 'hr_details' not in st.session_state:
     st.session_state.hr_details = {}
 if 'applicant_details' not in st.session_state:
     st.session_state.applicant_details = {}
+if 'applicant_id' not in st.session_state:
+    st.session_state.applicant_id = None
+if 'pipeline_job_id' not in st.session_state:
+    st.session_state.pipeline_job_id = None
+if 'upload_job_id' not in st.session_state:
+    st.session_state.upload_job_id = None
 
 # Step 1: Identify User Type
 st.subheader("Step 1: Who are you?")
@@ -92,6 +128,9 @@ if user_type == "HR":
         email = st.text_input("Your Email")
         company = st.text_input("Company Name")
         position = st.text_input("Open Position")
+        min_yoe = st.number_input("Minimum Years of Experience", min_value=0)
+        hr_timezone = st.selectbox("Your Time Zone", TIMEZONES, index=TIMEZONES.index(INTERVIEW_TIMEZONE))
+        job_description = st.text_area("Job Description (required skills, experience)")
         submitted = st.form_submit_button("Submit HR Details")
 
         if submitted:
@@ -100,7 +139,10 @@ if user_type == "HR":
                 "recruiter_id": recruiter_id,
                 "email": email,
                 "company": company,
-                "position": position
+                "position": position,
+                "min_yoe": min_yoe,
+                "timezone": hr_timezone,
+                "job_description": job_description
             }
             db_handler.save_hr_to_db(hr_data)
             st.session_state.hr_details = hr_data
@@ -109,8 +151,7 @@ if user_type == "HR":
 # Step 3: Applicant Form
 elif user_type == "Applicant":
     st.subheader("Step 2: Applicant Details")
-    open_positions = db_handler.get_all_open_positions()
-    available_positions = [item['position'] for item in open_positions['metadatas']]
+    available_positions = get_available_positions()
 
     with st.form("applicant_form"):
         name = st.text_input("Your Name")
@@ -120,14 +161,12 @@ elif user_type == "Applicant":
         selected_position = st.selectbox("Select a Position to Apply", available_positions)
         free_date = st.date_input("Select Your Free Date")
         free_time = st.time_input("Select Your Free Time", value=None)
+        applicant_timezone = st.selectbox("Your Time Zone", TIMEZONES, index=TIMEZONES.index(INTERVIEW_TIMEZONE))
         resume_file = st.file_uploader("Upload Resume (.pdf)", type=["pdf"])
         submit_app = st.form_submit_button("Submit Application")
 
         if submit_app:
             if resume_file is not None:
-                resume_path = save_uploaded_file(resume_file)
-                resume_text = extract_text_from_pdf(resume_path)
-
                 app_data = {
                     "name": name,
                     "email": email,
@@ -135,47 +174,122 @@ elif user_type == "Applicant":
                     "yoe": yoe,
                     "position": selected_position,
                     "free_date": free_date.strftime("%Y-%m-%d"),
-                    "free_time": free_time.strftime("%H:%M:%S")
+                    "free_time": free_time.strftime("%H:%M:%S") if free_time else "",
+                    "timezone": applicant_timezone
                 }
-                db_handler.save_applicant_to_db(app_data, resume_text)
+                # Only the file write happens here; extraction, embedding and the DB write run on the upload workers
+                st.session_state.upload_job_id = submit_application(
+                    app_data, resume_file.name, resume_file.getvalue(), queue=get_upload_ingestion_queue())
+                st.session_state.applicant_id = None
+                st.session_state.pipeline_job_id = None
                 st.session_state.applicant_details = app_data
-                st.success("✅ Application submitted successfully!")
+                st.success("✅ Application submitted successfully! We're processing your resume.")
             else:
                 st.warning("⚠️ Please upload your resume before submitting.")
+timer.lap("Forms")
 
-# Step 4: Screening + Engagement + Scheduling
-if st.session_state.user_type == "Applicant" and st.session_state.applicant_details:
-    st.subheader("Step 3: Screening in Progress")
+# Step 3: Resume ingestion, then Step 4: Screening + Engagement + Scheduling (both on background job queues)
+STAGE_LABELS = {"screening": "Screening", "engagement": "Engagement email", "scheduling": "Interview scheduling"}
+STAGE_ICONS = {"pending": "⏳", "running": "🔄", "done": "✅", "skipped": "⏭️", "failed": "❌"}
+PIPELINE_POLL_SECONDS = 2
 
-    screening_agent = ScreeningAgent()
-    screening_result = screening_agent.run()
-    st.success(f"📄 Screening Result: {screening_result}")
 
-    if "Eligible" in screening_result:
-        st.subheader("Step 4: Sending Engagement & Scheduling Emails")
+def render_pipeline_status(job_id: int):
+    job = get_job_queue().status(job_id)
+    if job is None:
+        st.warning("⚠️ No pipeline job found for this application.")
+        return None
+    for name, label in STAGE_LABELS.items():
+        stage = job["stages"].get(name, {"status": "pending"})
+        line = f"{STAGE_ICONS.get(stage['status'], '')} **{label}** — {stage['status']}"
+        if stage.get("finished_at") and stage.get("started_at"):
+            line += f" ({stage['finished_at'] - stage['started_at']:.1f}s)"
+        st.markdown(line)
 
-        engagement_agent = EngagementAgent()
-        engagement_result = engagement_agent.run()
-        st.info(f"🗣️ Engagement: {engagement_result}")
+    screening = job["stages"]["screening"].get("result")
+    if screening:
+        show = st.success if screening["eligible"] else st.warning
+        show(f"📄 Screening Result: {screening['decision'] or 'Needs review'} "
+             f"(score {screening['score']:.0%})\n\n{screening['report']}")
+    engagement = job["stages"]["engagement"].get("result")
+    if engagement:
+        st.info(f"🗣️ Engagement: {engagement}")
+    scheduling = job["stages"]["scheduling"].get("result")
+    if scheduling:
+        st.success(f"📬 {scheduling}")
+    if job["status"] == "failed":
+        st.error(f"❌ Pipeline failed after {job['attempts']} attempts: {job['last_error']}")
+    elif job["status"] == "queued" and job["attempts"]:
+        st.warning(f"⚠️ Retrying ({job['attempts']} failed attempts so far): {job['last_error']}")
+    return job["status"]
 
-        scheduling_agent = SchedulingAgent()
-        interview_info = scheduling_agent.run()
 
-        hr_email_sent = send_email_to_hr(
-            hr_email=st.session_state.hr_details['email'],
-            applicant_data=st.session_state.applicant_details,
-            interview_info=interview_info
-        )
+@st.fragment(run_every=PIPELINE_POLL_SECONDS)
+def pipeline_status_panel(job_id: int):
+    # Only this fragment reruns while polling; the rest of the page is left alone
+    status = render_pipeline_status(job_id)
+    if status in ("done", "failed"):
+        st.rerun(scope="app")
 
-        if hr_email_sent:
-            applicant_email_sent = send_email_to_applicant(
-                applicant_email=st.session_state.applicant_details['email'],
-                hr_data=st.session_state.hr_details,
-                interview_info=interview_info
-            )
-            if applicant_email_sent:
-                st.success("📬 Emails sent successfully to HR and Applicant!")
-            else:
-                st.warning("⚠️ Failed to send email to applicant.")
-        else:
-            st.warning("⚠️ Failed to send email to HR. Please check HR email configuration.")
\ No newline at end of file
+
+UPLOAD_STAGE_LABELS = {"extract": "Resume text extraction", "save": "Embedding & saving", "handoff": "Queued for screening"}
+
+
+def render_upload_status(job_id: int):
+    job = get_upload_ingestion_queue().status(job_id)
+    if job is None:
+        st.warning("⚠️ No ingestion job found for this application.")
+        return None
+    for name, label in UPLOAD_STAGE_LABELS.items():
+        stage = job["stages"].get(name, {"status": "pending"})
+        line = f"{STAGE_ICONS.get(stage['status'], '')} **{label}** — {stage['status']}"
+        if stage.get("finished_at") and stage.get("started_at"):
+            line += f" ({stage['finished_at'] - stage['started_at']:.1f}s)"
+        st.markdown(line)
+    if job["status"] == "done":
+        # Hand the application over to the screening pipeline panel below
+        st.session_state.applicant_id = job["stages"]["save"]["result"]
+        st.session_state.pipeline_job_id = job["stages"]["handoff"]["result"]
+    elif job["status"] == "failed":
+        st.error(f"❌ Could not process your resume after {job['attempts']} attempts: {job['last_error']}")
+    elif job["status"] == "queued" and job["attempts"]:
+        st.warning(f"⚠️ Retrying ({job['attempts']} failed attempts so far): {job['last_error']}")
+    return job["status"]
+
+
+@st.fragment(run_every=PIPELINE_POLL_SECONDS)
+def upload_status_panel(job_id: int):
+    status = render_upload_status(job_id)
+    if status in ("done", "failed"):
+        st.rerun(scope="app")
+
+
+if st.session_state.user_type == "Applicant" and st.session_state.upload_job_id:
+    st.subheader("Step 3: Processing Your Resume")
+    job = get_upload_ingestion_queue().status(st.session_state.upload_job_id)
+    if job and job["status"] in ("done", "failed"):
+        render_upload_status(st.session_state.upload_job_id)
+    else:
+        upload_status_panel(st.session_state.upload_job_id)
+
+if st.session_state.user_type == "Applicant" and st.session_state.pipeline_job_id:
+    st.subheader("Step 4: Screening, Engagement & Scheduling")
+    job = get_job_queue().status(st.session_state.pipeline_job_id)
+    if job and job["status"] in ("done", "failed"):
+        render_pipeline_status(st.session_state.pipeline_job_id)
+    else:
+        pipeline_status_panel(st.session_state.pipeline_job_id)
+
+    stats = prescreen_stats.summary()
+    st.caption(
+        f"⚡ Pre-screen fast path: {stats['fast_path_fraction']:.0%} of {stats['total']} candidates, "
+        f"~{stats['estimated_seconds_saved']:.0f}s of LLM time saved"
+    )
+    store_stats = screening_store.stats()
+    st.caption(
+        f"🗄️ Screening results store: {store_stats['hit_rate']:.0%} hit rate "
+        f"({store_stats['hits']} of {store_stats['hits'] + store_stats['misses']} screenings reused)"
+    )
+timer.lap("Pipeline status")
+
+timer.render()
@@ -0,0 +1,122 @@
+"""Database round trips per pipeline run: per-tool "latest entry" fetches vs one ApplicationContext per run.
+
+Replays the lookups the screening stage and the engagement / scheduling tools
+made before the context existed, and the ones they make now, against a
+throwaway Chroma store. Every collection get/query and entry-index lookup is
+counted. While each legacy run is in flight another application is submitted,
+as happens with several recruiters or applicants using the app at once; the
+"wrong applicant" column counts runs whose tools ended up reading it.
+
+Run from the project root:  python -m benchmarks.bench_application_context
+"""
+import random
+import time
+from benchmarks.scratch_store import scratch_store
+
+APPLICANTS = 2_000
+POSITIONS = 50
+RUNS = 200
+RESUME = "Experienced engineer skilled in Python, SQL and machine learning. " * 40
+
+
+class Counted:
+    """Forwards to `target`, counting calls to the listed methods."""
+
+    def __init__(self, target, methods, counter):
+        self._target, self._methods, self._counter = target, set(methods), counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name not in self._methods:
+            return attr
+
+        def call(*args, **kwargs):
+            self._counter["calls"] += 1
+            return attr(*args, **kwargs)
+        return call
+
+
+def seed(collection, index, start, n):
+    for i in range(start, start + n):
+        app_id = f"app_{i:06d}"
+        meta = {"name": f"Applicant {i}", "email": f"applicant{i}@example.com", "yoe": i % 12,
+                "position": f"Position {i % POSITIONS}"}
+        # Dummy vectors keep the benchmark about lookups, not embedding
+        collection.add(ids=[app_id], documents=[RESUME], metadatas=[meta],
+                       embeddings=[[random.random() for _ in range(8)]])
+        index.record(collection.name, app_id, meta)
+
+
+def legacy_run(db, app_id, submit_other):
+    # screening stage
+    applicant = db.get_applicant_entry(app_id)
+    db.get_applicant_document(app_id)
+    db.get_position_entry(applicant.get("position"))
+    submit_other()
+    # engagement: GenerateEngagementMessage
+    seen = [db.get_latest_applicant_entry()]
+    # scheduling: FetchInterviewData, then ScheduleInterviewAndNotify
+    for _ in range(2):
+        db.get_latest_hr_entry()
+        seen.append(db.get_latest_applicant_entry())
+    return any(entry.get("email") != applicant.get("email") for entry in seen)
+
+
+def context_run(app_id, submit_other):
+    from agents.application_context import ApplicationContext, application_scope, current_application
+
+    context = ApplicationContext.load(app_id)
+    submit_other()
+    with application_scope(context):
+        # the same four tool calls, each reading the run's context
+        seen = [current_application().applicant for _ in range(3)]
+        current_application().hr
+    return any(entry.get("email") != context.applicant.get("email") for entry in seen)
+
+
+if __name__ == "__main__":
+    with scratch_store():
+        from chroma_db import db_handler as db
+
+        for p in range(POSITIONS):
+            meta = {"position": f"Position {p}", "email": f"hr{p}@example.com", "company": "Acme",
+                    "job_description": "Needs Python and SQL."}
+            db.hr_collection.add(ids=[f"hr_{p}"], documents=[meta["job_description"]], metadatas=[meta],
+                                 embeddings=[[random.random() for _ in range(8)]])
+            db.entry_index.record(db.hr_collection.name, f"hr_{p}", meta)
+        applicants, index = db.applicant_collection, db.entry_index
+        seed(applicants, index, 0, APPLICANTS)
+
+        counter = {"calls": 0}
+        db.hr_collection = Counted(db.hr_collection, ["get", "query"], counter)
+        db.applicant_collection = Counted(db.applicant_collection, ["get", "query"], counter)
+        db.entry_index = Counted(db.entry_index, ["latest", "latest_id", "by_id", "by_email"], counter)
+
+        next_id = [APPLICANTS]
+        submit_seconds = [0.0]
+
+        def submit_other():
+            # Neither counted nor timed: this is the other user's write, not the run's own lookups
+            start = time.perf_counter()
+            seed(applicants, index, next_id[0], 1)
+            next_id[0] += 1
+            submit_seconds[0] += time.perf_counter() - start
+
+        for label, run in (("per-tool fetches", lambda a: legacy_run(db, a, submit_other)),
+                           ("application context", lambda a: context_run(a, submit_other))):
+            counter["calls"] = 0
+            submit_seconds[0] = 0.0
+            wrong = 0
+            start = time.perf_counter()
+            for _ in range(RUNS):
+                wrong += run(f"app_{random.randrange(APPLICANTS):06d}")
+            elapsed = time.perf_counter() - start - submit_seconds[0]
+            print(f"{label:<20} {counter['calls'] / RUNS:4.1f} round trips/run  "
+                  f"{elapsed / RUNS * 1000:6.2f} ms/run in lookups  "
+                  f"wrong applicant in {wrong}/{RUNS} runs")
+
+        # Outside a scope each call sees the newest application; nothing sticks to the thread
+        from agents.application_context import current_application
+        before = current_application().app_id
+        submit_other()
+        assert current_application().app_id != before, "current_application() kept a stale context"
@@ -0,0 +1,69 @@
+"""Batch screening of a backlog for one position: one-at-a-time vs the bounded pool, against the stub Ollama server.
+
+Reports p50/p95 latency per candidate and total wall-clock time. The stub takes
+LLM_SECONDS per request and serves requests concurrently, like Ollama with
+OLLAMA_NUM_PARALLEL set. A second pass over the same backlog shows the
+screening results store answering unchanged (resume, job) pairs.
+
+Run from the project root:  python -m benchmarks.bench_batch_screening
+"""
+import json
+import os
+import random
+import tempfile
+from agents.batch_screening import screen_batch
+from agents.screening_store import ScreeningStore
+from benchmarks.stub_ollama import start_stub_server
+from llm_utils.ollama_client import OllamaClient
+from utils.resume_scoring import KNOWN_SKILLS
+
+CANDIDATES = 200
+LLM_SECONDS = 0.2
+SETTINGS = [(1, 1), (8, 2), (8, 4), (16, 8)]  # (workers, llm_concurrency)
+SKILLS = sorted(KNOWN_SKILLS)
+JOB_SKILLS = ["python", "sql", "machine learning", "docker", "aws", "pandas"]
+FILLER = "Led a team delivering projects on time, collaborated with stakeholders and wrote documentation.".split()
+
+random.seed(11)
+
+
+def synthetic_applicant(i):
+    # A spread of matches so some candidates are settled by rules and the rest go to the LLM
+    skills = random.sample(JOB_SKILLS, random.randint(0, len(JOB_SKILLS))) + random.sample(SKILLS, 3)
+    words = skills + random.choices(FILLER, k=200)
+    random.shuffle(words)
+    meta = {"name": f"Candidate {i}", "position": "Data Scientist", "yoe": random.randint(1, 8)}
+    return f"app_{i}", meta, " ".join(words)
+
+
+def reply(body):
+    return json.dumps({"score": random.randint(30, 90), "decision": random.choice(["Eligible", "Not eligible"]),
+                       "missing_skills": [], "interview_questions": ["Walk us through a recent project."],
+                       "summary": "Relevant experience with most required skills."})
+
+
+if __name__ == "__main__":
+    position = {"position": "Data Scientist", "min_yoe": 2,
+                "job_description": f"Needs {', '.join(JOB_SKILLS)}."}
+    applicants = [synthetic_applicant(i) for i in range(CANDIDATES)]
+    server, url = start_stub_server(reply_fn=reply, first_token_delay=LLM_SECONDS)
+    client = OllamaClient(base_url=url, pool_size=max(w for w, _ in SETTINGS))
+    try:
+        for workers, llm_concurrency in SETTINGS:
+            results, summary = screen_batch(position, "", applicants, workers=workers,
+                                            llm_concurrency=llm_concurrency, client=client, store=None)
+            print(f"workers={workers:<2} llm_concurrency={llm_concurrency}: {summary['candidates']} candidates "
+                  f"({summary['fast_path']} by rules, {summary['llm_calls']} LLM calls) "
+                  f"wall {summary['wall_seconds']:6.2f}s | p50 {summary['p50_seconds']:.3f}s "
+                  f"p95 {summary['p95_seconds']:.3f}s")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ScreeningStore(path=os.path.join(tmp, "screening_results.sqlite3"))
+            for run in ("first pass", "second pass"):
+                _, summary = screen_batch(position, "", applicants, workers=8, llm_concurrency=4,
+                                          client=client, store=store)
+                print(f"results store, {run}: {summary['cached']} answered from the store, {summary['llm_calls']} LLM calls, "
+                      f"wall {summary['wall_seconds']:6.2f}s (cumulative hit rate {store.stats()['hit_rate']:.0%})")
+    finally:
+        client.close()
+        server.shutdown()
@@ -0,0 +1,61 @@
+"""Prompt tokens and latency per turn over a scripted 50-turn chat: unbounded history vs ConversationContext.
+
+Run from the project root:  python -m benchmarks.bench_chat_context
+"""
+import time
+from benchmarks.stub_ollama import start_stub_server
+from llm_utils.ollama_client import OllamaClient
+from utils.chat_context import ConversationContext, estimate_tokens, format_turn
+
+TURNS = 50
+QUESTIONS = [
+    "Which positions are open right now?",
+    "What skills does the backend developer role need?",
+    "How long does the screening take?",
+    "Can I apply for two positions at once?",
+    "When will I hear back after the interview?",
+]
+ANSWER = ("We currently have openings for software engineers, AI research interns and backend developers. "
+          "Each role lists its required skills, and our assistant screens every application within minutes. ") * 2
+
+
+def reply(body):
+    if body.get("prompt", "").startswith("Update the running summary"):
+        return "Candidate asked about open positions, required skills, timelines and multiple applications."
+    return ANSWER
+
+
+def run(label, build_prompt, client):
+    history, sizes, latencies = [], [], []
+    for turn in range(TURNS):
+        question = QUESTIONS[turn % len(QUESTIONS)]
+        start = time.perf_counter()  # includes any summary folding
+        prompt = build_prompt(history, question)
+        response = client.generate(prompt)["response"]
+        latencies.append(time.perf_counter() - start)
+        sizes.append(estimate_tokens(prompt))
+        history.append({"user": question, "bot": response})
+    print(f"{label:>10}: prompt tokens turn 10/25/50 = {sizes[9]}/{sizes[24]}/{sizes[49]}, "
+          f"total {sum(sizes)}, mean latency {sum(latencies) / TURNS * 1000:.1f} ms, "
+          f"last-turn latency {latencies[-1] * 1000:.1f} ms")
+
+
+def unbounded(history, question):
+    context = "\n".join(format_turn(turn) for turn in history)
+    return f"{context}\nUser: {question}\nBot:"
+
+
+if __name__ == "__main__":
+    # 0.2 ms per prompt token approximates CPU prefill for a 7B model, scaled down
+    server, url = start_stub_server(reply_fn=reply, prompt_token_delay=0.0002)
+    client = OllamaClient(base_url=url)
+
+    run("unbounded", unbounded, client)
+
+    def summarizer(summary, turns):
+        return client.generate("Update the running summary\n" + summary)["response"]
+
+    context = ConversationContext({}, budget=800, summarizer=summarizer)
+    run("bounded", context.build_prompt, client)
+    print(f"   summary: {context.state['folded_turns']} turns folded")
+    server.shutdown()
@@ -0,0 +1,74 @@
+"""ReAct agent wrapper vs direct templated completion in run_local_llm, per mode, against the stub Ollama server.
+
+Reports prompt tokens, Ollama calls and latency per request. One reply in
+REPLY_PLAIN_EVERY is plain text without the ReAct "Final Answer:" marker, as
+small models often produce; the agent fails to parse it, the direct path
+does not care. Recent LangChain refuses to build a ReAct agent with no tools
+(which is what the old run_local_llm did, so it only ever returned an error);
+the agent here gets one no-op tool so the scaffold itself can be measured.
+
+Run from the project root:  python -m benchmarks.bench_direct_completion
+"""
+import time
+from langchain.agents import initialize_agent, AgentType, Tool
+from langchain.llms import Ollama
+from benchmarks.stub_ollama import start_stub_server
+from llm_utils.local_llm_runner import complete, get_prompt_template
+from llm_utils.ollama_client import OllamaClient
+
+REQUESTS = 30
+REPLY_PLAIN_EVERY = 5
+PROMPT_TOKEN_SECONDS = 0.0005  # simulated prefill cost per prompt token
+ANSWER = "Thanks for your interest in the role. Could you share two time slots that work for you this week?"
+PROMPTS = {
+    "chat": "User: What positions are open at the moment?\nBot:",
+    "engagement": "Candidate: Priya, applied for Data Scientist at Acme.",
+    "scheduling": "HR: hr@acme.com, candidate free on 2026-11-03 at 10:00, 45 minute interview.",
+}
+
+
+def make_reply():
+    count = {"n": 0}
+
+    def reply(body):
+        count["n"] += 1
+        if count["n"] % REPLY_PLAIN_EVERY == 0:
+            return ANSWER
+        return f"Thought: I can answer directly.\nFinal Answer: {ANSWER}"
+    return reply
+
+
+def run(server, call):
+    before = dict(server.stats)
+    errors = 0
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        try:
+            call()
+        except Exception:
+            errors += 1
+    elapsed = time.perf_counter() - start
+    calls = server.stats["requests"] - before["requests"]
+    prompt_tokens = (server.stats["prompt_chars"] - before["prompt_chars"]) / 4
+    return calls, prompt_tokens, elapsed, errors
+
+
+if __name__ == "__main__":
+    server, url = start_stub_server(reply_fn=make_reply(), prompt_token_delay=PROMPT_TOKEN_SECONDS)
+    client = OllamaClient(base_url=url)
+    try:
+        for mode, prompt in PROMPTS.items():
+            llm = Ollama(model="mistral", base_url=url, temperature=0.3)
+            noop = Tool(name="noop", func=lambda q: "", description="Does nothing.")
+            agent = initialize_agent([noop], llm, agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION, verbose=False)
+            final_prompt = get_prompt_template(mode).format(user_input=prompt)
+
+            for label, call in (("react agent", lambda: agent.run(final_prompt)),
+                                ("direct", lambda: complete(prompt, mode, client=client))):
+                calls, tokens, elapsed, errors = run(server, call)
+                print(f"{mode:<11} {label:<12} {calls / REQUESTS:4.1f} calls/request  "
+                      f"{tokens / max(calls, 1):6.0f} prompt tokens/call  "
+                      f"{elapsed / REQUESTS * 1000:7.1f} ms/request  {errors}/{REQUESTS} failed")
+    finally:
+        client.close()
+        server.shutdown()
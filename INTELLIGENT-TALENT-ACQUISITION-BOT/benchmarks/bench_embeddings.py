@@ -0,0 +1,55 @@
+"""Per-write latency and bulk seed throughput: Chroma's inline embedding vs the batched, memoised Embedder.
+
+Run from the project root:  python -m benchmarks.bench_embeddings
+"""
+import os
+import tempfile
+import time
+import chromadb
+from chroma_db.embeddings import Embedder
+
+SINGLE_WRITES = 50
+BULK_ROWS = 2_000
+
+
+def synthetic_docs(n, prefix="HR"):
+    return [f"{prefix} {i} from Company {i % 97} is hiring for Engineer {i % 13}. Python, SQL, cloud." for i in range(n)]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        client = chromadb.PersistentClient(path=os.path.join(tmp, "chroma"))
+        embedder = Embedder(cache_path=os.path.join(tmp, "embeddings.sqlite3"))
+        embedder.embed(["warm up the model"])
+
+        # Per-write latency (one document per add, as save_applicant_to_db does)
+        docs = synthetic_docs(SINGLE_WRITES, "Applicant")
+        inline = client.get_or_create_collection("inline_single")
+        cached = client.get_or_create_collection("cached_single")
+        t_inline = timed(lambda: [inline.add(ids=[str(i)], documents=[d]) for i, d in enumerate(docs)])
+        t_cold = timed(lambda: [cached.add(ids=[str(i)], documents=[d], embeddings=embedder.embed([d]))
+                                for i, d in enumerate(docs)])
+        t_warm = timed(lambda: [cached.upsert(ids=[str(i)], documents=[d], embeddings=embedder.embed([d]))
+                                for i, d in enumerate(docs)])
+        print(f"per-write latency: inline {t_inline / SINGLE_WRITES * 1000:.1f} ms | "
+              f"embedder cold {t_cold / SINGLE_WRITES * 1000:.1f} ms | "
+              f"embedder re-ingest {t_warm / SINGLE_WRITES * 1000:.1f} ms")
+
+        # Bulk seed throughput
+        docs = synthetic_docs(BULK_ROWS)
+        ids = [f"hr_{i}" for i in range(BULK_ROWS)]
+        row_by_row = client.get_or_create_collection("seed_row_by_row")
+        t_rows = timed(lambda: [row_by_row.add(ids=[i], documents=[d]) for i, d in zip(ids, docs)])
+        batched = client.get_or_create_collection("seed_batched")
+        t_batch = timed(lambda: batched.add(ids=ids, documents=docs, embeddings=embedder.embed(docs)))
+        reseed = client.get_or_create_collection("seed_reseed")
+        t_reseed = timed(lambda: reseed.add(ids=ids, documents=docs, embeddings=embedder.embed(docs)))
+        print(f"bulk seed ({BULK_ROWS} rows): row-by-row {BULK_ROWS / t_rows:.0f} rows/s | "
+              f"batched {BULK_ROWS / t_batch:.0f} rows/s | re-seed from cache {BULK_ROWS / t_reseed:.0f} rows/s")
+        print(f"embedder stats: {embedder.stats()}")
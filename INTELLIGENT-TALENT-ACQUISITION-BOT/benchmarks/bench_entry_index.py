@@ -0,0 +1,65 @@
+"""Full-collection `get()[-1]` vs the sidecar EntryIndex at 10k / 100k synthetic applicants.
+
+Run from the project root:  python -m benchmarks.bench_entry_index
+"""
+import os
+import random
+import tempfile
+import time
+import chromadb
+from chroma_db.entry_index import EntryIndex
+
+SIZES = [10_000, 100_000]
+BATCH = 5_000
+LOOKUPS = 200
+RESUME = "Experienced engineer skilled in Python, SQL and machine learning. " * 40
+
+
+def synthetic_applicants(n):
+    for i in range(n):
+        yield f"app_{i:08d}", {
+            "name": f"Applicant {i}",
+            "email": f"applicant{i}@example.com",
+            "institute": "Example Institute",
+            "yoe": i % 15,
+            "position": "Software Engineer",
+            "created_at": f"2025-01-01T00:00:{i % 60:02d}",
+        }
+
+
+def load(n, collection, index):
+    rows = list(synthetic_applicants(n))
+    for start in range(0, n, BATCH):
+        batch = rows[start:start + BATCH]
+        ids = [row[0] for row in batch]
+        metas = [row[1] for row in batch]
+        # Dummy vectors keep the benchmark about lookups, not embedding
+        collection.add(ids=ids, metadatas=metas, documents=[RESUME] * len(batch),
+                       embeddings=[[random.random() for _ in range(8)] for _ in batch])
+        for entry_id, meta in batch:
+            index.record(collection.name, entry_id, meta)
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in SIZES:
+            client = chromadb.PersistentClient(path=os.path.join(tmp, f"chroma_{n}"))
+            collection = client.get_or_create_collection("applicant_collection")
+            index = EntryIndex(os.path.join(tmp, f"index_{n}.sqlite3"))
+            load(n, collection, index)
+
+            legacy = timed(lambda: collection.get(include=["metadatas", "documents"])["metadatas"][-1], 3)
+            latest = timed(lambda: index.latest(collection.name), LOOKUPS)
+            by_id = timed(lambda: index.by_id(collection.name, f"app_{random.randrange(n):08d}"), LOOKUPS)
+            by_email = timed(lambda: index.by_email(collection.name, f"applicant{random.randrange(n)}@example.com"), LOOKUPS)
+
+            print(f"n={n:>7}: full scan {legacy:9.2f} ms | latest {latest:.3f} ms | "
+                  f"by id {by_id:.3f} ms | by email {by_email:.3f} ms")
+            index.close()
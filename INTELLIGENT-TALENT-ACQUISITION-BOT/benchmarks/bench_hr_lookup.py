@@ -0,0 +1,119 @@
+"""HR lookup by email: semantic hr_collection.query() vs the exact hash index with `where` fallback.
+
+HR documents are written the way save_hr_to_db writes them. The email is
+only in the metadata, so the legacy path must embed the address and hope
+the nearest document belongs to that recruiter. Reports per-lookup latency,
+wrong answers, a batch of BATCH emails, and the `where` fallback for an
+address the index has not seen. Embeddings come from a hashed bag-of-words
+stand-in so no model has to be downloaded; the legacy path still pays for
+embedding the address and an ANN search on every call.
+
+Run from the project root:  python -m benchmarks.bench_hr_lookup
+"""
+import os
+import random
+import tempfile
+import time
+import zlib
+import chromadb
+import numpy as np
+from chroma_db.hr_lookup import HRLookup
+from utils.resume_scoring import tokenize
+
+HRS = 10_000
+DIM = 384
+LOOKUPS = 200
+BATCH = 500
+COMPANIES = 400
+POSITIONS = ["Data Scientist", "Backend Developer", "Frontend Developer", "DevOps Engineer", "Data Analyst",
+             "Product Manager", "QA Engineer", "ML Engineer"]
+
+random.seed(4)
+
+
+def embed(texts):
+    vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for term in tokenize(text):
+            vectors[row, zlib.crc32(term.encode()) % DIM] += 1.0
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+
+def synthetic_hr(i):
+    company = f"Company {i % COMPANIES}"
+    meta = {"name": f"Recruiter {i}", "recruiter_id": f"HR{i:05d}", "email": f"recruiter{i}@company{i % COMPANIES}.com",
+            "company": company, "position": random.choice(POSITIONS), "seq": i}
+    return f"hr_{i}", meta, f"{meta['name']} from {company} is hiring for {meta['position']}."
+
+
+def percentiles(samples):
+    return np.percentile(samples, 50) * 1000, np.percentile(samples, 95) * 1000
+
+
+def timed(fn, args):
+    samples, results = [], []
+    for arg in args:
+        start = time.perf_counter()
+        results.append(fn(arg))
+        samples.append(time.perf_counter() - start)
+    return results, samples
+
+
+if __name__ == "__main__":
+    rows = [synthetic_hr(i) for i in range(HRS)]
+    with tempfile.TemporaryDirectory() as tmp:
+        collection = chromadb.PersistentClient(path=os.path.join(tmp, "chroma")).get_or_create_collection("hr_collection")
+        start = time.perf_counter()
+        for offset in range(0, HRS, 1000):
+            batch = rows[offset:offset + 1000]
+            collection.add(ids=[r[0] for r in batch], metadatas=[r[1] for r in batch], documents=[r[2] for r in batch],
+                           embeddings=embed([r[2] for r in batch]))
+        print(f"seeded {HRS} HR entries in {time.perf_counter() - start:.1f}s")
+
+        def fetch(where=None):
+            result = collection.get(where=where, include=["metadatas"]) if where else collection.get(include=["metadatas"])
+            return list(zip(result["ids"], result["metadatas"]))
+
+        emails = [rows[random.randrange(HRS)][1]["email"] for _ in range(LOOKUPS)]
+
+        def legacy(email):
+            result = collection.query(query_embeddings=embed([email]), n_results=1)
+            return result["metadatas"][0][0] if result["metadatas"] else None
+
+        results, samples = timed(legacy, emails)
+        wrong = sum((r or {}).get("email") != e for r, e in zip(results, emails))
+        p50, p95 = percentiles(samples)
+        print(f"semantic query:  p50 {p50:8.3f} ms  p95 {p95:8.3f} ms  wrong recruiter {wrong}/{LOOKUPS}")
+
+        lookup = HRLookup(fetch)
+        start = time.perf_counter()
+        lookup.find("email", emails[0])
+        print(f"hash index: loaded {HRS} entries in {(time.perf_counter() - start) * 1000:.0f} ms (once per process)")
+        results, samples = timed(lambda e: (lookup.find("email", e) or [None])[0], emails)
+        wrong = sum((r or {}).get("email") != e for r, e in zip(results, emails))
+        p50, p95 = percentiles(samples)
+        print(f"hash index:      p50 {p50:8.3f} ms  p95 {p95:8.3f} ms  wrong recruiter {wrong}/{LOOKUPS}")
+
+        batch = [rows[random.randrange(HRS)][1]["email"] for _ in range(BATCH)]
+        start = time.perf_counter()
+        for email in batch:
+            legacy(email)
+        legacy_batch = time.perf_counter() - start
+        start = time.perf_counter()
+        found = lookup.find_many("email", batch)
+        index_batch = time.perf_counter() - start
+        print(f"{BATCH} emails: semantic queries {legacy_batch * 1000:8.1f} ms | find_many {index_batch * 1000:6.2f} ms "
+              f"({sum(bool(v) for v in found.values())}/{len(found)} distinct emails found)")
+
+        # Written by another process (e.g. seed_data), so only the `where` fallback can see it
+        collection.add(ids=["hr_external"], documents=["Late Recruiter from Newco is hiring."],
+                       embeddings=embed(["Late Recruiter from Newco is hiring."]),
+                       metadatas=[{"name": "Late Recruiter", "email": "late@newco.com", "company": "Newco", "seq": HRS}])
+        start = time.perf_counter()
+        external = lookup.find("email", "Late@Newco.com ")
+        fallback_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        lookup.find("email", "nobody@nowhere.com")
+        lookup.find("email", "nobody@nowhere.com")
+        print(f"where fallback for an unseen row: {fallback_ms:.2f} ms ({len(external)} found); "
+              f"unknown email twice: {(time.perf_counter() - start) * 1000:.2f} ms, {lookup.fallbacks} fallbacks in total")
@@ -0,0 +1,92 @@
+"""Earliest mutually free interview slot with 10k existing bookings: linear scan vs the bisect index.
+
+Bookings are spread over RECRUITERS recruiters in several time zones, with
+half of each working day already taken. The linear scan is what a scheduler
+without an index does: step through candidate slots and test each one against
+every booking of both calendars. Also times batch assignment of a shortlist
+and checks that no calendar ends up double-booked.
+
+Run from the project root:  python -m benchmarks.bench_interview_scheduler
+"""
+import os
+import random
+import tempfile
+import time
+from utils.interview_scheduler import InterviewScheduler, WorkingHours
+
+BOOKINGS = 10_000
+RECRUITERS = 40
+LOOKUPS = 200
+SHORTLIST = 200
+ZONES = ["Asia/Kolkata", "Europe/London", "America/New_York", "Asia/Singapore"]
+
+random.seed(5)
+
+
+def linear_find(bookings, recruiter, applicant, hours, earliest, duration, step):
+    t = -(-earliest // step) * step
+    while True:
+        t = hours.next_open(t, duration)
+        if all(not (start < t + duration and t < end)
+               for calendar, start, end in bookings if calendar in (recruiter, applicant)):
+            return t
+        t = -(-(t + 1) // step) * step
+
+
+def seed(scheduler, now):
+    hours = {f"recruiter_{r}": WorkingHours(timezone=ZONES[r % len(ZONES)]) for r in range(RECRUITERS)}
+    for recruiter, working in hours.items():
+        scheduler.set_availability(recruiter, working)
+    requests = {recruiter: [] for recruiter in hours}
+    for i in range(BOOKINGS):
+        recruiter = f"recruiter_{i % RECRUITERS}"
+        # Applicants asked for random times over the next few weeks, so gaps are left between bookings
+        requests[recruiter].append((f"app_{i}", f"applicant{i}@example.com", now + random.uniform(0, 35) * 86400))
+    for recruiter, batch in requests.items():
+        scheduler.assign_batch(recruiter, batch)
+    return hours
+
+
+if __name__ == "__main__":
+    now = time.time()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "interviews.sqlite3")
+        scheduler = InterviewScheduler(path=path)
+        start = time.perf_counter()
+        hours = seed(scheduler, now)
+        print(f"seeded {scheduler.count()} bookings in {time.perf_counter() - start:.2f}s")
+
+        start = time.perf_counter()
+        scheduler = InterviewScheduler(path=path)
+        print(f"reload from SQLite: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        bookings = [(i.recruiter, i.start, i.end) for i in scheduler._interviews.values()]
+        bookings += [(i.applicant, i.start, i.end) for i in scheduler._interviews.values()]
+        queries = [(f"recruiter_{random.randrange(RECRUITERS)}", f"applicant{random.randrange(BOOKINGS)}@example.com",
+                    now + random.uniform(0, 30) * 86400) for _ in range(LOOKUPS)]
+
+        start = time.perf_counter()
+        linear = [linear_find(bookings, r, a, hours[r], t, scheduler.duration, scheduler.step) for r, a, t in queries]
+        linear_ms = (time.perf_counter() - start) / LOOKUPS * 1000
+        start = time.perf_counter()
+        indexed = [scheduler.find_slot(r, a, t) for r, a, t in queries]
+        indexed_ms = (time.perf_counter() - start) / LOOKUPS * 1000
+        agree = sum(x == y for x, y in zip(linear, indexed))
+        print(f"earliest free slot: linear scan {linear_ms:8.3f} ms | bisect index {indexed_ms:6.3f} ms "
+              f"({linear_ms / indexed_ms:.0f}x), same answer {agree}/{LOOKUPS}")
+
+        shortlist = [(f"short_{i}", f"short{i}@example.com", now + random.uniform(0, 5) * 86400)
+                     for i in range(SHORTLIST)]
+        start = time.perf_counter()
+        booked = scheduler.assign_batch("recruiter_0", shortlist)
+        elapsed = time.perf_counter() - start
+        placed = [i for i in booked.values() if i is not None]
+        print(f"batch-assigned {len(placed)}/{SHORTLIST} shortlisted applicants in {elapsed * 1000:.0f} ms")
+
+        clashes = 0
+        for calendar in {"recruiter_0", *(i.applicant for i in placed)}:
+            slots = sorted((i.start, i.end) for i in scheduler._interviews.values()
+                           if calendar in (i.recruiter, i.applicant))
+            clashes += sum(a[1] > b[0] for a, b in zip(slots, slots[1:]))
+        print(f"double bookings: {clashes}")
+        scheduler.close()
@@ -0,0 +1,101 @@
+"""Query latency and on-disk size of the hot store before and after archiving and compaction.
+
+Builds a synthetic three-year history (applicants spread evenly over the
+period, some positions closed) in a throwaway Chroma store. It measures a
+similarity query, a position filter and a full metadata scan (what
+get_all_applicants does). It also reports the size of the hot applicant
+HNSW files and of the whole store; archive collections live in the same
+store. Measured on the original store, after `archive_applicants` (one-year
+cutoff) and after `compact`; finally the rest is snapshotted to Parquet.
+
+Run from the project root:  python -m benchmarks.bench_lifecycle
+"""
+import os
+import random
+import time
+from datetime import datetime, timedelta
+import numpy as np
+from benchmarks.scratch_store import scratch_store
+
+APPLICANTS = 30_000
+YEARS = 3
+POSITIONS = 30
+CLOSED = 10
+DIM = 384
+BATCH = 2_000
+LOOKUPS = 50
+RESUME = "Experienced engineer skilled in Python, SQL and machine learning. " * 20
+
+rng = np.random.default_rng(3)
+random.seed(3)
+
+
+def seed(db):
+    now = datetime.now()
+    for p in range(POSITIONS):
+        meta = {"position": f"Position {p}", "email": f"hr{p}@example.com", "company": "Acme",
+                "created_at": (now - timedelta(days=random.uniform(0, 365 * YEARS))).isoformat()}
+        db.hr_collection.add(ids=[f"hr_{p}"], documents=[f"Hiring for Position {p}"], metadatas=[meta],
+                             embeddings=rng.random((1, DIM)).tolist())
+        db.entry_index.record(db.hr_collection.name, f"hr_{p}", meta)
+    for start in range(0, APPLICANTS, BATCH):
+        ids = [f"app_{i:06d}" for i in range(start, start + BATCH)]
+        metas = [{"name": f"Applicant {i}", "email": f"applicant{i}@example.com", "yoe": i % 12,
+                  "position": f"Position {i % POSITIONS}",
+                  "created_at": (now - timedelta(days=365 * YEARS * i / APPLICANTS)).isoformat()}
+                 for i in range(start, start + BATCH)]
+        db.applicant_collection.add(ids=ids, documents=[RESUME] * BATCH, metadatas=metas,
+                                    embeddings=rng.random((BATCH, DIM)).astype(np.float32))
+        db.entry_index.record_many(db.applicant_collection.name, list(zip(ids, metas)))
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def measure(label, db, lifecycle):
+    hot = db.applicant_collection
+    queries = rng.random((LOOKUPS, DIM)).tolist()
+    query_ms = timed(lambda: hot.query(query_embeddings=[random.choice(queries)], n_results=5), LOOKUPS)
+    filter_ms = timed(lambda: hot.get(where={"position": f"Position {random.randrange(POSITIONS)}"},
+                                      include=["metadatas"]), LOOKUPS)
+    scan_ms = timed(lambda: hot.get(include=["metadatas", "documents"]), 3)
+    print(f"{label:<22} {hot.count():>6} hot applicants | query {query_ms:6.2f} ms | "
+          f"position filter {filter_ms:7.2f} ms | full scan {scan_ms:8.1f} ms | "
+          f"hot index {lifecycle.index_sizes().get(hot.name, 0) / 1e6:6.1f} MB | "
+          f"store {lifecycle.store_size() / 1e6:6.1f} MB")
+
+
+if __name__ == "__main__":
+    with scratch_store() as tmp:
+        from chroma_db import db_handler as db
+        from chroma_db import lifecycle
+
+        start = time.perf_counter()
+        seed(db)
+        print(f"seeded {APPLICANTS} applicants over {YEARS} years in {time.perf_counter() - start:.1f}s")
+        measure("before", db, lifecycle)
+
+        for p in range(CLOSED):
+            lifecycle.close_position(f"Position {p}")
+        start = time.perf_counter()
+        archived = lifecycle.archive_applicants(older_than_days=365)
+        print(f"archived {sum(archived.values())} applicants into {len(archived)} period collections "
+              f"in {time.perf_counter() - start:.1f}s")
+        measure("after archive", db, lifecycle)
+
+        start = time.perf_counter()
+        lifecycle.compact()
+        print(f"compacted in {time.perf_counter() - start:.1f}s")
+        measure("after compaction", db, lifecycle)
+
+        start = time.perf_counter()
+        lifecycle.ARCHIVE_DIR = os.path.join(tmp, "parquet")
+        parquet = lifecycle.archive_applicants(older_than_days=0, fmt="parquet")
+        size = sum(os.path.getsize(os.path.join(root, name))
+                   for root, _, names in os.walk(lifecycle.ARCHIVE_DIR) for name in names)
+        print(f"parquet snapshot of the remaining {sum(parquet.values())} applicants: {size / 1e6:.1f} MB "
+              f"in {time.perf_counter() - start:.1f}s")
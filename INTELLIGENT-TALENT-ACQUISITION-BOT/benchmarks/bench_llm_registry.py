@@ -0,0 +1,76 @@
+"""Per-call LLM construction vs the shared registry, against the stub Ollama server.
+
+Run from the project root:  python -m benchmarks.bench_llm_registry
+"""
+import threading
+import time
+from langchain.llms import Ollama
+from benchmarks.stub_ollama import start_stub_server
+from llm_utils.llm_registry import LLMRegistry
+from llm_utils.ollama_client import OllamaClient
+
+CALLS = 200
+
+
+def bench_per_call(base_url):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        llm = Ollama(model="mistral", temperature=0.3, base_url=base_url)
+        llm.invoke("ping")
+    return time.perf_counter() - start
+
+
+def bench_registry(base_url, registry):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        llm = registry.get_or_create(
+            ("llm", "default"), lambda: Ollama(model="mistral", temperature=0.3, base_url=base_url)
+        )
+        llm.invoke("ping")
+    return time.perf_counter() - start
+
+
+def bench_pooled_client(base_url, registry):
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        client = registry.get_or_create(("client",), lambda: OllamaClient(base_url=base_url))
+        client.generate("ping")
+    return time.perf_counter() - start
+
+
+def check_nested_factory(registry):
+    # run_local_llm builds an agent whose factory asks the registry for its LLM
+    done = threading.Event()
+
+    def build_agent():
+        return ("agent", registry.get_or_create(("llm", "nested"), object))
+
+    def run():
+        registry.get_or_create(("agent", "nested"), build_agent)
+        done.set()
+
+    threading.Thread(target=run, daemon=True).start()
+    assert done.wait(5), "get_or_create deadlocked when called from inside a factory"
+    print("nested factory:         ok")
+
+
+if __name__ == "__main__":
+    server, url = start_stub_server()
+
+    per_call = bench_per_call(url)
+    print(f"per-call Ollama():      {CALLS / per_call:8.1f} calls/s  "
+          f"connections={server.stats['connections']}")
+
+    registry = LLMRegistry()
+    cached = bench_registry(url, registry)
+    print(f"registry Ollama:        {CALLS / cached:8.1f} calls/s  stats={registry.stats()}")
+
+    server.stats["connections"] = 0
+    registry = LLMRegistry()
+    pooled = bench_pooled_client(url, registry)
+    print(f"registry OllamaClient:  {CALLS / pooled:8.1f} calls/s  "
+          f"connections={server.stats['connections']}  stats={registry.stats()}")
+
+    assert registry.stats()["misses"] == 1 and registry.stats()["hits"] == CALLS - 1
+    check_nested_factory(LLMRegistry())
+    server.shutdown()
@@ -0,0 +1,141 @@
+"""Chat retrieval over 10k open positions: prompt size and latency vs dumping listings into the prompt.
+
+Embeddings come from a deterministic hashed bag-of-words stand-in so no
+model has to be downloaded; it is used for the stored HR vectors and the
+questions alike. Compares top-k lookups through hr_collection.query() and
+the precomputed position index. Also reports the index's full build and
+single-entry update time, and whether the top-k holds an opening matching
+the role and domain asked about.
+
+Run from the project root:  python -m benchmarks.bench_position_index
+"""
+import os
+import random
+import tempfile
+import time
+import zlib
+import chromadb
+import numpy as np
+from chroma_db.position_index import PositionIndex, position_context, position_summary
+from utils.chat_context import estimate_tokens
+from utils.events import publish, HR_CHANGED
+from utils.resume_scoring import tokenize
+
+POSITIONS = 10_000
+QUESTIONS = 200
+DIM = 384
+BATCH = 5_000
+ROLES = {"data scientist": ["python", "machine learning", "statistics", "pandas"],
+         "data engineer": ["spark", "kafka", "sql", "aws"],
+         "backend engineer": ["golang", "postgresql", "microservices", "docker"],
+         "frontend engineer": ["react", "typescript", "javascript", "graphql"],
+         "devops engineer": ["kubernetes", "terraform", "ci/cd", "linux"],
+         "data analyst": ["sql", "excel", "tableau", "power bi"]}
+DOMAINS = ["fintech", "healthcare", "retail", "logistics", "gaming", "energy", "travel", "insurance"]
+SENIORITY = ["Junior", "Mid-level", "Senior", "Staff", "Lead"]
+
+random.seed(9)
+
+
+def embed(texts):
+    # Hashed unigrams and bigrams: similar wording gives similar vectors, like a real sentence model
+    vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        tokens = tokenize(text)
+        for term in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+            vectors[row, zlib.crc32(term.encode()) % DIM] += 1.0
+    # Unit length, as all-MiniLM-L6-v2 returns, so Chroma's L2 ranking matches cosine
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+
+def synthetic_positions():
+    rows = {"ids": [], "metadatas": [], "documents": []}
+    for i in range(POSITIONS):
+        role, domain = random.choice(list(ROLES)), random.choice(DOMAINS)
+        meta = {"position": f"{random.choice(SENIORITY)} {role.title()} ({domain.title()}) #{i}",
+                "company": f"{domain.title()} Co {i % 97}", "email": f"hr{i}@example.com",
+                "min_yoe": random.randint(0, 8), "seq": i, "role": role, "domain": domain,
+                "job_description": f"We build {domain} products and need a {role} with "
+                                   f"{', '.join(ROLES[role])}. You will own projects end to end, "
+                                   "mentor colleagues and work closely with product and design."}
+        rows["ids"].append(f"hr_{i}")
+        rows["metadatas"].append(meta)
+        rows["documents"].append(f"{meta['company']} is hiring for {meta['position']}.\n\n"
+                                 f"Job Description:\n{meta['job_description']}")
+    rows["embeddings"] = embed(rows["documents"])
+    return rows
+
+
+def percentiles(samples):
+    return np.percentile(samples, 50) * 1000, np.percentile(samples, 95) * 1000
+
+
+def timed(fn, args):
+    samples, results = [], []
+    for arg in args:
+        start = time.perf_counter()
+        results.append(fn(arg))
+        samples.append(time.perf_counter() - start)
+    return results, percentiles(samples)
+
+
+if __name__ == "__main__":
+    rows = synthetic_positions()
+    by_id = {hr_id: i for i, hr_id in enumerate(rows["ids"])}
+
+    def load(ids=None):
+        picked = [by_id[hr_id] for hr_id in ids] if ids else range(POSITIONS)
+        return {key: [rows[key][i] for i in picked] for key in ("ids", "metadatas", "documents", "embeddings")}
+
+    asked = [(random.choice(list(ROLES)), random.choice(DOMAINS)) for _ in range(QUESTIONS)]
+    questions = [f"Are there any {role} openings in {domain}?" for role, domain in asked]
+
+    def matches(summaries, role, domain):
+        return any(role in s.lower() and domain in s.lower() for s in summaries)
+
+    index = PositionIndex(embed_fn=embed, load_fn=load, check_fn=None)
+    start = time.perf_counter()
+    index.refresh()
+    print(f"position index: {len(index)} positions built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rows["ids"].append("hr_new")
+    # The same title at another company is a second opening, not a replacement
+    rows["metadatas"].append({**rows["metadatas"][0], "seq": POSITIONS, "company": "Newco",
+                              "email": "hr@newco.example.com"})
+    rows["documents"].append(rows["documents"][0])
+    rows["embeddings"] = np.vstack([rows["embeddings"], embed([rows["documents"][0]])])
+    by_id["hr_new"] = POSITIONS
+    publish(HR_CHANGED, hr_id="hr_new")
+    start = time.perf_counter()
+    index.refresh()
+    print(f"save_hr_to_db refresh: {(time.perf_counter() - start) * 1000:.2f} ms for one new entry")
+    assert len(index) == POSITIONS + 1, "openings with the same title at different companies hid each other"
+
+    hits, (p50, p95) = timed(lambda q: [s for _, s in index.retrieve(q, min_score=0.0)], questions)
+    found = sum(matches(h, role, domain) for h, (role, domain) in zip(hits, asked))
+    print(f"position index retrieve:  p50 {p50:6.2f} ms  p95 {p95:6.2f} ms  "
+          f"(question embedding included), matching opening in top-3 for {found}/{QUESTIONS}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        collection = chromadb.PersistentClient(path=os.path.join(tmp, "chroma")).get_or_create_collection("hr_collection")
+        clean = [{k: v for k, v in meta.items() if k not in ("role", "domain")} for meta in rows["metadatas"]]
+        for start in range(0, POSITIONS, BATCH):
+            end = start + BATCH
+            collection.add(ids=rows["ids"][start:end], documents=rows["documents"][start:end],
+                           metadatas=clean[start:end], embeddings=rows["embeddings"][start:end])
+
+        def chroma_topk(question):
+            result = collection.query(query_embeddings=embed([question]), n_results=3,
+                                      include=["metadatas", "documents"])
+            return [position_summary(m, d) for m, d in zip(result["metadatas"][0], result["documents"][0])]
+
+        hits, (p50, p95) = timed(chroma_topk, questions)
+        found = sum(matches(h, role, domain) for h, (role, domain) in zip(hits, asked))
+        print(f"hr_collection.query():    p50 {p50:6.2f} ms  p95 {p95:6.2f} ms  "
+              f"(question embedding included), matching opening in top-3 for {found}/{QUESTIONS}")
+
+    dump = "\n\n".join(rows["documents"])
+    summaries = "\n".join(position_summary(m, d) for m, d in zip(rows["metadatas"], rows["documents"]))
+    block = np.mean([estimate_tokens(position_context(q, index)) for q in questions])
+    print(f"prompt tokens for the openings: every listing {estimate_tokens(dump):,} | "
+          f"every summary {estimate_tokens(summaries):,} | retrieved top-3 {block:.0f}")
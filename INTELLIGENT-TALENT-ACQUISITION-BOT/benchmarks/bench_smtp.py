@@ -0,0 +1,62 @@
+"""Messages/second: connect-per-message vs the pooled, queued sender, against a local aiosmtpd sink.
+
+Run from the project root:  python -m benchmarks.bench_smtp
+"""
+import os
+import smtplib
+import tempfile
+import time
+from aiosmtpd.controller import Controller
+from email_utils.mail_queue import MailQueue, SMTPConnectionPool
+
+MESSAGES = 500
+SENDER = "bot@example.com"
+BODY = "Subject: Interview\r\n\r\nYour interview is scheduled.\r\n"
+
+
+class CountingHandler:
+    def __init__(self):
+        self.received = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received += 1
+        return "250 OK"
+
+
+def bench_connect_per_message(host, port):
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        with smtplib.SMTP(host, port) as server:
+            server.sendmail(SENDER, f"applicant{i}@example.com", BODY)
+    return time.perf_counter() - start
+
+
+def bench_queue(host, port, handler, path):
+    pool = SMTPConnectionPool(host, port, starttls=False)
+    mail_queue = MailQueue(pool, SENDER, path=path)
+    target = handler.received + MESSAGES
+    start = time.perf_counter()
+    for i in range(MESSAGES):
+        mail_queue.enqueue(f"applicant{i}@example.com", BODY)
+    enqueued = time.perf_counter() - start
+    while handler.received < target:
+        time.sleep(0.005)
+    elapsed = time.perf_counter() - start
+    mail_queue.stop()
+    return enqueued, elapsed, pool.connects
+
+
+if __name__ == "__main__":
+    handler = CountingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=8025)
+    controller.start()
+    try:
+        direct = bench_connect_per_message("127.0.0.1", 8025)
+        print(f"connect-per-message: {MESSAGES / direct:8.1f} msg/s ({MESSAGES} connections)")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            enqueued, elapsed, connects = bench_queue("127.0.0.1", 8025, handler, os.path.join(tmp, "outbox.sqlite3"))
+        print(f"pooled queue:        {MESSAGES / elapsed:8.1f} msg/s end-to-end ({connects} connections), "
+              f"enqueue latency {enqueued / MESSAGES * 1000:.2f} ms/msg")
+    finally:
+        controller.stop()
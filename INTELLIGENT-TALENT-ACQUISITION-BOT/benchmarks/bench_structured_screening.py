@@ -0,0 +1,89 @@
+"""Free-text screening report vs the schema-constrained JSON verdict, against the stub Ollama server.
+
+Reports generated tokens, latency and unusable answers per screening. The stub
+writes a multi-section report for free-text prompts (omitting the
+recommendation line in one of every MISSING_DECISION_EVERY, which used to force
+a re-run) and a compact verdict when the request carries a JSON `format`.
+
+Run from the project root:  python -m benchmarks.bench_structured_screening
+"""
+import json
+import re
+import time
+from benchmarks.stub_ollama import start_stub_server
+from agents.prescreen import PreScreenResult
+from agents.structured_screening import build_screening_prompt, parse_verdict, request_verdict
+from llm_utils.ollama_client import OllamaClient
+
+SCREENINGS = 30
+TOKEN_SECONDS = 0.005  # simulated decode time per generated token
+MISSING_DECISION_EVERY = 6
+JOB = "Data Scientist. Needs python, sql, machine learning, docker."
+RESUME = "[experience] Built churn models in python and sql; deployed with docker.\n[skills] python, sql, pandas"
+PRE = PreScreenResult(score=0.5, coverage=0.75, missing_skills=["machine learning"])
+FREE_TEXT_PROMPT = (
+    f"You're a resume screening assistant.\nEvaluate this:\n\nJob: {JOB}\nResume: {RESUME}\n\n"
+    "Provide a detailed report: 1. Skill Match Percentage 2. Missing Requirements "
+    "3. Final Recommendation 4. Suggested Interview Questions"
+)
+REPORT = (
+    "## Screening Report\n1. Skill Match Percentage: The candidate demonstrates strong proficiency in python and "
+    "sql, with hands-on experience building churn models and deploying them with docker, which covers most of the "
+    "technical requirements listed in the job description. " * 3 +
+    "\n2. Missing Requirements: There is no explicit evidence of machine learning beyond churn modelling; the "
+    "candidate should be asked about model evaluation, feature engineering and production monitoring practices. " * 2 +
+    "\n3. Final Recommendation: Eligible, pending a technical interview focused on machine learning depth.\n"
+    "4. Suggested Interview Questions: How did you validate the churn model? How did you monitor it in production? "
+    "How would you handle class imbalance?"
+)
+VERDICT = json.dumps({"score": 72, "decision": "Eligible", "missing_skills": ["machine learning"],
+                      "interview_questions": ["How did you validate the churn model?",
+                                              "How did you monitor it in production?"],
+                      "summary": "Strong python/sql/docker; probe ML depth."})
+_DECISION_RE = re.compile(r"final recommendation\W*(not eligible|eligible)", re.IGNORECASE)
+
+
+def make_reply():
+    count = {"n": 0}
+
+    def reply(body):
+        if body.get("format"):
+            return VERDICT
+        count["n"] += 1
+        if count["n"] % MISSING_DECISION_EVERY == 0:
+            return REPORT.split("\n3.")[0]
+        return REPORT
+    return reply
+
+
+def run(label, server, call):
+    before = server.stats["requests"]
+    tokens, unusable = 0, 0
+    start = time.perf_counter()
+    for _ in range(SCREENINGS):
+        generated, ok = call()
+        tokens += generated
+        unusable += not ok
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22} {tokens / SCREENINGS:6.0f} generated tokens/screening  "
+          f"{elapsed / SCREENINGS * 1000:7.1f} ms/screening  {server.stats['requests'] - before} calls  "
+          f"{unusable}/{SCREENINGS} needed a re-run")
+
+
+if __name__ == "__main__":
+    server, url = start_stub_server(reply_fn=make_reply(), token_delay=TOKEN_SECONDS)
+    client = OllamaClient(base_url=url)
+    try:
+        def free_text():
+            body = client.generate(FREE_TEXT_PROMPT, options={"temperature": 0.1, "num_predict": 400})
+            return body["eval_count"], bool(_DECISION_RE.search(body["response"]))
+
+        def structured():
+            body = request_verdict(build_screening_prompt(JOB, RESUME, PRE), client)
+            return body["eval_count"], parse_verdict(body["response"]) is not None
+
+        run("free-text report", server, free_text)
+        run("JSON verdict (schema)", server, structured)
+    finally:
+        client.close()
+        server.shutdown()
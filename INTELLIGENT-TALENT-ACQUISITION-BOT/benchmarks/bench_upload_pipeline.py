@@ -0,0 +1,103 @@
+"""Applicant submit latency: synchronous save + extract + embed + write vs storing the bytes and queueing the rest.
+
+Every submission is a distinct multi-page PDF, so the extraction cache
+never answers. The synchronous path is what the applicant form used to do
+before showing success. The queued path is `submit_application`; its
+latency is only the file write plus one job row. Then the same number of
+uploads is drained by 1, 2 and 4 upload workers (UPLOAD_WORKERS). The
+hand-off to the screening pipeline is left out so no LLM is needed.
+Embeddings come from a hashed bag-of-words stand-in so no model has to be
+downloaded. Everything runs in a throwaway directory.
+
+Run from the project root:  python -m benchmarks.bench_upload_pipeline
+"""
+import time
+import zlib
+import numpy as np
+from benchmarks.scratch_store import scratch_store
+
+UPLOADS = 40
+PAGES = 30
+WORKER_COUNTS = [1, 2, 4]
+DIM = 384
+LINE = "Designed and shipped data pipelines in Python, SQL and Spark; led a team of four engineers."
+
+
+def embed(texts):
+    vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for term in text.lower().split():
+            vectors[row, zlib.crc32(term.encode()) % DIM] += 1.0
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+
+def make_pdf(tag: str) -> bytes:
+    import fitz
+    doc = fitz.open()
+    for page_no in range(PAGES):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(40, 40, 560, 800), f"{tag} page {page_no}\n" + "\n".join([LINE] * 45),
+                            fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def applicant(tag: str) -> dict:
+    return {"name": f"Applicant {tag}", "email": f"{tag}@example.com", "institute": "Institute", "yoe": 3,
+            "position": "Data Scientist", "free_date": "", "free_time": "", "timezone": "Asia/Kolkata"}
+
+
+def percentiles(samples):
+    return np.percentile(samples, 50) * 1000, np.percentile(samples, 95) * 1000
+
+
+class Upload:
+    # Stands in for Streamlit's UploadedFile
+    def __init__(self, name, data):
+        self.name = name
+        self._data = data
+
+    def getbuffer(self):
+        return memoryview(self._data)
+
+
+if __name__ == "__main__":
+    with scratch_store():
+        from chroma_db import db_handler
+        from utils.helper import save_uploaded_file
+        from utils.job_queue import JobQueue
+        from utils.pdf_parser import extract_text_from_pdf
+        from utils.upload_pipeline import UPLOAD_STAGES, submit_application
+        db_handler.embedder._embedding_function = embed
+
+        pdfs = {run: [make_pdf(f"{run}-{i}") for i in range(UPLOADS)] for run in ["sync", *WORKER_COUNTS]}
+        print(f"{UPLOADS} uploads of {PAGES} pages, ~{np.mean([len(p) for p in pdfs['sync']]) / 1024:.0f} KB each")
+
+        samples = []
+        for i, data in enumerate(pdfs["sync"]):
+            start = time.perf_counter()
+            resume_text = extract_text_from_pdf(save_uploaded_file(Upload(f"resume-{i}.pdf", data)))
+            db_handler.save_applicant_to_db(applicant(f"sync-{i}"), resume_text)
+            samples.append(time.perf_counter() - start)
+        p50, p95 = percentiles(samples)
+        print(f"synchronous submit        p50 {p50:7.1f} ms | p95 {p95:7.1f} ms | {UPLOADS / sum(samples):5.1f} uploads/s")
+
+        for workers in WORKER_COUNTS:
+            queue = JobQueue(UPLOAD_STAGES[:2], path=f"upload_jobs_{workers}.sqlite3", workers=workers, name="upload")
+            samples = []
+            first = time.perf_counter()
+            for i, data in enumerate(pdfs[workers]):
+                start = time.perf_counter()
+                submit_application(applicant(f"w{workers}-{i}"), f"resume-{i}.pdf", data, queue=queue)
+                samples.append(time.perf_counter() - start)
+            while queue.counts().get("done", 0) + queue.counts().get("failed", 0) < UPLOADS:
+                time.sleep(0.01)
+            drained = time.perf_counter() - first
+            queue.stop()
+            p50, p95 = percentiles(samples)
+            print(f"queued submit, {workers} worker{'s' if workers > 1 else ' '} p50 {p50:7.1f} ms | p95 {p95:7.1f} ms | "
+                  f"all {UPLOADS} ingested in {drained:5.2f} s ({UPLOADS / drained:5.1f} uploads/s) | "
+                  f"failed {queue.counts().get('failed', 0)}")
+
+        print(f"applicants stored: {db_handler.applicant_collection.count()} (expected {UPLOADS * (1 + len(WORKER_COUNTS))})")
@@ -0,0 +1,102 @@
+"""Bulk-load throughput: one add() per saved row vs the coalescing write buffer, plus resubmission dedup.
+
+Loads synthetic applicants into a throwaway store. The legacy path is what
+save_applicant_to_db used to do per row: a random id, one index write, one
+embedding call and one collection.add(). The buffered path puts rows into
+db_handler.write_buffer, which flushes one embedding pass and one upsert
+per WRITE_BATCH_ROWS rows. The legacy path is measured on a sample, since
+at its rate 100k rows would take minutes. Then a share of the applicants
+resubmit with an updated resume, and the seed script runs twice.
+Embeddings come from a hashed bag-of-words stand-in so no model has to be
+downloaded; both paths pay the same embedding cost per row.
+
+Run from the project root:  python -m benchmarks.bench_write_buffer
+"""
+import time
+import uuid
+import zlib
+from datetime import datetime
+import numpy as np
+from benchmarks.scratch_store import scratch_store
+
+ROWS = 100_000
+LEGACY_ROWS = 2_000
+RESUBMITTED = 10_000
+DIM = 384
+POSITIONS = ["Data Scientist", "Backend Developer", "Frontend Developer", "DevOps Engineer", "ML Engineer"]
+SKILLS = ["python", "sql", "pandas", "docker", "kubernetes", "react", "java", "aws", "spark", "pytorch"]
+
+
+def embed(texts):
+    vectors = np.zeros((len(texts), DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for term in text.lower().split():
+            vectors[row, zlib.crc32(term.encode()) % DIM] += 1.0
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+
+
+def synthetic_applicant(i, version=0):
+    data = {"name": f"Applicant {i}", "email": f"applicant{i}@example.com", "institute": f"Institute {i % 50}",
+            "yoe": i % 12, "position": POSITIONS[i % len(POSITIONS)]}
+    skills = ", ".join(SKILLS[(i + k) % len(SKILLS)] for k in range(4))
+    resume = f"Resume {i} v{version}. Skilled in {skills}. Built data pipelines and services."
+    return data, resume
+
+
+def legacy_save(db, data, resume):
+    app_id = f"app_{uuid.uuid4().hex[:8]}"
+    metadata = {**data, "created_at": datetime.now().isoformat()}
+    metadata["seq"] = db.entry_index.record(db.applicant_collection.name, app_id, metadata)
+    doc = db.applicant_document(data, resume)
+    db.applicant_collection.add(ids=[app_id], documents=[doc], metadatas=[metadata],
+                                embeddings=db.embedder.embed([doc]))
+
+
+def buffered_load(db, rows):
+    created_at = datetime.now().isoformat()
+    for data, resume in rows:
+        db.write_buffer.put(db.applicant_collection, db.entry_id("app", data["email"], data["position"]),
+                            db.applicant_document(data, resume), {**data, "created_at": created_at})
+    db.write_buffer.flush()
+
+
+if __name__ == "__main__":
+    with scratch_store():
+        from chroma_db import db_handler as db
+        from chroma_db import seed_data
+        db.embedder._embedding_function = embed
+
+        start = time.perf_counter()
+        for i in range(LEGACY_ROWS):
+            legacy_save(db, *synthetic_applicant(ROWS + i))
+        legacy = time.perf_counter() - start
+        print(f"one add() per row      {LEGACY_ROWS:>7} rows in {legacy:6.1f} s | {LEGACY_ROWS / legacy:8.0f} rows/s")
+
+        # Start the buffered load from an empty store
+        db.client.delete_collection(db.applicant_collection.name)
+        db.applicant_collection.rebind()
+        db.entry_index.rebuild(db.applicant_collection.name, [], [])
+
+        start = time.perf_counter()
+        buffered_load(db, [synthetic_applicant(i) for i in range(ROWS)])
+        buffered = time.perf_counter() - start
+        print(f"write buffer ({db.write_buffer.max_rows}/batch) {ROWS:>7} rows in {buffered:6.1f} s | "
+              f"{ROWS / buffered:8.0f} rows/s | {db.write_buffer.flushes} upserts | "
+              f"{(ROWS / buffered) / (LEGACY_ROWS / legacy):.1f}x")
+
+        # The same applicants resubmit with an updated resume, some twice before a flush
+        flushes = db.write_buffer.flushes
+        start = time.perf_counter()
+        buffered_load(db, [synthetic_applicant(i, version) for i in range(RESUBMITTED)
+                           for version in ((1, 2) if i < RESUBMITTED // 2 else (1,))])
+        resubmit = time.perf_counter() - start
+        newest = db.get_applicant_document(db.entry_id("app", "applicant0@example.com", POSITIONS[0]))
+        print(f"resubmissions          {RESUBMITTED + RESUBMITTED // 2:>7} writes in {resubmit:6.1f} s | "
+              f"{db.write_buffer.coalesced} coalesced in the buffer, {db.write_buffer.flushes - flushes} upserts | "
+              f"{db.applicant_collection.count()} applicants (legacy ids: {ROWS + RESUBMITTED + RESUBMITTED // 2}) | "
+              f"newest resume kept: {'v2' in newest}")
+        print(f"index rows match store: {db.entry_index.count(db.applicant_collection.name) == db.applicant_collection.count()}")
+
+        seed_data.seed_hr_data()
+        seed_data.seed_hr_data()
+        print(f"seed_data twice: {db.hr_collection.count()} HR entries for {len(seed_data.dummy_hrs)} seeded recruiters")
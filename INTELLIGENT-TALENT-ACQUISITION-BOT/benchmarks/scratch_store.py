@@ -0,0 +1,30 @@
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+# -------------------------
+# 🧪 Throwaway working directory for store benchmarks
+# -------------------------
+# db_handler (and the sqlite sidecars) open ./chroma_db and ./data relative to
+# the working directory, so benchmarks that import it run inside a temporary
+# directory and leave the real store untouched.
+
+
+@contextmanager
+def scratch_store():
+    """chdir into a fresh temporary directory with an empty chroma_db/; yields its path.
+
+    Enter it before importing chroma_db.db_handler. The project root stays
+    importable and is the working directory again on exit.
+    """
+    root = os.getcwd()
+    if root not in sys.path:
+        sys.path.insert(0, root)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            os.makedirs("chroma_db")
+            yield tmp
+        finally:
+            os.chdir(root)
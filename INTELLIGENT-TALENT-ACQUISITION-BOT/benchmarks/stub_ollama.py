@@ -0,0 +1,94 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# -------------------------
+# 🧪 Local stand-in for the Ollama REST API
+# -------------------------
+# Answers /api/generate with a canned reply after a fixed delay, in both the
+# blocking and the NDJSON streaming shapes, and counts requests and TCP
+# connections so benchmarks can check connection reuse.
+
+
+class StubOllamaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # required for keep-alive
+
+    def setup(self):
+        super().setup()
+        self.server.stats["connections"] += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        stats = self.server.stats
+        stats["requests"] += 1
+        stats["prompt_chars"] += len(body.get("prompt", ""))
+        stats["last_payload"] = body
+
+        reply = self.server.reply_fn(body)
+        tokens = reply.split(" ")
+        # Simulated prefill: cost grows with the prompt, like a real model
+        time.sleep(self.server.first_token_delay + self.server.prompt_token_delay * len(body.get("prompt", "")) / 4)
+
+        if body.get("stream", True):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i, token in enumerate(tokens):
+                piece = token if i == 0 else " " + token
+                self._write_chunk({"model": body.get("model"), "response": piece, "done": False})
+                time.sleep(self.server.token_delay)
+            self._write_chunk(self._final(body, tokens, ""))
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            time.sleep(self.server.token_delay * len(tokens))
+            payload = json.dumps(self._final(body, tokens, reply)).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    def _final(self, body, tokens, response):
+        return {
+            "model": body.get("model"),
+            "response": response,
+            "done": True,
+            "prompt_eval_count": len(body.get("prompt", "").split()),
+            "eval_count": len(tokens),
+        }
+
+    def _write_chunk(self, obj):
+        data = (json.dumps(obj) + "\n").encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+def start_stub_server(reply_fn=None, first_token_delay: float = 0.0, token_delay: float = 0.0,
+                      prompt_token_delay: float = 0.0, port: int = 0):
+    """Start the stub on a background thread. Returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubOllamaHandler)
+    server.daemon_threads = True
+    server.reply_fn = reply_fn or (lambda body: "Thank you for your application. We will be in touch soon.")
+    server.first_token_delay = first_token_delay
+    server.token_delay = token_delay
+    server.prompt_token_delay = prompt_token_delay
+    server.stats = {"requests": 0, "connections": 0, "prompt_chars": 0, "last_payload": None}
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
+
+
+if __name__ == "__main__":
+    srv, url = start_stub_server()
+    print(f"Stub Ollama listening on {url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        srv.shutdown()
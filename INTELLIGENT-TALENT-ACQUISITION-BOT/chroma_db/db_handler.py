@@ -1,37 +1,326 @@
 import chromadb
+import hashlib
+import os
+import threading
+import time
 from datetime import datetime
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from chromadb.errors import NotFoundError
+from chroma_db.entry_index import EntryIndex
+from chroma_db.hr_lookup import HRLookup
+from chroma_db.embeddings import embedder
+from chroma_db.write_buffer import WriteBuffer
+from utils.resume_chunker import chunk_resume
+from utils.events import publish, HR_CHANGED, APPLICANT_CHANGED
 
 DB_PATH = "./chroma_db/hr_data"
+COMPACTING_SUFFIX = "_compacting"  # staging copy written by lifecycle.compact
+HR_STORE_CHECK_SECONDS = float(os.getenv("HR_STORE_CHECK_SECONDS", "5"))
 client = chromadb.PersistentClient(path=DB_PATH)
 
+
+def open_collection(name: str):
+    """get_or_create_collection, first finishing a compaction that stopped after dropping the old copy."""
+    names = {c.name for c in client.list_collections()}
+    staging = name + COMPACTING_SUFFIX
+    if staging in names:
+        current = client.get_collection(name) if name in names else None
+        rebuilt = client.get_collection(staging)
+        if (current is None or current.count() == 0) and rebuilt.count() > 0:
+            if current is not None:
+                client.delete_collection(name)
+            rebuilt.modify(name=name)
+            print(f"⚠️ Finished an interrupted compaction of {name} ({rebuilt.count()} rows)")
+            return rebuilt
+    return client.get_or_create_collection(name)
+
+
+# -------------------------
+# 🔗 Collection handles
+# -------------------------
+class CollectionHandle:
+    """A Chroma collection addressed by name.
+
+    `lifecycle compact`, possibly run from another process, replaces a
+    collection with a rebuilt one under the same name. Any handle to the old
+    one then raises NotFoundError, so calls re-resolve the name once and retry.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.generation = 0
+        self._collection = open_collection(name)
+
+    def rebind(self, collection=None):
+        self._collection = collection or open_collection(self.name)
+        self.generation += 1
+
+    def __getattr__(self, attr):
+        target = getattr(self._collection, attr)
+        if not callable(target):
+            return target
+
+        def call(*args, **kwargs):
+            try:
+                return getattr(self._collection, attr)(*args, **kwargs)
+            except NotFoundError:
+                self.rebind()
+                return getattr(self._collection, attr)(*args, **kwargs)
+        return call
+
+
 # Collections
-hr_collection = client.get_or_create_collection("hr_collection")
-applicant_collection = client.get_or_create_collection("applicant_collection")
+hr_collection = CollectionHandle("hr_collection")
+applicant_collection = CollectionHandle("applicant_collection")
+resume_chunk_collection = CollectionHandle("resume_chunks")
 
+# Sidecar index answering latest / by id / by email without scanning Chroma
+entry_index = EntryIndex()
 
-def save_hr_to_db(hr_data: dict):
-    hr_id = f"hr_{uuid.uuid4().hex[:8]}"
+
+def _sync_index(collection):
+    # Backfill rows written before the index existed (metadata only, once per process)
+    if entry_index.count(collection.name) != collection.count():
+        existing = collection.get(include=["metadatas"])
+        entry_index.rebuild(collection.name, existing["ids"], existing["metadatas"])
+
+
+_sync_index(hr_collection)
+_sync_index(applicant_collection)
+
+
+# -------------------------
+# 👀 Changes made by other processes
+# -------------------------
+# seed_data, bulk_ingest and the lifecycle CLI write from their own process, so their
+# HR changes never reach this process's HR_CHANGED subscribers unless we look.
+_hr_store = {"version": None, "checked_at": 0.0}
+_hr_store_lock = threading.Lock()
+
+
+def hr_store_version() -> tuple:
+    """Cheap signature of hr_collection (row count, newest seq); any write from any process changes it."""
+    return hr_collection.count(), entry_index.max_seq(hr_collection.name)
+
+
+def check_hr_store(max_age: float = HR_STORE_CHECK_SECONDS) -> bool:
+    """Publish HR_CHANGED if hr_collection changed behind this process's back; checked at most every `max_age` s."""
+    now = time.monotonic()
+    with _hr_store_lock:
+        if now - _hr_store["checked_at"] < max_age:
+            return False
+        _hr_store["checked_at"] = now
+        seen = _hr_store["version"]
+    version = hr_store_version()
+    with _hr_store_lock:
+        _hr_store["version"] = version
+    if seen == version:
+        return False
+    publish(HR_CHANGED)
+    return True
+
+
+def _hr_written(before: tuple):
+    # This process announces its own writes; only move the baseline if nobody else wrote in between
+    with _hr_store_lock:
+        if _hr_store["version"] == before:
+            _hr_store["version"] = hr_store_version()
+
+
+_hr_store["version"] = hr_store_version()
+
+
+def _fetch_hr_metadata(where: dict = None) -> list:
+    query = {"where": where} if where else {}
+    result = hr_collection.get(include=["metadatas"], **query)
+    return list(zip(result["ids"], result["metadatas"]))
+
+
+# Exact email / recruiter_id / company lookups over HR entries
+hr_lookup = HRLookup(_fetch_hr_metadata)
+
+
+def entry_id(prefix: str, email: str, position: str) -> str:
+    """Deterministic row id for an email + position, so a repeat submission overwrites instead of duplicating."""
+    if not (email or "").strip():
+        return f"{prefix}_{uuid.uuid4().hex[:8]}"  # nothing to deduplicate on
+    key = f"{email.strip().casefold()}\0{(position or '').strip().casefold()}"
+    return f"{prefix}_{hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _upsert_entries(collection, entry_ids: list, docs: list, metadatas: list):
+    # Last-write-wins on id: the index row and the Chroma row are both replaced. Fields the new
+    # version does not set (screening results on a resubmission) carry over until rewritten.
+    previous = entry_index.by_ids(collection.name, entry_ids)
+    metadatas = [{**{k: v for k, v in previous.get(entry_id, {}).items() if k != "seq"}, **metadata}
+                 for entry_id, metadata in zip(entry_ids, metadatas)]
+    seqs = entry_index.record_many(collection.name, list(zip(entry_ids, metadatas)))
+    metadatas = [{**metadata, "seq": seq} for metadata, seq in zip(metadatas, seqs)]
+    try:
+        collection.upsert(
+            documents=docs,
+            embeddings=embedder.embed(docs),
+            metadatas=metadatas,
+            ids=entry_ids,
+        )
+    except Exception:
+        entry_index.remove(collection.name, entry_ids)
+        previous = collection.get(ids=entry_ids, include=["metadatas"])
+        entry_index.restore(collection.name, previous["ids"], previous["metadatas"])
+        raise
+    return entry_ids
+
+
+# Single-row saves from concurrent sessions share one embedding pass and one upsert
+write_buffer = WriteBuffer(_upsert_entries)
+
+
+def _buffer_entries(collection, entry_ids: list, docs: list, datas: list) -> list:
+    created_at = datetime.now().isoformat()
+    return [write_buffer.put(collection, entry_id, doc, {**data, "created_at": created_at})
+            for entry_id, doc, data in zip(entry_ids, docs, datas)]
+
+
+def _save_entries(collection, entry_ids: list, docs: list, datas: list) -> list:
+    """Buffer the rows and return once they are written."""
+    tickets = _buffer_entries(collection, entry_ids, docs, datas)
+    if len(tickets) > 1:
+        write_buffer.flush(collection.name)
+    for ticket in tickets:
+        ticket.wait()
+    return list(dict.fromkeys(entry_ids))
+
+
+def hr_document(hr_data: dict) -> str:
     doc = f"{hr_data['name']} from {hr_data['company']} is hiring for {hr_data['position']}."
+    if hr_data.get("job_description"):
+        doc += f"\n\nJob Description:\n{hr_data['job_description']}"
+    return doc
 
-    hr_collection.add(
-        documents=[doc],
-        metadatas=[hr_data],
-        ids=[hr_id],
-    )
+
+def save_hr_to_db(hr_data: dict):
+    hr_id = entry_id("hr", hr_data.get("email"), hr_data.get("position"))
+    before = hr_store_version()
+    _save_entries(hr_collection, [hr_id], [hr_document(hr_data)], [hr_data])
+    hr_lookup.add(hr_id, get_hr_entry(hr_id))
+    _hr_written(before)
+    publish(HR_CHANGED, hr_id=hr_id)
     return hr_id
 
 
+def save_hr_batch(hr_rows: list) -> list:
+    """Upsert many HR entries in one flush; rows with the same email + position collapse into one."""
+    if not hr_rows:
+        return []
+    hr_ids = [entry_id("hr", hr.get("email"), hr.get("position")) for hr in hr_rows]
+    before = hr_store_version()
+    saved = _save_entries(hr_collection, hr_ids, [hr_document(hr) for hr in hr_rows], hr_rows)
+    _hr_written(before)
+    publish(HR_CHANGED)
+    return saved
+
+
+def applicant_document(applicant_data: dict, resume_text: str) -> str:
+    yoe = applicant_data.get("yoe")
+    experience = f"{yoe} years of experience" if yoe is not None else "unstated experience"
+    return f"{applicant_data['name']} has {experience} from {applicant_data['institute']}.\n\nResume:\n{resume_text}"
+
+
 def save_applicant_to_db(applicant_data: dict, resume_text: str):
-    app_id = f"app_{uuid.uuid4().hex[:8]}"
-    doc = f"{applicant_data['name']} has {applicant_data['yoe']} years of experience from {applicant_data['institute']}.\n\nResume:\n{resume_text}"
+    app_id = entry_id("app", applicant_data.get("email"), applicant_data.get("position"))
+    _save_entries(applicant_collection, [app_id], [applicant_document(applicant_data, resume_text)], [applicant_data])
+    schedule_resume_chunks(app_id, applicant_data, resume_text)
+    return app_id
+
+
+# Chunk embedding happens off the request thread; a single worker keeps writes ordered
+_chunk_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="resume-chunks")
+_chunk_lock = threading.Lock()
+_chunk_jobs = {}  # app_id -> newest pending future
+_chunk_failures = OrderedDict()  # app_id -> error of its newest chunking, most recent last
+CHUNK_FAILURES_KEPT = 1000
 
-    applicant_collection.add(
-        documents=[doc],
-        metadatas=[applicant_data],
-        ids=[app_id],
+
+def save_resume_chunks(app_id: str, applicant_data: dict, resume_text: str):
+    chunks = chunk_resume(resume_text)
+    if not chunks:
+        return 0
+    docs = [chunk["text"] for chunk in chunks]
+    # A resubmitted resume may have fewer chunks than the one it replaces
+    resume_chunk_collection.delete(where={"parent_id": app_id})
+    resume_chunk_collection.upsert(
+        ids=[f"{app_id}_c{i}" for i in range(len(chunks))],
+        documents=docs,
+        embeddings=embedder.embed(docs),
+        metadatas=[
+            {"parent_id": app_id, "section": chunk["section"], "chunk_index": i,
+             "position": applicant_data.get("position", "")}
+            for i, chunk in enumerate(chunks)
+        ],
+    )
+    return len(chunks)
+
+
+def schedule_resume_chunks(app_id: str, applicant_data: dict, resume_text: str):
+    future = _chunk_executor.submit(save_resume_chunks, app_id, applicant_data, resume_text)
+    with _chunk_lock:
+        _chunk_jobs[app_id] = future
+        _chunk_failures.pop(app_id, None)
+    # Outside the lock: the callback runs at once if the future already finished
+    future.add_done_callback(lambda f: _chunk_done(app_id, f))
+    return future
+
+
+def _chunk_done(app_id: str, future):
+    with _chunk_lock:
+        # A resubmission may have replaced this job; only the newest one settles the entry
+        if _chunk_jobs.get(app_id) is not future:
+            return
+        del _chunk_jobs[app_id]
+        if future.exception() is not None:
+            _chunk_failures[app_id] = future.exception()
+            while len(_chunk_failures) > CHUNK_FAILURES_KEPT:
+                _chunk_failures.popitem(last=False)
+
+
+def resume_chunks_ready(app_id: str) -> bool:
+    with _chunk_lock:
+        job = _chunk_jobs.get(app_id)
+        if job is None:
+            return app_id not in _chunk_failures
+    return job.done() and job.exception() is None
+
+
+def query_resume_chunks(app_id: str, query_text: str, k: int = 4) -> list:
+    """Top-k chunks of one applicant's resume for a query: [{"section", "text", "distance"}, ...]."""
+    if not app_id or not resume_chunks_ready(app_id):
+        return []
+    result = resume_chunk_collection.query(
+        query_embeddings=embedder.embed([query_text]),
+        where={"parent_id": app_id},
+        n_results=k,
+        include=["documents", "metadatas", "distances"],
+    )
+    if not result["ids"] or not result["ids"][0]:
+        return []
+    return [
+        {"section": meta.get("section"), "text": doc, "distance": dist}
+        for doc, meta, dist in zip(result["documents"][0], result["metadatas"][0], result["distances"][0])
+    ]
+
+
+def save_applicants_batch(rows: list):
+    """Bulk upsert of (app_id, applicant_data, resume_text) rows in one flush of the write buffer."""
+    if not rows:
+        return []
+    return _save_entries(
+        applicant_collection,
+        [app_id for app_id, _, _ in rows],
+        [applicant_document(data, resume_text) for _, data, resume_text in rows],
+        [data for _, data, _ in rows],
     )
-    return app_id
 
 
 def get_all_open_positions():
@@ -39,23 +328,85 @@ def get_all_open_positions():
 
 
 def search_hr_by_email(email):
-    results = hr_collection.query(query_texts=[email], n_results=1)
-    return results["metadatas"][0][0] if results["metadatas"] else None
+    """Newest HR entry with exactly this email (case-insensitive), or None."""
+    matches = hr_lookup.find("email", email)
+    return matches[0] if matches else None
+
+
+def search_hr_by_emails(emails: list) -> dict:
+    """{email: newest HR entry or None} for many emails in one pass."""
+    return {email: (matches[0] if matches else None) for email, matches in hr_lookup.find_many("email", emails).items()}
+
+
+def get_hr_by_recruiter_id(recruiter_id: str):
+    matches = hr_lookup.find("recruiter_id", recruiter_id)
+    return matches[0] if matches else None
+
+
+def get_hr_entries_for_company(company: str) -> list:
+    """Every HR entry for a company, newest first."""
+    return hr_lookup.find("company", company)
 
 
 def get_all_applicants():
     return applicant_collection.get(include=["metadatas", "documents"])
 
 def get_latest_hr_entry():
-    all_entries = hr_collection.get(include=["metadatas", "documents"])
-    if not all_entries["metadatas"]:
-        return {}
-    latest_index = -1  # Last entry added
-    return all_entries["metadatas"][latest_index]
+    return entry_index.latest(hr_collection.name) or {}
 
 def get_latest_applicant_entry():
-    all_entries = applicant_collection.get(include=["metadatas", "documents"])
-    if not all_entries["metadatas"]:
+    return entry_index.latest(applicant_collection.name) or {}
+
+def get_hr_entry(hr_id: str):
+    return entry_index.by_id(hr_collection.name, hr_id) or {}
+
+def get_applicant_entry(app_id: str):
+    return entry_index.by_id(applicant_collection.name, app_id) or {}
+
+def get_latest_applicant_by_email(email: str):
+    return entry_index.by_email(applicant_collection.name, email) or {}
+
+def get_position_entry(position: str):
+    """Newest HR entry for a position title: (metadata, document), or ({}, "")."""
+    if not position:
+        return {}, ""
+    result = hr_collection.get(where={"position": position}, include=["metadatas", "documents"])
+    if not result["ids"]:
+        return {}, ""
+    newest = max(range(len(result["ids"])), key=lambda i: (result["metadatas"][i] or {}).get("seq", 0))
+    return result["metadatas"][newest], result["documents"][newest]
+
+def get_latest_applicant_id():
+    return entry_index.latest_id(applicant_collection.name)
+
+def get_applicant_document(app_id: str) -> str:
+    result = applicant_collection.get(ids=[app_id], include=["documents"])
+    return result["documents"][0] if result["documents"] else ""
+
+def get_applicant_documents(app_ids: list) -> dict:
+    """{app_id: document} for many applicants in one round trip."""
+    if not app_ids:
         return {}
-    latest_index = -1  # Last entry added
-    return all_entries["metadatas"][latest_index]
+    result = applicant_collection.get(ids=list(app_ids), include=["documents"])
+    return dict(zip(result["ids"], result["documents"]))
+
+def get_applicant_ids_for_position(position: str) -> list:
+    result = applicant_collection.get(where={"position": position}, include=[])
+    return result["ids"]
+
+def update_applicants_metadata(updates: dict):
+    """Merge {app_id: {field: value}} into stored applicant metadata with one collection.update()."""
+    app_ids, metadatas = [], []
+    for app_id, fields in updates.items():
+        current = get_applicant_entry(app_id)
+        if not current:
+            continue
+        app_ids.append(app_id)
+        metadatas.append({**current, **fields})
+    if not app_ids:
+        return []
+    applicant_collection.update(ids=app_ids, metadatas=metadatas)
+    for app_id, metadata in zip(app_ids, metadatas):
+        entry_index.update_metadata(applicant_collection.name, app_id, metadata)
+    publish(APPLICANT_CHANGED, app_ids=app_ids)
+    return app_ids
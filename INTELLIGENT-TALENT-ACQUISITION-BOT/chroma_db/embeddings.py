@@ -0,0 +1,128 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+import numpy as np
+
+EMBEDDING_CACHE_PATH = "./chroma_db/embedding_cache.sqlite3"
+EMBED_BATCH_SIZE = int(os.getenv("EMBED_BATCH_SIZE", "64"))
+MEMORY_VECTORS = int(os.getenv("EMBED_MEMORY_VECTORS", "50000"))
+MODEL_NAME = "all-MiniLM-L6-v2"  # Chroma's default ONNX model; query_texts use the same one
+
+
+def _default_embedding_function():
+    from chromadb.utils import embedding_functions
+    return embedding_functions.DefaultEmbeddingFunction()
+
+
+# -------------------------
+# 🧮 Batched, memoised document embedder
+# -------------------------
+class Embedder:
+    """Embeds documents in batches on CPU and memoises vectors by content hash.
+
+    Vectors are kept in memory and persisted to a small SQLite table so
+    re-ingested resumes and unchanged job posts are never embedded twice.
+    """
+
+    def __init__(self, embedding_function=None, cache_path: str = EMBEDDING_CACHE_PATH,
+                 batch_size: int = EMBED_BATCH_SIZE, model_name: str = MODEL_NAME,
+                 memory_vectors: int = MEMORY_VECTORS):
+        self._embedding_function = embedding_function
+        self._ef_lock = threading.Lock()
+        self.batch_size = batch_size
+        self.model_name = model_name
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # LRU of float32 vectors
+        self.memory_vectors = memory_vectors
+        self._conn = sqlite3.connect(cache_path, check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)")
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+        self.model_calls = 0
+
+    @property
+    def embedding_function(self):
+        # The ONNX model is loaded once, on first use
+        with self._ef_lock:
+            if self._embedding_function is None:
+                self._embedding_function = _default_embedding_function()
+            return self._embedding_function
+
+    def key(self, text: str) -> str:
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, keys: list) -> dict:
+        found = {}
+        with self._lock:
+            missing = []
+            for k in keys:
+                if k in self._memory:
+                    self._memory.move_to_end(k)
+                    found[k] = self._memory[k]
+                else:
+                    missing.append(k)
+            for start in range(0, len(missing), 500):
+                chunk = missing[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+                for k, blob in rows:
+                    found[k] = np.frombuffer(blob, dtype=np.float32)
+                self._remember({k: found[k] for k, _ in rows})
+        return found
+
+    def _remember(self, items: dict):
+        self._memory.update(items)
+        while len(self._memory) > self.memory_vectors:
+            self._memory.popitem(last=False)
+
+    def _store(self, items: dict):
+        with self._lock:
+            self._remember(items)
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(k, v.tobytes()) for k, v in items.items()],
+            )
+            self._conn.commit()
+
+    def embed(self, texts: list) -> list:
+        """One float32 vector per input text, in order."""
+        keys = [self.key(text) for text in texts]
+        vectors = self._lookup(list(dict.fromkeys(keys)))
+
+        todo = {}
+        for k, text in zip(keys, texts):
+            if k not in vectors:
+                todo.setdefault(k, text)
+        with self._lock:
+            self.hits += len(keys) - sum(1 for k in keys if k in todo)
+            self.misses += len(todo)
+
+        pending = list(todo.items())
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start:start + self.batch_size]
+            computed = self.embedding_function([text for _, text in batch])
+            with self._lock:
+                self.model_calls += 1
+            new = {k: np.asarray(v, dtype=np.float32) for (k, _), v in zip(batch, computed)}
+            self._store(new)
+            vectors.update(new)
+
+        return [vectors[k] for k in keys]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "model_calls": self.model_calls,
+                "cached_vectors": len(self._memory),
+            }
+
+
+embedder = Embedder()
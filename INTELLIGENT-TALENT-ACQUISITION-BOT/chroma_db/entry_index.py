@@ -0,0 +1,182 @@
+import json
+import sqlite3
+import threading
+
+INDEX_PATH = "./chroma_db/entry_index.sqlite3"
+
+
+# -------------------------
+# 📇 Sidecar index for Chroma collections
+# -------------------------
+class EntryIndex:
+    """SQLite B-tree index over Chroma rows: latest / by id / by email without loading documents.
+
+    `seq` is a monotonic insertion counter shared by all collections; it is also
+    written into the Chroma metadata so the two stores can be reconciled.
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                collection TEXT NOT NULL,
+                id TEXT NOT NULL,
+                email TEXT,
+                created_at TEXT,
+                metadata TEXT NOT NULL,
+                UNIQUE (collection, id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_email ON entries (collection, email, seq);
+            CREATE INDEX IF NOT EXISTS idx_entries_seq ON entries (collection, seq);
+            """
+        )
+        self._conn.commit()
+
+    def record(self, collection: str, entry_id: str, metadata: dict) -> int:
+        """Insert (or replace) a row and return its new sequence number."""
+        return self.record_many(collection, [(entry_id, metadata)])[0]
+
+    def record_many(self, collection: str, rows: list) -> list:
+        """Insert (or replace) (id, metadata) rows in one transaction; returns their sequence numbers."""
+        seqs = []
+        with self._lock:
+            for entry_id, metadata in rows:
+                self._conn.execute("DELETE FROM entries WHERE collection = ? AND id = ?", (collection, entry_id))
+                cur = self._conn.execute(
+                    "INSERT INTO entries (collection, id, email, created_at, metadata) VALUES (?, ?, ?, ?, '{}')",
+                    (collection, entry_id, metadata.get("email"), metadata.get("created_at")),
+                )
+                seq = cur.lastrowid
+                self._conn.execute(
+                    "UPDATE entries SET metadata = ? WHERE seq = ?",
+                    (json.dumps({**metadata, "seq": seq}), seq),
+                )
+                seqs.append(seq)
+            self._conn.commit()
+        return seqs
+
+    def restore(self, collection: str, ids: list, metadatas: list):
+        """Put rows back under the seq stored in their metadata (after a failed overwrite)."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (seq, collection, id, email, created_at, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    ((meta or {}).get("seq"), collection, entry_id, (meta or {}).get("email"),
+                     (meta or {}).get("created_at"), json.dumps(meta or {}))
+                    for entry_id, meta in zip(ids, metadatas)
+                ],
+            )
+            self._conn.commit()
+
+    def update_metadata(self, collection: str, entry_id: str, metadata: dict):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET metadata = ?, email = ? WHERE collection = ? AND id = ?",
+                (json.dumps(metadata), metadata.get("email"), collection, entry_id),
+            )
+            self._conn.commit()
+
+    def remove(self, collection: str, entry_ids: list):
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM entries WHERE collection = ? AND id = ?",
+                [(collection, entry_id) for entry_id in entry_ids],
+            )
+            self._conn.commit()
+
+    def _fetch_one(self, sql: str, params: tuple):
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[1])
+
+    def latest(self, collection: str):
+        return self._fetch_one(
+            "SELECT seq, metadata FROM entries WHERE collection = ? ORDER BY seq DESC LIMIT 1",
+            (collection,),
+        )
+
+    def by_id(self, collection: str, entry_id: str):
+        return self._fetch_one(
+            "SELECT seq, metadata FROM entries WHERE collection = ? AND id = ?",
+            (collection, entry_id),
+        )
+
+    def by_ids(self, collection: str, entry_ids: list) -> dict:
+        """{id: metadata} for the ids that exist."""
+        found = {}
+        with self._lock:
+            for start in range(0, len(entry_ids), 500):
+                chunk = entry_ids[start:start + 500]
+                rows = self._conn.execute(
+                    f"SELECT id, metadata FROM entries WHERE collection = ? AND id IN ({','.join('?' * len(chunk))})",
+                    (collection, *chunk),
+                ).fetchall()
+                found.update((entry_id, json.loads(metadata)) for entry_id, metadata in rows)
+        return found
+
+    def by_email(self, collection: str, email: str):
+        """Most recent row for this email."""
+        return self._fetch_one(
+            "SELECT seq, metadata FROM entries WHERE collection = ? AND email = ? ORDER BY seq DESC LIMIT 1",
+            (collection, email),
+        )
+
+    def latest_id(self, collection: str):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id FROM entries WHERE collection = ? ORDER BY seq DESC LIMIT 1", (collection,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def stale_ids(self, collection: str, created_before: str, positions: list = ()) -> list:
+        """(id, created_at) of rows created before `created_before` (ISO) or belonging to one of `positions`."""
+        positions = list(positions)
+        marks = ",".join("?" * len(positions)) or "NULL"
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT id, created_at FROM entries WHERE collection = ? AND "
+                f"(created_at < ? OR json_extract(metadata, '$.position') IN ({marks})) ORDER BY seq",
+                (collection, created_before, *positions),
+            ).fetchall()
+
+    def max_seq(self, collection: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(MAX(seq), 0) FROM entries WHERE collection = ?", (collection,)
+            ).fetchone()[0]
+
+    def count(self, collection: str) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE collection = ?", (collection,)
+            ).fetchone()[0]
+
+    def rebuild(self, collection: str, ids: list, metadatas: list):
+        """Replace the index for one collection, ordering rows by their stored seq when present."""
+        rows = sorted(
+            zip(ids, metadatas),
+            key=lambda row: (row[1] or {}).get("seq", 0),
+        )
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE collection = ?", (collection,))
+            self._conn.executemany(
+                "INSERT INTO entries (collection, id, email, created_at, metadata) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (collection, entry_id, (meta or {}).get("email"), (meta or {}).get("created_at"),
+                     json.dumps(meta or {}))
+                    for entry_id, meta in rows
+                ],
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
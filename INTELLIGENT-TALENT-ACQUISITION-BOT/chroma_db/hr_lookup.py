@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from utils.events import subscribe, HR_CHANGED
+
+LOOKUP_FIELDS = ("email", "recruiter_id", "company")
+HR_LOOKUP_MISS_SECONDS = float(os.getenv("HR_LOOKUP_MISS_SECONDS", "30"))  # how long a miss skips the fallback
+
+
+def normalize_value(value) -> str:
+    # Emails and company names are matched case-insensitively, ignoring stray whitespace
+    return str(value).strip().casefold() if value is not None else ""
+
+
+# -------------------------
+# #️⃣ Exact-match HR lookups
+# -------------------------
+class HRLookup:
+    """Hash index over HR entries by email, recruiter_id and company: O(1) exact lookups.
+
+    Maps each normalised field value to the matching hr ids, newest last, plus
+    hr id -> metadata. It is loaded once from hr_collection and kept current by
+    save_hr_to_db through `add`. Any HR change without an hr_id (closing a
+    position, compaction) resets it. A miss falls back to a Chroma `where`
+    filter, which also sees rows written by another process such as
+    seed_data. Values that are still missing are remembered for `miss_ttl`
+    seconds or until the next write here, so another process's insert is
+    found within that window.
+
+    `fetch_fn(where)` returns [(hr_id, metadata), ...] for a Chroma filter, or
+    every row when `where` is None.
+    """
+
+    def __init__(self, fetch_fn, fields: tuple = LOOKUP_FIELDS, miss_ttl: float = HR_LOOKUP_MISS_SECONDS):
+        self.fetch_fn = fetch_fn
+        self.fields = tuple(fields)
+        self.miss_ttl = miss_ttl
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._entries = {}
+        self._by_field = {field: {} for field in self.fields}
+        self._missing = {}  # (field, key) -> monotonic time the miss expires
+        self.hits = 0
+        self.fallbacks = 0
+        subscribe(HR_CHANGED, self._on_hr_changed)
+
+    def _on_hr_changed(self, hr_id: str = None, **_):
+        if hr_id is None:
+            self.invalidate()
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded = False
+            self._entries = {}
+            self._by_field = {field: {} for field in self.fields}
+            self._missing = {}
+
+    def _index(self, hr_id: str, metadata: dict):
+        metadata = dict(metadata or {})
+        previous = self._entries.get(hr_id)
+        if previous is not None:
+            for field in self.fields:
+                ids = self._by_field[field].get(normalize_value(previous.get(field)), [])
+                if hr_id in ids:
+                    ids.remove(hr_id)
+        self._entries[hr_id] = metadata
+        for field in self.fields:
+            key = normalize_value(metadata.get(field))
+            if not key:
+                continue
+            ids = self._by_field[field].setdefault(key, [])
+            ids.append(hr_id)
+            if len(ids) > 1 and metadata.get("seq", 0) < self._entries[ids[-2]].get("seq", 0):
+                ids.sort(key=lambda i: self._entries[i].get("seq", 0))
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            for hr_id, metadata in self.fetch_fn(None):
+                self._index(hr_id, metadata)
+            self._loaded = True
+
+    def add(self, hr_id: str, metadata: dict):
+        with self._lock:
+            if self._loaded:
+                self._index(hr_id, metadata)
+            self._missing = {}
+
+    def find_many(self, field: str, values: list) -> dict:
+        """{value: [metadata, ...] newest first} for many values; misses share one `$in` filter."""
+        if field not in self.fields:
+            raise ValueError(f"{field} is not indexed; use one of {', '.join(self.fields)}")
+        found, misses = {}, []
+        now = time.monotonic()
+        with self._lock:
+            self._ensure_loaded()
+            for value in values:
+                key = normalize_value(value)
+                ids = self._by_field[field].get(key)
+                if ids:
+                    self.hits += 1
+                    found[value] = [dict(self._entries[i]) for i in reversed(ids)]
+                elif key and self._missing.get((field, key), 0) <= now:
+                    self._missing.pop((field, key), None)
+                    misses.append(value)
+                else:
+                    found[value] = []
+
+        if misses:
+            self.fallbacks += 1
+            # Chroma filters are case-sensitive: ask for the value as given and lowercased
+            raw = sorted({variant for value in misses for variant in (str(value).strip(), normalize_value(value))})
+            rows = self.fetch_fn({field: raw[0]} if len(raw) == 1 else {field: {"$in": raw}})
+            with self._lock:
+                for hr_id, metadata in rows:
+                    self._index(hr_id, metadata)
+                for value in misses:
+                    key = normalize_value(value)
+                    ids = self._by_field[field].get(key)
+                    found[value] = [dict(self._entries[i]) for i in reversed(ids)] if ids else []
+                    if not ids:
+                        self._missing[(field, key)] = time.monotonic() + self.miss_ttl
+        return found
+
+    def find(self, field: str, value) -> list:
+        return self.find_many(field, [value])[value]
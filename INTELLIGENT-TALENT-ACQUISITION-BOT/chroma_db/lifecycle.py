@@ -0,0 +1,240 @@
+"""Lifecycle management for the Chroma store: close positions, archive stale applicants, compact the hot index.
+
+The hot collections in db_handler only hold open positions and recent
+applicants. Older rows move to per-period archive collections in the same
+store (or to compressed Parquet snapshots) with their stored embeddings, so
+nothing is re-embedded. Chroma never shrinks its HNSW files on delete, so
+`compact` rebuilds each hot collection from its live rows.
+
+Run compaction while the app is idle: writes landing mid-copy are lost.
+A running app keeps working: its collection handles re-resolve a rebuilt
+collection by name, and `db_handler.check_hr_store` notices positions
+closed or compacted from here and refreshes the app's HR caches.
+
+    python -m chroma_db.lifecycle close --position "Data Scientist"
+    python -m chroma_db.lifecycle archive --older-than-days 365 [--format parquet]
+    python -m chroma_db.lifecycle compact
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from chroma_db import db_handler
+from utils.events import publish, HR_CHANGED, APPLICANT_CHANGED
+
+ARCHIVE_AFTER_DAYS = int(os.getenv("ARCHIVE_AFTER_DAYS", "365"))
+ARCHIVE_DIR = os.getenv("ARCHIVE_DIR", "data/archive")
+LIFECYCLE_BATCH = int(os.getenv("LIFECYCLE_BATCH", "1000"))
+HR_ARCHIVE = "hr_archive"
+APPLICANT_ARCHIVE_PREFIX = "applicant_archive_"
+ROW_FIELDS = ["documents", "metadatas", "embeddings"]
+
+
+def period_of(created_at: str) -> str:
+    """Archive period for an ISO timestamp, e.g. "2024q3"."""
+    if not created_at:
+        return "undated"
+    return f"{created_at[:4]}q{(int(created_at[5:7]) - 1) // 3 + 1}"
+
+
+def _rows(collection, **query) -> dict:
+    # Stored embeddings come back as numpy arrays; plain lists go back into add/upsert and Parquet
+    rows = collection.get(include=ROW_FIELDS, **query)
+    rows["embeddings"] = [list(map(float, vector)) for vector in rows["embeddings"]]
+    return rows
+
+
+def _copy(rows: dict, target):
+    if rows["ids"]:
+        target.upsert(ids=rows["ids"], documents=rows["documents"], metadatas=rows["metadatas"],
+                      embeddings=rows["embeddings"])
+
+
+# -------------------------
+# 🔒 Close positions
+# -------------------------
+def close_position(position: str) -> int:
+    """Mark every HR entry for `position` closed and move it to the HR archive collection.
+
+    Its applicants become eligible for `archive_applicants` whatever their age.
+    """
+    hot = db_handler.hr_collection
+    rows = _rows(hot, where={"position": position})
+    if not rows["ids"]:
+        return 0
+    closed_at = datetime.now().isoformat()
+    rows["metadatas"] = [{**meta, "status": "closed", "closed_at": closed_at} for meta in rows["metadatas"]]
+    _copy(rows, db_handler.client.get_or_create_collection(HR_ARCHIVE))
+    hot.delete(ids=rows["ids"])
+    db_handler.entry_index.remove(hot.name, rows["ids"])
+    publish(HR_CHANGED)
+    return len(rows["ids"])
+
+
+def closed_positions() -> list:
+    archive = db_handler.client.get_or_create_collection(HR_ARCHIVE)
+    open_titles = {meta.get("position") for meta in db_handler.hr_collection.get(include=["metadatas"])["metadatas"]}
+    closed = {meta.get("position") for meta in archive.get(include=["metadatas"])["metadatas"]}
+    # A title HR has posted again since closing it is open
+    return sorted(title for title in closed - open_titles if title)
+
+
+# -------------------------
+# 🗄️ Archive stale applicants
+# -------------------------
+def _write_parquet(period: str, rows: dict) -> str:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    directory = os.path.join(ARCHIVE_DIR, "applicants", f"period={period}")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"part-{time.time_ns()}.parquet")
+    table = pa.table({
+        "id": rows["ids"],
+        "document": rows["documents"],
+        "metadata": [json.dumps(meta) for meta in rows["metadatas"]],
+        "embedding": pa.array(rows["embeddings"], type=pa.list_(pa.float32())),
+    })
+    pq.write_table(table, path, compression="zstd")
+    return path
+
+
+def archive_applicants(older_than_days: int = ARCHIVE_AFTER_DAYS, fmt: str = "collection",
+                       positions: list = None) -> dict:
+    """Move applicants created before the cutoff, or who applied to a closed position, out of the hot tier.
+
+    `fmt` is "collection" (per-period `applicant_archive_<period>` collections,
+    still queryable with Chroma) or "parquet" (zstd-compressed snapshots under
+    ARCHIVE_DIR). Their resume chunks are dropped; they can be rebuilt from
+    the archived document. Returns {period: archived count}.
+    """
+    hot = db_handler.applicant_collection
+    cutoff = (datetime.now() - timedelta(days=older_than_days)).isoformat()
+    positions = closed_positions() if positions is None else positions
+    stale = db_handler.entry_index.stale_ids(hot.name, cutoff, positions)
+
+    by_period = {}
+    for app_id, created_at in stale:
+        by_period.setdefault(period_of(created_at), []).append(app_id)
+
+    archived = {}
+    for period, app_ids in sorted(by_period.items()):
+        for start in range(0, len(app_ids), LIFECYCLE_BATCH):
+            batch = app_ids[start:start + LIFECYCLE_BATCH]
+            rows = _rows(hot, ids=batch)
+            if fmt == "parquet":
+                _write_parquet(period, rows)
+            else:
+                _copy(rows, db_handler.client.get_or_create_collection(APPLICANT_ARCHIVE_PREFIX + period))
+            # Only delete from the hot tier once the archive copy is written
+            hot.delete(ids=batch)
+            db_handler.resume_chunk_collection.delete(where={"parent_id": {"$in": batch}})
+            db_handler.entry_index.remove(hot.name, batch)
+            archived[period] = archived.get(period, 0) + len(batch)
+
+    if archived:
+        publish(APPLICANT_CHANGED, app_ids=[app_id for app_id, _ in stale])
+    return archived
+
+
+def archived_collections() -> list:
+    return sorted(c.name for c in db_handler.client.list_collections()
+                  if c.name.startswith(APPLICANT_ARCHIVE_PREFIX))
+
+
+# -------------------------
+# 🧹 Compaction
+# -------------------------
+def _rebuild(name: str):
+    # Finishes an interrupted rename first, so a staging copy still around below is a partial one
+    old = db_handler.open_collection(name)
+    staging = name + db_handler.COMPACTING_SUFFIX
+    if staging in {c.name for c in db_handler.client.list_collections()}:
+        db_handler.client.delete_collection(staging)  # partial copy from an interrupted run; `name` has the rows
+    fresh = db_handler.client.create_collection(staging, metadata=old.metadata)
+    for offset in range(0, old.count(), LIFECYCLE_BATCH):
+        _copy(_rows(old, limit=LIFECYCLE_BATCH, offset=offset), fresh)
+    db_handler.client.delete_collection(name)
+    fresh.modify(name=name)
+    return fresh
+
+
+def compact() -> dict:
+    """Rebuild the hot collections from their live rows, then reclaim free pages in Chroma's SQLite file.
+
+    Returns {collection: rows} for the rebuilt collections.
+    """
+    rebuilt = {}
+    for attr in ("hr_collection", "applicant_collection", "resume_chunk_collection"):
+        handle = getattr(db_handler, attr)
+        handle.rebind(_rebuild(handle.name))  # handles in other processes re-resolve on their next call
+        rebuilt[handle.name] = handle.count()
+
+    try:
+        conn = sqlite3.connect(os.path.join(db_handler.DB_PATH, "chroma.sqlite3"))
+        conn.execute("VACUUM")
+        conn.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not vacuum the Chroma database: {e}")
+    publish(HR_CHANGED)
+    return rebuilt
+
+
+def store_size(path: str = None) -> int:
+    """Bytes on disk under the Chroma directory (hot and archive collections together)."""
+    path = path or db_handler.DB_PATH
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def index_sizes() -> dict:
+    """Bytes of each collection's HNSW files, by collection name (read from Chroma's segment catalog)."""
+    conn = sqlite3.connect(f"file:{os.path.join(db_handler.DB_PATH, 'chroma.sqlite3')}?mode=ro", uri=True)
+    try:
+        segments = conn.execute(
+            "SELECT c.name, s.id FROM segments s JOIN collections c ON c.id = s.collection WHERE s.scope = 'VECTOR'"
+        ).fetchall()
+    finally:
+        conn.close()
+    sizes = {}
+    for name, segment_id in segments:
+        directory = os.path.join(db_handler.DB_PATH, segment_id)
+        if os.path.isdir(directory):
+            sizes[name] = sizes.get(name, 0) + store_size(directory)
+    return sizes
+
+
+# -------------------------
+# 🧰 CLI
+# -------------------------
+def main():
+    parser = argparse.ArgumentParser(description="Close positions, archive stale applicants and compact the store.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    close = commands.add_parser("close", help="Mark a position closed and archive its HR entries")
+    close.add_argument("--position", required=True, help="Position title as entered by HR")
+    archive = commands.add_parser("archive", help="Move stale applicants to the archive tier")
+    archive.add_argument("--older-than-days", type=int, default=ARCHIVE_AFTER_DAYS)
+    archive.add_argument("--format", choices=["collection", "parquet"], default="collection")
+    commands.add_parser("compact", help="Rebuild the hot collections' indexes")
+    args = parser.parse_args()
+
+    before = store_size()
+    hot_before = index_sizes().get(db_handler.applicant_collection.name, 0)
+    if args.command == "close":
+        print(f"🔒 Closed {close_position(args.position)} HR entries for {args.position}")
+    elif args.command == "archive":
+        archived = archive_applicants(args.older_than_days, args.format)
+        for period, count in archived.items():
+            print(f"🗄️ {period}: {count} applicants")
+        print(f"✅ Archived {sum(archived.values())} applicants ({args.format})")
+    else:
+        for name, count in compact().items():
+            print(f"🧹 {name}: {count} rows")
+    hot_after = index_sizes().get(db_handler.applicant_collection.name, 0)
+    print(f"💾 Store size {before / 1e6:.1f} MB -> {store_size() / 1e6:.1f} MB; "
+          f"applicant index {hot_before / 1e6:.1f} MB -> {hot_after / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
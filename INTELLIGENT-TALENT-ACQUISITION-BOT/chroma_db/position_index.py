@@ -0,0 +1,184 @@
+import os
+import threading
+import numpy as np
+from utils.events import subscribe, HR_CHANGED
+from utils.resume_scoring import KNOWN_SKILLS, tokenize
+
+CHAT_RETRIEVAL_K = int(os.getenv("CHAT_RETRIEVAL_K", "3"))
+CHAT_RETRIEVAL_MIN_SCORE = float(os.getenv("CHAT_RETRIEVAL_MIN_SCORE", "0.25"))  # below this, nothing is injected
+SUMMARY_SKILLS = 6
+
+
+def _default_embed(texts: list) -> list:
+    from chroma_db.embeddings import embedder
+    return embedder.embed(texts)
+
+
+def _load_hr_rows(ids: list = None) -> dict:
+    from chroma_db import db_handler
+    query = {"ids": ids} if ids else {}
+    return db_handler.hr_collection.get(include=["metadatas", "documents", "embeddings"], **query)
+
+
+def _check_hr_store():
+    # Throttled count/seq check; publishes HR_CHANGED for writes made by another process
+    from chroma_db import db_handler
+    db_handler.check_hr_store()
+
+
+def opening_key(metadata: dict):
+    """(title, contact) identifying one opening, as entry_id does; None for rows without a title."""
+    metadata = metadata or {}
+    title = (metadata.get("position") or "").strip().casefold()
+    if not title:
+        return None
+    contact = metadata.get("email") or metadata.get("company") or ""
+    return title, contact.strip().casefold()
+
+
+def position_summary(metadata: dict, document: str = "") -> str:
+    """One line per opening, e.g. "Data Scientist at Acme | 2+ yrs | python, sql, pandas | contact hr@acme.com"."""
+    metadata = metadata or {}
+    tokens = tokenize(f"{metadata.get('job_description', '')} {document}")
+    skills = []
+    for term in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+        if term in KNOWN_SKILLS and term not in skills:
+            skills.append(term)
+    parts = [f"{metadata.get('position') or 'Untitled role'}"
+             + (f" at {metadata['company']}" if metadata.get("company") else "")]
+    if metadata.get("min_yoe"):
+        parts.append(f"{metadata['min_yoe']}+ yrs")
+    if skills:
+        parts.append(", ".join(skills[:SUMMARY_SKILLS]))
+    if metadata.get("email"):
+        parts.append(f"contact {metadata['email']}")
+    return " | ".join(parts)
+
+
+# -------------------------
+# 🔎 Per-position summary index
+# -------------------------
+class PositionIndex:
+    """A compact summary and a unit vector for every opening, newest HR entry per opening.
+
+    An opening is a title at one recruiter (`opening_key`), so the same title
+    posted by two companies gives two rows.
+
+    Built from hr_collection's stored embeddings, so nothing is re-embedded.
+    A save_hr_to_db (HR_CHANGED with an hr_id) updates one row on the next
+    lookup; any other HR change (closing, compaction) triggers a full rebuild.
+    `check_fn` runs before each refresh to catch writes from other processes
+    (seed_data, bulk_ingest, the lifecycle CLI), which publish no event here.
+    Top-k is one matrix-vector product over all positions.
+    """
+
+    def __init__(self, embed_fn=_default_embed, load_fn=_load_hr_rows, check_fn=_check_hr_store):
+        self.embed_fn = embed_fn
+        self.load_fn = load_fn
+        self.check_fn = check_fn
+        self._lock = threading.Lock()
+        self._keys = []
+        self._rows = {}  # opening key -> row in _matrix
+        self._summaries = []
+        self._seqs = []
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._pending = []
+        self._stale = True
+        self.rebuilds = 0
+        self.updates = 0
+        subscribe(HR_CHANGED, self._on_hr_changed)
+
+    def _on_hr_changed(self, hr_id: str = None, **_):
+        with self._lock:
+            if hr_id:
+                self._pending.append(hr_id)
+            else:
+                self._stale = True
+
+    @staticmethod
+    def _unit(vectors) -> np.ndarray:
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    def _rebuild(self):
+        rows = self.load_fn()
+        newest = {}
+        for i, meta in enumerate(rows["metadatas"]):
+            key = opening_key(meta)
+            if key and (key not in newest or meta.get("seq", 0) >= rows["metadatas"][newest[key]].get("seq", 0)):
+                newest[key] = i
+        order = list(newest.values())
+        self._keys = list(newest)
+        self._rows = {key: row for row, key in enumerate(self._keys)}
+        self._summaries = [position_summary(rows["metadatas"][i], rows["documents"][i]) for i in order]
+        self._seqs = [rows["metadatas"][i].get("seq", 0) for i in order]
+        self._matrix = self._unit([rows["embeddings"][i] for i in order]) if order else np.zeros((0, 0), np.float32)
+        self._stale = False
+        self._pending = []
+        self.rebuilds += 1
+
+    def _apply(self, hr_ids: list):
+        rows = self.load_fn(hr_ids)
+        for meta, document, vector in zip(rows["metadatas"], rows["documents"], rows["embeddings"]):
+            key = opening_key(meta)
+            if not key:
+                continue
+            vector = self._unit([vector])
+            summary = position_summary(meta, document)
+            if key in self._rows:
+                row = self._rows[key]
+                if meta.get("seq", 0) < self._seqs[row]:
+                    continue
+                self._summaries[row], self._seqs[row], self._matrix[row] = summary, meta.get("seq", 0), vector[0]
+            else:
+                self._rows[key] = len(self._keys)
+                self._keys.append(key)
+                self._summaries.append(summary)
+                self._seqs.append(meta.get("seq", 0))
+                self._matrix = vector if not len(self._matrix) else np.vstack([self._matrix, vector])
+        self.updates += 1
+
+    def refresh(self):
+        if self.check_fn is not None:
+            self.check_fn()  # may mark the index stale through HR_CHANGED
+        with self._lock:
+            if self._stale:
+                self._rebuild()
+            elif self._pending:
+                pending, self._pending = self._pending, []
+                self._apply(pending)
+
+    def retrieve(self, question: str, k: int = CHAT_RETRIEVAL_K, min_score: float = CHAT_RETRIEVAL_MIN_SCORE) -> list:
+        """[(score, summary), ...] for the k positions closest to the question, best first."""
+        self.refresh()
+        with self._lock:
+            matrix, summaries = self._matrix, list(self._summaries)
+        if not summaries or not question.strip():
+            return []
+        query = self._unit([self.embed_fn([question])[0]])[0]
+        scores = matrix @ query
+        k = min(k, len(summaries))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(float(scores[i]), summaries[i]) for i in top if scores[i] >= min_score]
+
+    def __len__(self):
+        self.refresh()
+        return len(self._keys)
+
+
+position_index = PositionIndex()
+
+
+def position_context(question: str, index: PositionIndex = None) -> str:
+    """Prompt block listing the openings relevant to the question, or "" when none are."""
+    try:
+        hits = (index or position_index).retrieve(question)
+    except Exception as e:
+        print(f"⚠️ Position retrieval failed: {e}")
+        return ""
+    if not hits:
+        return ""
+    return ("Open positions relevant to the question (answer only from these):\n"
+            + "\n".join(f"- {summary}" for _, summary in hits) + "\n")
@@ -1,10 +1,4 @@
-import chromadb
-from chromadb.utils import embedding_functions
-import os
-
-client = chromadb.PersistentClient(path="./chroma_db/hr_data")
-
-collection = client.get_or_create_collection("hr_collection")
+from chroma_db import db_handler
 
 # Example HR entries
 dummy_hrs = [
@@ -32,20 +26,17 @@ dummy_hrs = [
 ]
 
 def seed_hr_data():
-    for idx, hr in enumerate(dummy_hrs):
-        doc_id = f"hr_{idx}"
-        metadata = {
-            "name": hr["name"],
-            "recruiter_id": hr["recruiter_id"],
-            "email": hr["email"],
-            "company": hr["company"],
-            "position": hr["position"]
-        }
-
-        content = f"{hr['name']} from {hr['company']} is hiring for {hr['position']}."
-        collection.add(documents=[content], metadatas=[metadata], ids=[doc_id])
+    # Ids are derived from email + position, so running the seed again updates the same rows
+    rows = [{
+        "name": hr["name"],
+        "recruiter_id": hr["recruiter_id"],
+        "email": hr["email"],
+        "company": hr["company"],
+        "position": hr["position"]
+    } for hr in dummy_hrs]
+    db_handler.save_hr_batch(rows)
 
-    print("✅ Dummy HRs seeded to ChromaDB.")
+    print(f"✅ Dummy HRs seeded to ChromaDB ({db_handler.hr_collection.count()} HR entries).")
 
 if __name__ == "__main__":
     seed_hr_data()
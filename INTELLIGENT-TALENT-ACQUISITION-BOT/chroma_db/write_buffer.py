@@ -0,0 +1,125 @@
+import atexit
+import os
+import threading
+import time
+
+WRITE_BATCH_ROWS = int(os.getenv("WRITE_BATCH_ROWS", "256"))
+WRITE_FLUSH_SECONDS = float(os.getenv("WRITE_FLUSH_SECONDS", "0.05"))  # longest a buffered row waits
+
+
+class WriteTicket:
+    """Completion handle for one buffered row."""
+
+    def __init__(self):
+        self._done = threading.Event()
+        self.error = None
+
+    def _finish(self, error: Exception = None):
+        self.error = error
+        self._done.set()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the row's batch is written; re-raises the batch's error."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("Buffered write was not flushed in time")
+        if self.error is not None:
+            raise self.error
+        return True
+
+
+# -------------------------
+# 🧺 Coalescing write buffer
+# -------------------------
+class WriteBuffer:
+    """Coalesces single-row writes into one bulk upsert per collection.
+
+    Rows are keyed by id: writing an id again before a flush replaces the
+    pending version, so only the last one is embedded and written. A
+    collection's rows are flushed when `max_rows` are pending, when the
+    oldest has waited `max_seconds` (background thread), on `flush()` and at
+    exit. Flushes are serialised so a later version of a row never lands
+    before an earlier one.
+
+    `write_fn(collection, ids, documents, metadatas)` performs the upsert.
+    """
+
+    def __init__(self, write_fn, max_rows: int = WRITE_BATCH_ROWS, max_seconds: float = WRITE_FLUSH_SECONDS):
+        self.write_fn = write_fn
+        self.max_rows = max_rows
+        self.max_seconds = max_seconds
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._write_lock = threading.Lock()
+        self._pending = {}  # collection name -> {id: (document, metadata, [tickets])}
+        self._collections = {}
+        self._since = {}  # collection name -> monotonic time of its oldest pending row
+        self._flusher = None
+        self.flushes = 0
+        self.rows_written = 0
+        self.coalesced = 0
+        atexit.register(self.flush)
+
+    def put(self, collection, entry_id: str, document: str, metadata: dict) -> WriteTicket:
+        ticket = WriteTicket()
+        with self._lock:
+            rows = self._pending.setdefault(collection.name, {})
+            tickets = [ticket]
+            if entry_id in rows:
+                tickets = rows.pop(entry_id)[2] + tickets
+                self.coalesced += 1
+            rows[entry_id] = (document, metadata, tickets)
+            self._collections[collection.name] = collection
+            self._since.setdefault(collection.name, time.monotonic())
+            full = len(rows) >= self.max_rows
+            if not full:
+                self._start_flusher()
+                self._wake.notify()
+        if full:
+            self.flush(collection.name)
+        return ticket
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(rows) for rows in self._pending.values())
+
+    def flush(self, name: str = None) -> int:
+        """Write the pending rows of one collection (or all); returns how many were written."""
+        written = 0
+        with self._write_lock:
+            with self._lock:
+                names = [name] if name else list(self._pending)
+                batches = [(self._collections[n], self._pending.pop(n)) for n in names if self._pending.get(n)]
+                for n in names:
+                    self._since.pop(n, None)
+            for collection, rows in batches:
+                error = None
+                try:
+                    self.write_fn(collection, list(rows), [doc for doc, _, _ in rows.values()],
+                                  [meta for _, meta, _ in rows.values()])
+                    written += len(rows)
+                except Exception as e:
+                    print(f"❌ Buffered write to {collection.name} failed ({len(rows)} rows): {e}")
+                    error = e
+                with self._lock:
+                    self.flushes += 1
+                    self.rows_written += len(rows) if error is None else 0
+                for _, _, tickets in rows.values():
+                    for ticket in tickets:
+                        ticket._finish(error)
+        return written
+
+    def _start_flusher(self):
+        if self._flusher is None:
+            self._flusher = threading.Thread(target=self._run, name="write-buffer", daemon=True)
+            self._flusher.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._since:
+                    self._wake.wait()
+                delay = min(self._since.values()) + self.max_seconds - time.monotonic()
+                if delay > 0:
+                    self._wake.wait(delay)
+                    continue
+            self.flush()
@@ -0,0 +1,286 @@
+import os
+import queue
+import smtplib
+import sqlite3
+import threading
+import time
+import uuid
+
+OUTBOX_PATH = os.getenv("OUTBOX_PATH", "data/outbox.sqlite3")
+POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "2"))
+BATCH_SIZE = int(os.getenv("SMTP_BATCH_SIZE", "50"))
+MAX_ATTEMPTS = int(os.getenv("SMTP_MAX_ATTEMPTS", "5"))
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 300.0
+IDLE_POLL_SECONDS = 1.0
+# A claimed batch older than this is presumed abandoned by a dead process and goes back in the queue
+CLAIM_LEASE_SECONDS = float(os.getenv("SMTP_CLAIM_LEASE_SECONDS", "600"))
+
+
+# -------------------------
+# 🔌 Authenticated SMTP connection pool
+# -------------------------
+class SMTPConnectionPool:
+    """Keeps up to `size` logged-in SMTP sessions open and hands them out one at a time."""
+
+    def __init__(self, host: str, port: int, username: str = None, password: str = None,
+                 starttls: bool = True, size: int = POOL_SIZE, timeout: float = 30):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._slots = threading.Semaphore(size)
+        self.connects = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.starttls:
+            conn.starttls()
+        if self.username and self.password:
+            conn.login(self.username, self.password)
+        self.connects += 1
+        return conn
+
+    def acquire(self) -> smtplib.SMTP:
+        self._slots.acquire()
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+        if conn is not None:
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._quit(conn)
+        try:
+            return self._connect()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: smtplib.SMTP, broken: bool = False):
+        if broken:
+            self._quit(conn)
+        else:
+            self._idle.put_nowait(conn)
+        self._slots.release()
+
+    def _quit(self, conn):
+        try:
+            conn.quit()
+        except Exception:
+            conn.close()
+
+    def close(self):
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+# -------------------------
+# 📮 Durable outbound queue
+# -------------------------
+class MailQueue:
+    """SQLite-backed outbox drained by a background thread over a pooled SMTP connection.
+
+    Messages are sent in batches on a single connection; failures are retried
+    with exponential backoff until MAX_ATTEMPTS, then marked 'failed'.
+    Several processes may share one outbox: a batch is claimed atomically
+    under a lease, and only claims whose lease has expired are taken back.
+    """
+
+    def __init__(self, pool: SMTPConnectionPool, sender: str, path: str = OUTBOX_PATH,
+                 batch_size: int = BATCH_SIZE, max_attempts: int = MAX_ATTEMPTS,
+                 lease_seconds: float = CLAIM_LEASE_SECONDS):
+        self.pool = pool
+        self.sender = sender
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS outbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                recipient TEXT NOT NULL,
+                message TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                sent_at REAL,
+                claimed_by TEXT,
+                claimed_at REAL
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(outbox)")}
+        if "claimed_by" not in columns:  # outboxes created before claims were leased
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN claimed_by TEXT")
+            self._conn.execute("ALTER TABLE outbox ADD COLUMN claimed_at REAL")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_outbox_due ON outbox (status, next_attempt_at)")
+        self._conn.commit()
+        self._requeue_expired()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._worker = None
+
+    def enqueue(self, recipient: str, message: str) -> int:
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "INSERT INTO outbox (recipient, message, next_attempt_at, created_at) VALUES (?, ?, ?, ?)",
+                (recipient, message, now, now),
+            )
+            self._conn.commit()
+        self.start()
+        self._wakeup.set()
+        return cur.lastrowid
+
+    def _requeue_expired(self):
+        # Batches claimed by a process that died mid-send; live claims are left alone
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = 'queued', claimed_by = NULL WHERE status = 'sending' AND claimed_at < ?",
+                (time.time() - self.lease_seconds,),
+            )
+            self._conn.commit()
+
+    def _claim_batch(self) -> list:
+        now = time.time()
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so two processes never claim the same rows
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "UPDATE outbox SET status = 'queued', claimed_by = NULL WHERE status = 'sending' AND claimed_at < ?",
+                    (now - self.lease_seconds,),
+                )
+                rows = self._conn.execute(
+                    "UPDATE outbox SET status = 'sending', claimed_by = ?, claimed_at = ? "
+                    "WHERE status = 'queued' AND id IN (SELECT id FROM outbox "
+                    "WHERE status = 'queued' AND next_attempt_at <= ? ORDER BY id LIMIT ?) "
+                    "RETURNING id, recipient, message, attempts",
+                    (self.owner, now, now, self.batch_size),
+                ).fetchall()
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        return sorted(rows)
+
+    def _mark_sent(self, ids: list):
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET status = 'sent', sent_at = ?, claimed_by = NULL WHERE id = ?",
+                [(time.time(), i) for i in ids],
+            )
+            self._conn.commit()
+
+    def _mark_failed(self, msg_id: int, attempts: int, error: str):
+        attempts += 1
+        if attempts >= self.max_attempts:
+            status, next_at = "failed", time.time()
+        else:
+            delay = min(BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)), BACKOFF_MAX_SECONDS)
+            status, next_at = "queued", time.time() + delay
+        with self._lock:
+            self._conn.execute(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, last_error = ?, claimed_by = NULL "
+                "WHERE id = ? AND claimed_by = ?",
+                (status, attempts, next_at, error, msg_id, self.owner),
+            )
+            self._conn.commit()
+
+    def _release_claimed(self, ids: list):
+        # Rows of an aborted batch that were neither sent nor marked failed
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE outbox SET status = 'queued', claimed_by = NULL "
+                "WHERE id = ? AND status = 'sending' AND claimed_by = ?",
+                [(i, self.owner) for i in ids],
+            )
+            self._conn.commit()
+
+    def drain_once(self) -> int:
+        """Send one batch over a single pooled connection. Returns how many were sent."""
+        batch = self._claim_batch()
+        if not batch:
+            return 0
+        try:
+            conn = self.pool.acquire()
+        except Exception as e:
+            for msg_id, _, _, attempts in batch:
+                self._mark_failed(msg_id, attempts, f"connect: {e}")
+            return 0
+
+        sent, broken = [], False
+        try:
+            for msg_id, recipient, message, attempts in batch:
+                if broken:
+                    self._mark_failed(msg_id, attempts, "connection lost earlier in batch")
+                    continue
+                try:
+                    conn.sendmail(self.sender, recipient, message)
+                    sent.append(msg_id)
+                except (smtplib.SMTPServerDisconnected, OSError) as e:
+                    broken = True
+                    self._mark_failed(msg_id, attempts, str(e))
+                except Exception as e:
+                    # SMTPException or a bad message (e.g. an encoding error); the connection is still usable
+                    self._mark_failed(msg_id, attempts, f"{type(e).__name__}: {e}")
+        finally:
+            # Always give the slot back and settle the batch, even if bookkeeping itself failed
+            self.pool.release(conn, broken=broken)
+            self._mark_sent(sent)
+            self._release_claimed([msg_id for msg_id, _, _, _ in batch])
+        return len(sent)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                drained = self.drain_once()
+            except Exception as e:
+                print(f"❌ Mail queue drain failed: {e}")
+                drained = 0
+            if drained == 0:
+                self._wakeup.wait(IDLE_POLL_SECONDS)
+                self._wakeup.clear()
+
+    def start(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._stop.clear()
+                self._worker = threading.Thread(target=self._run, name="mail-queue", daemon=True)
+                self._worker.start()
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        self._wakeup.set()
+        if self._worker:
+            self._worker.join(timeout)
+        self.pool.close()
+
+    def status(self, msg_id: int):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, attempts, last_error FROM outbox WHERE id = ?", (msg_id,)
+            ).fetchone()
+        return {"status": row[0], "attempts": row[1], "last_error": row[2]} if row else None
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall()
+        return dict(rows)
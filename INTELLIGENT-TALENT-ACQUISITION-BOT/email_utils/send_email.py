@@ -3,40 +3,77 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
 import os
+import threading
+from email_utils.mail_queue import MailQueue, SMTPConnectionPool
 
 # Gmail SMTP Configuration
-SMTP_SERVER = 'smtp.gmail.com'
-SMTP_PORT = 587
+SMTP_SERVER = os.getenv("SMTP_SERVER", 'smtp.gmail.com')
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+SMTP_STARTTLS = os.getenv("SMTP_STARTTLS", "1") == "1"
 EMAIL_SENDER = os.getenv("EMAIL_SENDER")
 EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
 
+_mail_queue = None
+_mail_queue_lock = threading.Lock()
 
-def send_email(recipient: str, subject: str, html_content: str, attachments: list = None):
+
+def get_mail_queue() -> MailQueue:
+    """Process-wide outbox; its worker thread starts on the first enqueue."""
+    global _mail_queue
+    with _mail_queue_lock:
+        if _mail_queue is None:
+            pool = SMTPConnectionPool(SMTP_SERVER, SMTP_PORT, EMAIL_SENDER, EMAIL_PASSWORD, starttls=SMTP_STARTTLS)
+            _mail_queue = MailQueue(pool, EMAIL_SENDER)
+        return _mail_queue
+
+
+def build_message(recipient: str, subject: str, html_content: str, attachments: list = None,
+                  subtype: str = "mixed") -> str:
+    message = MIMEMultipart(subtype)
+    message['From'] = EMAIL_SENDER
+    message['To'] = recipient
+    message['Subject'] = subject
+
+    message.attach(MIMEText(html_content, 'html'))
+
+    # Attach files if any
+    if attachments:
+        for file_path in attachments:
+            with open(file_path, 'rb') as f:
+                part = MIMEApplication(f.read(), Name=os.path.basename(file_path))
+                part['Content-Disposition'] = f'attachment; filename="{os.path.basename(file_path)}"'
+                message.attach(part)
+    return message.as_string()
+
+
+def send_email(recipient: str, subject: str, html_content: str, attachments: list = None) -> bool:
+    """Queue the message for the background sender; returns once it is stored in the outbox."""
     try:
-        message = MIMEMultipart()
-        message['From'] = EMAIL_SENDER
-        message['To'] = recipient
-        message['Subject'] = subject
+        msg_id = get_mail_queue().enqueue(recipient, build_message(recipient, subject, html_content, attachments))
+        print(f"📮 Email to {recipient} queued (#{msg_id})")
+        return True
 
-        message.attach(MIMEText(html_content, 'html'))
+    except Exception as e:
+        print(f"❌ Failed to queue email to {recipient}: {e}")
+        return False
 
-        # Attach files if any
-        if attachments:
-            for file_path in attachments:
-                with open(file_path, 'rb') as f:
-                    part = MIMEApplication(f.read(), Name=os.path.basename(file_path))
-                    part['Content-Disposition'] = f'attachment; filename="{os.path.basename(file_path)}"'
-                    message.attach(part)
 
+def send_email_direct(recipient: str, subject: str, html_content: str, attachments: list = None) -> bool:
+    """Synchronous connect-per-message path (kept for scripts and benchmarking)."""
+    try:
         with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-            server.sendmail(EMAIL_SENDER, recipient, message.as_string())
+            if SMTP_STARTTLS:
+                server.starttls()
+            if EMAIL_SENDER and EMAIL_PASSWORD:
+                server.login(EMAIL_SENDER, EMAIL_PASSWORD)
+            server.sendmail(EMAIL_SENDER, recipient, build_message(recipient, subject, html_content, attachments))
 
         print(f"✅ Email sent successfully to {recipient}")
+        return True
 
     except Exception as e:
         print(f"❌ Failed to send email to {recipient}: {e}")
+        return False
 
 
 # High-level email functions
@@ -49,7 +86,7 @@ def send_email_to_hr(hr_email: str, subject: str, body: str):
         </body>
     </html>
     """
-    send_email(hr_email, subject, html_content)
+    return send_email(hr_email, subject, html_content)
 
 
 def send_email_to_applicant(applicant_email: str, subject: str, body: str):
@@ -60,7 +97,7 @@ def send_email_to_applicant(applicant_email: str, subject: str, body: str):
         </body>
     </html>
     """
-    send_email(applicant_email, subject, html_content)
+    return send_email(applicant_email, subject, html_content)
 
 def send_engagement_email(applicant_email: str, applicant_name: str) -> bool:
     try:
@@ -79,22 +116,12 @@ def send_engagement_email(applicant_email: str, applicant_name: str) -> bool:
         </html>
         """
 
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = EMAIL_SENDER
-        msg["To"] = applicant_email
-
-        mime_text = MIMEText(message, "html")
-        msg.attach(mime_text)
-
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(EMAIL_SENDER, EMAIL_PASSWORD)
-            server.sendmail(EMAIL_SENDER, applicant_email, msg.as_string())
+        msg = build_message(applicant_email, subject, message, subtype="alternative")
+        get_mail_queue().enqueue(applicant_email, msg)
 
-        print(f"✅ Engagement email sent to {applicant_email}")
+        print(f"📮 Engagement email to {applicant_email} queued")
         return True
 
     except Exception as e:
-        print(f"❌ Failed to send engagement email to {applicant_email}. Error: {e}")
+        print(f"❌ Failed to queue engagement email to {applicant_email}. Error: {e}")
         return False
@@ -0,0 +1,99 @@
+import threading
+import time
+from langchain.llms import Ollama
+from llm_utils.ollama_client import OllamaClient, OLLAMA_BASE_URL, OLLAMA_MODEL, OLLAMA_KEEP_ALIVE
+
+# Per-mode generation settings. Every mode shares the same model weights on the
+# Ollama side; only the client-side options differ.
+MODE_CONFIGS = {
+    "default": {"temperature": 0.3},
+    "chat": {"temperature": 0.7},
+    "screening": {"temperature": 0.1},
+    "engagement": {"temperature": 0.5},
+    "scheduling": {"temperature": 0.2},
+    "custom": {"temperature": 0.3},
+}
+
+
+def get_mode_config(mode: str) -> dict:
+    return dict(MODE_CONFIGS.get(mode, MODE_CONFIGS["default"]))
+
+
+# -------------------------
+# 🗂️ Process-wide LLM registry
+# -------------------------
+class LLMRegistry:
+    """Builds each LLM object once per process and hands out the cached instance afterwards."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.construct_seconds = 0.0
+
+    def get_or_create(self, key, factory):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return entry
+            self.misses += 1
+        # Built outside the lock: factories may ask the registry for other entries (an agent needs its LLM)
+        start = time.perf_counter()
+        built = factory()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.construct_seconds += elapsed
+            entry = self._entries.setdefault(key, built)
+        if entry is not built and isinstance(built, OllamaClient):
+            built.close()  # another thread published first; keep a single connection pool
+        return entry
+
+    def get_llm(self, mode: str = "default"):
+        """LangChain Ollama wrapper used by CrewAI agents and LangChain chains."""
+        def build():
+            config = get_mode_config(mode)
+            return Ollama(
+                model=OLLAMA_MODEL,
+                base_url=OLLAMA_BASE_URL,
+                keep_alive=OLLAMA_KEEP_ALIVE,
+                **config,
+            )
+        return self.get_or_create(("llm", mode), build)
+
+    def get_client(self) -> OllamaClient:
+        """Raw HTTP client sharing one keep-alive connection pool across all modes."""
+        return self.get_or_create(("client",), OllamaClient)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "construct_seconds": self.construct_seconds,
+                "entries": len(self._entries),
+            }
+
+    def clear(self):
+        with self._lock:
+            for entry in self._entries.values():
+                if isinstance(entry, OllamaClient):
+                    entry.close()
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.construct_seconds = 0.0
+
+
+registry = LLMRegistry()
+
+
+def get_llm(mode: str = "default"):
+    return registry.get_llm(mode)
+
+
+def get_client() -> OllamaClient:
+    return registry.get_client()
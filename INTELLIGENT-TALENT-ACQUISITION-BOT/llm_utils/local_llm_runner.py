@@ -1,23 +1,34 @@
+import re
 from langchain.llms import Ollama
 from langchain.prompts import PromptTemplate
 from langchain.chains import ConversationChain
 from langchain.agents import initialize_agent, AgentType
+from llm_utils.llm_registry import registry, get_client, get_mode_config
+from llm_utils.response_cache import response_cache
 
-# Load local Mistral model via Ollama
-def load_mistral_7b():
-    llm = Ollama(model="mistral", temperature=0.3)
-    return llm
+# Only modes listed here go through the ReAct agent loop; every other mode is a
+# single templated completion. Values are factories returning LangChain tools.
+MODE_TOOLS = {}
 
-# Initialize LangChain agent
-def create_agent(llm):
-    tools = []
-    agent = initialize_agent(tools, llm, agent_type=AgentType.ZERO_SHOT_REACT_DESCRIPTION, verbose=True)
+# Generation caps and stop sequences for the direct completion path
+MODE_MAX_TOKENS = {"chat": 512, "screening": 400, "engagement": 300, "scheduling": 300}
+DEFAULT_MAX_TOKENS = 512
+MODE_STOP = {"chat": ["\nUser:"]}  # keep the model from writing the user's next turn
+_ROLE_PREFIX = re.compile(r"^\s*(?:bot|assistant|ai|final answer)\s*:\s*", re.IGNORECASE)
+
+# Load local Mistral model via Ollama (shared per mode across the process)
+def load_mistral_7b(mode: str = "default"):
+    return registry.get_llm(mode)
+
+# Initialize LangChain agent (tool-using modes only)
+def create_agent(llm, tools: list = None):
+    agent = initialize_agent(tools or [], llm, agent=AgentType.ZERO_SHOT_REACT_DESCRIPTION, verbose=True)
     return agent
 
 # Define different prompt templates
 def get_prompt_template(mode: str):
     templates = {
-        "chat": "You are a helpful assistant.\n\n{user_input}",
+        "chat": "You are a helpful recruiting assistant. Answer briefly and only mention positions listed in the prompt.\n\n{user_input}",
         "screening": "You're a resume screening assistant.\nEvaluate this:\n\n{user_input}",
         "engagement": "Generate a friendly follow-up to engage the candidate:\n\n{user_input}",
         "scheduling": "Draft a professional scheduling response with the following info:\n\n{user_input}",
@@ -25,15 +36,42 @@ def get_prompt_template(mode: str):
     }
     return templates.get(mode, templates["custom"])
 
+def parse_completion(text: str) -> str:
+    """Strip the role labels and runaway turns small models like to add around a plain answer."""
+    text = _ROLE_PREFIX.sub("", text.strip(), count=1)
+    return re.split(r"\n(?:User|Human):", text, maxsplit=1)[0].strip()
+
+def completion_options(mode: str) -> dict:
+    options = {**get_mode_config(mode), "num_predict": MODE_MAX_TOKENS.get(mode, DEFAULT_MAX_TOKENS)}
+    if mode in MODE_STOP:
+        options["stop"] = MODE_STOP[mode]
+    return options
+
+# One templated completion over the pooled HTTP client, no agent scaffold
+def complete(prompt: str, mode: str = "chat", client=None) -> str:
+    final_prompt = get_prompt_template(mode).format(user_input=prompt)
+    result = (client or get_client()).generate(final_prompt, options=completion_options(mode))
+    return parse_completion(result.get("response", ""))
+
 # Run prompt through the local LLM
-def run_local_llm(prompt: str, mode: str = "chat") -> str:
+# `cache_key` overrides the prompt as the cache key; it must cover everything the answer depends on
+def run_local_llm(prompt: str, mode: str = "chat", cache_key: str = None, use_cache: bool = True) -> str:
+    key = cache_key or prompt
+    if use_cache:
+        cached = response_cache.get(mode, key)
+        if cached is not None:
+            return cached
     try:
-        llm = load_mistral_7b()
-        agent = create_agent(llm)
-        template = get_prompt_template(mode)
-        final_prompt = template.format(user_input=prompt)
-        response = agent.run(final_prompt)
-        return response.strip()
+        if mode in MODE_TOOLS:
+            agent = registry.get_or_create(
+                ("agent", mode), lambda: create_agent(load_mistral_7b(mode), MODE_TOOLS[mode]())
+            )
+            response = agent.run(get_prompt_template(mode).format(user_input=prompt)).strip()
+        else:
+            response = complete(prompt, mode)
+        if use_cache:
+            response_cache.put(mode, key, response)
+        return response
     except Exception as e:
         return f"⚠️ LLM Error: {str(e)}"
 
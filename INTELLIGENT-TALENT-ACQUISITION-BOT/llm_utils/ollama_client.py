@@ -0,0 +1,69 @@
+import json
+import os
+import requests
+from requests.adapters import HTTPAdapter
+
+# Ollama server configuration
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "mistral")
+OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")  # keep model weights loaded between calls
+OLLAMA_TIMEOUT = float(os.getenv("OLLAMA_TIMEOUT", "300"))
+OLLAMA_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "8"))
+
+
+# -------------------------
+# 🔌 Thin HTTP client for the Ollama REST API
+# -------------------------
+class OllamaClient:
+    """Talks to /api/generate over a pooled keep-alive requests.Session."""
+
+    def __init__(self, base_url: str = OLLAMA_BASE_URL, model: str = OLLAMA_MODEL,
+                 pool_size: int = OLLAMA_POOL_SIZE, timeout: float = OLLAMA_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.model = model
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _payload(self, prompt: str, options: dict = None, stream: bool = False, **kwargs) -> dict:
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": dict(options or {}),
+        }
+        payload.update({k: v for k, v in kwargs.items() if v is not None})
+        return payload
+
+    def generate(self, prompt: str, options: dict = None, **kwargs) -> dict:
+        """Blocking completion. Returns Ollama's JSON body ("response", "prompt_eval_count", ...)."""
+        resp = self.session.post(
+            f"{self.base_url}/api/generate",
+            json=self._payload(prompt, options, stream=False, **kwargs),
+            timeout=self.timeout,
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    def stream(self, prompt: str, options: dict = None, **kwargs):
+        """Yields Ollama's NDJSON chunks as they arrive; the last one has done=True and the eval counts."""
+        with self.session.post(
+            f"{self.base_url}/api/generate",
+            json=self._payload(prompt, options, stream=True, **kwargs),
+            timeout=self.timeout,
+            stream=True,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                yield chunk
+                if chunk.get("done"):
+                    break
+
+    def close(self):
+        self.session.close()
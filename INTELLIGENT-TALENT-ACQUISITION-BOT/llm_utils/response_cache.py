@@ -0,0 +1,141 @@
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
+from utils.events import subscribe, HR_CHANGED
+
+MAX_ENTRIES = int(os.getenv("LLM_CACHE_ENTRIES", "512"))
+TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL", "3600"))
+SIMILARITY_THRESHOLD = float(os.getenv("LLM_CACHE_SIMILARITY", "0.92"))
+# Modes where near-duplicate prompts may share an answer. Only within one scope: chat FAQ answers are
+# scoped by the listings they were grounded in, so "is Backend Developer open" and "is Software
+# Engineer open" embed almost identically but never share an answer unless they retrieved the same openings.
+SEMANTIC_MODES = set(filter(None, os.getenv("LLM_CACHE_SEMANTIC_MODES", "chat_faq").split(",")))
+MIN_WORDS = 3  # "why?" or "and then" depend on context, so very short prompts are never cached
+
+
+def normalize_prompt(prompt: str) -> str:
+    text = re.sub(r"\s+", " ", (prompt or "").strip().lower())
+    return text.rstrip("?!. ")
+
+
+def _default_embed(texts: list) -> list:
+    from chroma_db.embeddings import embedder
+    return embedder.embed(texts)
+
+
+# -------------------------
+# 💾 LLM response cache
+# -------------------------
+class ResponseCache:
+    """(mode, scope, normalised prompt) → response, with TTL and LRU eviction.
+
+    For SEMANTIC_MODES an exact miss falls back to cosine similarity over the
+    embeddings of cached prompts with the same mode and scope; `scope` holds
+    whatever else the answer depends on (e.g. a fingerprint of the retrieved
+    listings). Everything is dropped when hr_collection changes, since
+    answers may mention open positions.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = TTL_SECONDS,
+                 similarity_threshold: float = SIMILARITY_THRESHOLD, embed_fn=_default_embed,
+                 semantic_modes: set = SEMANTIC_MODES):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.embed_fn = embed_fn
+        self.semantic_modes = set(semantic_modes)
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (mode, scope, prompt) → (response, stored_at, unit vector or None)
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.invalidations = 0
+        subscribe(HR_CHANGED, lambda **_: self.invalidate())
+
+    def _embed(self, text: str):
+        if self.embed_fn is None:
+            return None
+        try:
+            vector = np.asarray(self.embed_fn([text])[0], dtype=np.float32)
+        except Exception:
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def cacheable(self, prompt: str) -> bool:
+        return len(normalize_prompt(prompt).split()) >= MIN_WORDS
+
+    def get(self, mode: str, prompt: str, scope: str = ""):
+        if not self.cacheable(prompt):
+            return None
+        key = (mode, scope, normalize_prompt(prompt))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[1]):
+                    self._entries.move_to_end(key)
+                    self.exact_hits += 1
+                    return entry[0]
+                del self._entries[key]
+                self.expired += 1
+            if mode not in self.semantic_modes:
+                self.misses += 1
+                return None
+
+        vector = self._embed(key[2])
+        with self._lock:
+            if vector is not None:
+                candidates = [
+                    (k, e) for k, e in self._entries.items()
+                    if k[:2] == key[:2] and e[2] is not None and not self._expired(e[1])
+                ]
+                if candidates:
+                    sims = np.stack([e[2] for _, e in candidates]) @ vector
+                    best = int(np.argmax(sims))
+                    if sims[best] >= self.similarity_threshold:
+                        best_key = candidates[best][0]
+                        self._entries.move_to_end(best_key)
+                        self.semantic_hits += 1
+                        return candidates[best][1][0]
+            self.misses += 1
+            return None
+
+    def put(self, mode: str, prompt: str, response: str, scope: str = ""):
+        if not response or response.startswith("⚠️") or not self.cacheable(prompt):
+            return  # never cache errors
+        key = (mode, scope, normalize_prompt(prompt))
+        vector = self._embed(key[2]) if mode in self.semantic_modes else None
+        with self._lock:
+            self._entries[key] = (response, time.time(), vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.exact_hits + self.semantic_hits
+            lookups = hits + self.misses
+            return {
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "expired": self.expired,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+            }
+
+
+response_cache = ResponseCache()
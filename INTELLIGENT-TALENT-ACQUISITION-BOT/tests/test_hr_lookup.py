@@ -0,0 +1,80 @@
+import pytest
+from chroma_db import hr_lookup
+from chroma_db.hr_lookup import HRLookup
+
+
+class FakeHRStore:
+    """Stands in for hr_collection: answers the Chroma `where` filters HRLookup sends."""
+
+    def __init__(self, rows: dict = None):
+        self.rows = dict(rows or {})
+        self.queries = []
+
+    def __call__(self, where):
+        self.queries.append(where)
+        if where is None:
+            return list(self.rows.items())
+        (field, condition), = where.items()
+        wanted = set(condition["$in"]) if isinstance(condition, dict) else {condition}
+        return [(hr_id, meta) for hr_id, meta in self.rows.items() if meta.get(field) in wanted]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(hr_lookup.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_indexed_values_match_case_insensitively_newest_first():
+    store = FakeHRStore({
+        "hr_1": {"email": "HR@Acme.com", "company": "Acme", "seq": 1},
+        "hr_2": {"email": "hr@acme.com", "company": "Acme", "seq": 2},
+    })
+    lookup = HRLookup(store)
+    assert [m["seq"] for m in lookup.find("email", " hr@ACME.com ")] == [2, 1]
+    assert lookup.fallbacks == 0
+
+
+def test_miss_is_remembered_until_it_expires(clock):
+    store = FakeHRStore()
+    lookup = HRLookup(store, miss_ttl=30)
+    assert lookup.find("email", "new@beta.com") == []
+    assert lookup.find("email", "new@beta.com") == []
+    assert lookup.fallbacks == 1
+
+    # Another process (seed_data, bulk_ingest) inserts the row; no event reaches this one
+    store.rows["hr_9"] = {"email": "new@beta.com", "seq": 9}
+    clock[0] += 29
+    assert lookup.find("email", "new@beta.com") == []
+    clock[0] += 2
+    assert [m["seq"] for m in lookup.find("email", "new@beta.com")] == [9]
+    assert lookup.fallbacks == 2
+
+
+def test_local_write_forgets_misses_at_once(clock):
+    store = FakeHRStore()
+    lookup = HRLookup(store, miss_ttl=30)
+    assert lookup.find("company", "Beta") == []
+
+    meta = {"company": "Beta", "email": "hr@beta.com", "seq": 3}
+    store.rows["hr_3"] = meta
+    lookup.add("hr_3", meta)
+    assert [m["seq"] for m in lookup.find("company", "beta")] == [3]
+
+
+def test_misses_share_one_fallback_query():
+    store = FakeHRStore({"hr_1": {"email": "a@x.com", "seq": 1}})
+    lookup = HRLookup(store)
+    lookup.find("email", "a@x.com")  # loads the index
+    store.rows["hr_2"] = {"email": "b@x.com", "seq": 2}
+
+    found = lookup.find_many("email", ["b@x.com", "c@x.com", "d@x.com"])
+    assert [m["seq"] for m in found["b@x.com"]] == [2]
+    assert found["c@x.com"] == [] and found["d@x.com"] == []
+    assert lookup.fallbacks == 1
+
+
+def test_unindexed_field_is_rejected():
+    with pytest.raises(ValueError):
+        HRLookup(FakeHRStore()).find("position", "Data Scientist")
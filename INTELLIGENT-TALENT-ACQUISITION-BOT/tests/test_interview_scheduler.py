@@ -0,0 +1,76 @@
+from utils.interview_scheduler import BusyIndex, InterviewScheduler, WorkingHours
+
+ALWAYS_OPEN = WorkingHours(timezone="UTC", hours="00:00-23:59", weekdays=list(range(7)))
+MONDAY = 1893456000  # Mon 01 Jan 2030, 00:00 UTC
+
+
+def blocks(index: BusyIndex) -> list:
+    return list(zip(index.starts, index.ends))
+
+
+def test_add_keeps_separate_blocks_sorted():
+    index = BusyIndex()
+    index.add(50, 60)
+    index.add(10, 20)
+    index.add(30, 40)
+    assert blocks(index) == [(10, 20), (30, 40), (50, 60)]
+
+
+def test_add_merges_overlapping_and_touching_blocks():
+    index = BusyIndex()
+    index.add(10, 20)
+    index.add(15, 25)  # overlaps
+    index.add(25, 30)  # touches
+    assert blocks(index) == [(10, 30)]
+
+
+def test_add_bridges_several_blocks_at_once():
+    index = BusyIndex()
+    for start in (10, 30, 50, 70):
+        index.add(start, start + 5)
+    index.add(12, 52)
+    assert blocks(index) == [(10, 55), (70, 75)]
+
+
+def test_add_inside_an_existing_block_changes_nothing():
+    index = BusyIndex()
+    index.add(10, 50)
+    index.add(20, 30)
+    assert blocks(index) == [(10, 50)]
+
+
+def test_next_free_skips_gaps_too_short_for_the_interview():
+    index = BusyIndex()
+    index.add(10, 20)
+    index.add(25, 40)  # the 20-25 gap only fits 5
+    assert index.next_free(0, 10) == 0
+    assert index.next_free(12, 5) == 20  # exactly fits between the blocks
+    assert index.next_free(12, 6) == 40
+    assert index.next_free(40, 100) == 40  # a block's end is free again
+
+
+def test_next_free_on_an_empty_calendar():
+    assert BusyIndex().next_free(123, 45) == 123
+
+
+def test_bookings_from_another_process_are_seen(tmp_path):
+    path = str(tmp_path / "interviews.sqlite3")
+    first, second = InterviewScheduler(path), InterviewScheduler(path)
+    a = first.book("app_a", "recruiter", "a@example.com", MONDAY, hours=ALWAYS_OPEN)
+    b = second.book("app_b", "recruiter", "b@example.com", MONDAY, hours=ALWAYS_OPEN)
+
+    assert b.start >= a.end
+    assert first.get("app_b") == b
+    assert first.count() == 2
+
+
+def test_resubmission_frees_the_old_slot(tmp_path):
+    scheduler = InterviewScheduler(str(tmp_path / "interviews.sqlite3"))
+    old = scheduler.book("app_a", "recruiter", "a@example.com", MONDAY, hours=ALWAYS_OPEN, revision="r1")
+    assert scheduler.book("app_a", "recruiter", "a@example.com", MONDAY, hours=ALWAYS_OPEN, revision="r1") == old
+
+    new = scheduler.book("app_a", "recruiter", "a@example.com", MONDAY + 86400, hours=ALWAYS_OPEN, revision="r2")
+    assert new.revision == "r2" and new.start == MONDAY + 86400
+    # The old slot is free again for someone else
+    other = scheduler.book("app_b", "recruiter", "b@example.com", MONDAY, hours=ALWAYS_OPEN)
+    assert other.start == old.start
@@ -0,0 +1,93 @@
+import threading
+from types import SimpleNamespace
+import pytest
+from chroma_db.write_buffer import WriteBuffer
+
+applicants = SimpleNamespace(name="applicants")
+hr = SimpleNamespace(name="hr")
+
+
+class Recorder:
+    def __init__(self, fail: Exception = None):
+        self.fail = fail
+        self.calls = []
+
+    def __call__(self, collection, ids, documents, metadatas):
+        self.calls.append((collection.name, ids, documents, metadatas))
+        if self.fail:
+            raise self.fail
+
+
+def test_rewritten_row_is_written_once_with_its_last_version():
+    write = Recorder()
+    buffer = WriteBuffer(write, max_rows=100, max_seconds=60)
+    first = buffer.put(applicants, "app_1", "v1", {"v": 1})
+    second = buffer.put(applicants, "app_1", "v2", {"v": 2})
+    buffer.put(applicants, "app_2", "other", {})
+
+    assert buffer.flush() == 2
+    assert write.calls == [("applicants", ["app_1", "app_2"], ["v2", "other"], [{"v": 2}, {}])]
+    assert first.wait(0) and second.wait(0)
+    assert buffer.coalesced == 1 and buffer.rows_written == 2 and buffer.pending() == 0
+
+
+def test_failed_batch_raises_on_every_ticket_it_carried():
+    error = RuntimeError("chroma unavailable")
+    buffer = WriteBuffer(Recorder(fail=error), max_rows=100, max_seconds=60)
+    first = buffer.put(applicants, "app_1", "v1", {})
+    second = buffer.put(applicants, "app_1", "v2", {})  # coalesced: inherits the first ticket
+
+    assert buffer.flush() == 0
+    for ticket in (first, second):
+        with pytest.raises(RuntimeError, match="chroma unavailable"):
+            ticket.wait(0)
+    assert buffer.flushes == 1 and buffer.rows_written == 0
+
+
+def test_one_collection_failing_does_not_fail_the_other():
+    class FailHR(Recorder):
+        def __call__(self, collection, ids, documents, metadatas):
+            self.calls.append(collection.name)
+            if collection.name == "hr":
+                raise ValueError("bad HR row")
+
+    buffer = WriteBuffer(FailHR(), max_rows=100, max_seconds=60)
+    ok = buffer.put(applicants, "app_1", "doc", {})
+    bad = buffer.put(hr, "hr_1", "doc", {})
+
+    assert buffer.flush() == 1
+    assert ok.wait(0)
+    with pytest.raises(ValueError):
+        bad.wait(0)
+
+
+def test_full_collection_is_flushed_by_the_writer():
+    write = Recorder()
+    buffer = WriteBuffer(write, max_rows=2, max_seconds=60)
+    buffer.put(applicants, "app_1", "a", {})
+    assert write.calls == []
+    ticket = buffer.put(applicants, "app_2", "b", {})
+
+    assert ticket.wait(0)
+    assert [ids for _, ids, _, _ in write.calls] == [["app_1", "app_2"]]
+
+
+def test_background_flush_after_max_seconds():
+    written = threading.Event()
+
+    def write(collection, ids, documents, metadatas):
+        written.set()
+
+    buffer = WriteBuffer(write, max_rows=100, max_seconds=0.01)
+    ticket = buffer.put(applicants, "app_1", "a", {})
+
+    assert ticket.wait(2)
+    assert written.is_set()
+
+
+def test_unflushed_ticket_times_out():
+    buffer = WriteBuffer(Recorder(), max_rows=100, max_seconds=60)
+    ticket = buffer.put(applicants, "app_1", "a", {})
+    with pytest.raises(TimeoutError):
+        ticket.wait(0.01)
+    buffer.flush()
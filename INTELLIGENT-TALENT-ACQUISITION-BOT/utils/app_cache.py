@@ -0,0 +1,53 @@
+import os
+import streamlit as st
+from chroma_db import db_handler
+from utils.events import subscribe, HR_CHANGED
+
+# Safety net for writes made by other processes (seed_data, bulk_ingest);
+# writes through save_hr_to_db invalidate immediately.
+POSITIONS_CACHE_TTL = int(os.getenv("POSITIONS_CACHE_TTL", "300"))
+
+
+# -------------------------
+# 📌 Cached open positions
+# -------------------------
+@st.cache_data(ttl=POSITIONS_CACHE_TTL, show_spinner=False)
+def get_open_positions() -> dict:
+    """hr_collection scan shared by every session and rerun until the next HR write."""
+    return db_handler.get_all_open_positions()
+
+
+def get_available_positions() -> list:
+    return [meta["position"] for meta in get_open_positions()["metadatas"]]
+
+
+def _invalidate_positions(**_):
+    get_open_positions.clear()
+
+
+# Registered once per process: this module is only imported once
+subscribe(HR_CHANGED, _invalidate_positions)
+
+
+# -------------------------
+# 🧵 Background pipeline
+# -------------------------
+# Agents are deliberately not cached here: a CrewAI agent keeps executor state
+# and crew memory while it runs, so one process-wide instance would mix
+# concurrent sessions. Each pipeline worker builds its own (agents/pipeline.py).
+@st.cache_resource(show_spinner=False)
+def get_job_queue():
+    """The screening → engagement → scheduling queue and its worker pool, one per process."""
+    from agents.pipeline import get_pipeline_queue
+    queue = get_pipeline_queue()
+    queue.start()  # picks up jobs left queued by a previous run
+    return queue
+
+
+@st.cache_resource(show_spinner=False)
+def get_upload_ingestion_queue():
+    """The extract → embed & save → hand-off queue for uploaded resumes, one per process."""
+    from utils.upload_pipeline import get_upload_queue
+    queue = get_upload_queue()
+    queue.start()  # picks up uploads left queued by a previous run
+    return queue
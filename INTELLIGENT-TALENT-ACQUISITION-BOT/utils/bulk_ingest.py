@@ -0,0 +1,207 @@
+"""Bulk resume ingestion from a directory or .zip of PDFs.
+
+    python -m utils.bulk_ingest data/campus_drive.zip --position "Software Engineer" --workers 8
+
+Text is extracted in a process pool, rows are written to applicant_collection in
+batched add() calls, and every processed file is appended to a JSONL manifest so
+an interrupted run picks up where it stopped. PDFs that fail to parse are copied
+to a quarantine directory instead of aborting the run.
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+import fitz  # PyMuPDF
+from utils.pdf_cache import extraction_cache, sha256_bytes
+
+DEFAULT_MANIFEST = "data/ingest_manifest.jsonl"
+DEFAULT_QUARANTINE = "data/quarantine/"
+
+
+# -------------------------
+# 📂 Source discovery (streamed, never materialised)
+# -------------------------
+def iter_sources(source: str):
+    """Yields (source_key, file_path, member_name) for every PDF in a directory or zip."""
+    if zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for member in archive.infolist():
+                if not member.is_dir() and member.filename.lower().endswith(".pdf"):
+                    yield f"{source}::{member.filename}", source, member.filename
+    else:
+        for root, _, files in os.walk(source):
+            for name in sorted(files):
+                if name.lower().endswith(".pdf"):
+                    path = os.path.join(root, name)
+                    yield path, path, None
+
+
+def read_source(file_path: str, member: str = None) -> bytes:
+    if member is None:
+        with open(file_path, "rb") as f:
+            return f.read()
+    with zipfile.ZipFile(file_path) as archive:
+        return archive.read(member)
+
+
+# -------------------------
+# 🏭 Worker (runs in a child process)
+# -------------------------
+def extract_worker(key: str, file_path: str, member: str = None) -> dict:
+    try:
+        data = read_source(file_path, member)
+        digest = sha256_bytes(data)
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            pages = doc.page_count
+            text = "".join(page.get_text() for page in doc)
+        if not text.strip():
+            raise ValueError("no extractable text")
+        extraction_cache.put(digest, text)
+        return {"key": key, "ok": True, "digest": digest, "pages": pages, "text": text}
+    except Exception as e:
+        return {"key": key, "ok": False, "error": str(e), "file_path": file_path, "member": member}
+
+
+# -------------------------
+# 🧾 Checkpoint manifest
+# -------------------------
+def load_manifest(path: str) -> set:
+    done = set()
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    done.add(json.loads(line)["key"])
+    return done
+
+
+def append_manifest(path: str, records: list):
+    if not records:
+        return
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def quarantine(result: dict, quarantine_dir: str):
+    os.makedirs(quarantine_dir, exist_ok=True)
+    name = os.path.basename(result["member"] or result["file_path"])
+    target = os.path.join(quarantine_dir, name)
+    try:
+        if result["member"] is None:
+            shutil.copy2(result["file_path"], target)
+        else:
+            with open(target, "wb") as f:
+                f.write(read_source(result["file_path"], result["member"]))
+    except Exception as e:
+        print(f"⚠️ Could not copy {name} to quarantine: {e}")
+    return target
+
+
+def applicant_metadata(key: str, args) -> dict:
+    return {
+        "name": Path(key.split("::")[-1]).stem.replace("_", " "),
+        "email": "",
+        "institute": args.institute,
+        # No form here: yoe stays unset (unknown) rather than 0, so prescreen's min_yoe rule skips these
+        "position": args.position,
+        "source_file": key,
+    }
+
+
+# -------------------------
+# 🚀 Ingestion loop
+# -------------------------
+def ingest(args) -> dict:
+    from chroma_db.db_handler import save_applicants_batch
+
+    os.makedirs(os.path.dirname(args.manifest) or ".", exist_ok=True)
+    done = load_manifest(args.manifest)
+    pending_rows, pending_records = [], []
+    stats = {"ingested": 0, "quarantined": 0, "skipped": 0, "pages": 0}
+    start = time.perf_counter()
+
+    def flush():
+        if pending_rows:
+            save_applicants_batch(pending_rows)
+            # Manifest entries are written only after the batch is durable in Chroma
+            append_manifest(args.manifest, pending_records)
+            stats["ingested"] += len(pending_rows)
+            pending_rows.clear()
+            pending_records.clear()
+            elapsed = time.perf_counter() - start
+            print(f"📥 {stats['ingested']} ingested, {stats['quarantined']} quarantined, "
+                  f"{stats['skipped']} skipped | {stats['ingested'] / elapsed:.1f} files/s, "
+                  f"{stats['pages'] / elapsed:.1f} pages/s")
+
+    max_in_flight = args.workers * 4  # bounds memory: at most this many texts held at once
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        in_flight = set()
+        sources = iter_sources(args.source)
+        exhausted = False
+        while not exhausted or in_flight:
+            while not exhausted and len(in_flight) < max_in_flight:
+                item = next(sources, None)
+                if item is None:
+                    exhausted = True
+                elif item[0] in done:
+                    stats["skipped"] += 1
+                else:
+                    in_flight.add(pool.submit(extract_worker, *item))
+            if not in_flight:
+                break
+
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                result = future.result()
+                if result["ok"]:
+                    # Content-derived ids keep a replayed batch idempotent after a crash
+                    app_id = f"app_{result['digest'][:16]}"
+                    if any(row[0] == app_id for row in pending_rows):
+                        pending_records.append({"key": result["key"], "status": "duplicate", "id": app_id})
+                        continue
+                    pending_rows.append((app_id, applicant_metadata(result["key"], args), result["text"]))
+                    pending_records.append({"key": result["key"], "status": "ingested", "id": app_id})
+                    stats["pages"] += result["pages"]
+                else:
+                    target = quarantine(result, args.quarantine)
+                    stats["quarantined"] += 1
+                    append_manifest(args.manifest, [{
+                        "key": result["key"], "status": "quarantined", "error": result["error"], "path": target,
+                    }])
+                if len(pending_rows) >= args.batch_size:
+                    flush()
+        flush()
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk-ingest PDF resumes into the applicant collection.")
+    parser.add_argument("source", help="Directory or .zip containing PDF resumes")
+    parser.add_argument("--position", default="", help="Position the resumes are applying for")
+    parser.add_argument("--institute", default="", help="Institute to record for every resume (e.g. campus drive)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST)
+    parser.add_argument("--quarantine", default=DEFAULT_QUARANTINE)
+    args = parser.parse_args()
+
+    stats = ingest(args)
+    print(
+        f"✅ Done in {stats['seconds']:.1f}s: {stats['ingested']} ingested, "
+        f"{stats['quarantined']} quarantined, {stats['skipped']} already in manifest, "
+        f"{stats['pages'] / max(stats['seconds'], 1e-9):.1f} pages/s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import os
+
+CONTEXT_TOKEN_BUDGET = int(os.getenv("CHAT_CONTEXT_TOKENS", "1500"))
+SUMMARY_TOKEN_BUDGET = int(os.getenv("CHAT_SUMMARY_TOKENS", "300"))
+FOLD_TARGET = 0.6  # after folding, the prompt should be at most this fraction of the budget
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English text with the Mistral tokenizer
+    return (len(text) + 3) // 4
+
+
+def format_turn(turn: dict) -> str:
+    return f"User: {turn['user']}\nBot: {turn['bot']}"
+
+
+def llm_summarizer(summary: str, turns: list) -> str:
+    from llm_utils.llm_registry import get_client
+
+    prompt = (
+        "Update the running summary of a conversation with a recruiting assistant. "
+        "Keep names, positions, dates and unanswered questions. Reply with the summary only.\n\n"
+        f"Current summary:\n{summary or '(empty)'}\n\n"
+        "New turns:\n" + "\n".join(format_turn(turn) for turn in turns) + "\n\nUpdated summary:"
+    )
+    result = get_client().generate(prompt, options={"temperature": 0.0, "num_predict": SUMMARY_TOKEN_BUDGET})
+    return result.get("response", "").strip()
+
+
+def fallback_summarizer(summary: str, turns: list) -> str:
+    notes = "; ".join(f"user asked: {turn['user'][:80]}" for turn in turns)
+    return f"{summary} {notes}".strip()
+
+
+# -------------------------
+# 🧠 Rolling, token-budgeted conversation context
+# -------------------------
+class ConversationContext:
+    """Builds chat prompts that stay under a token budget.
+
+    Recent turns are kept verbatim; when the budget would be exceeded the oldest
+    turns are folded into a running summary in one step (down to FOLD_TARGET of
+    the budget). Between folds the prompt only grows at the end, so the prefix
+    stays byte-identical and Ollama can reuse its KV cache for it.
+
+    `state` is a plain dict (kept in st.session_state) with "summary" and
+    "folded_turns", the number of history turns already in the summary.
+    """
+
+    def __init__(self, state: dict, budget: int = CONTEXT_TOKEN_BUDGET, summarizer=llm_summarizer):
+        self.state = state
+        self.state.setdefault("summary", "")
+        self.state.setdefault("folded_turns", 0)
+        self.budget = budget
+        self.summarizer = summarizer
+
+    def _render(self, window: list, tail: str) -> str:
+        parts = []
+        if self.state["summary"]:
+            parts.append(f"Summary of the earlier conversation:\n{self.state['summary']}\n")
+        parts.extend(format_turn(turn) for turn in window)
+        parts.append(tail)
+        return "\n".join(parts)
+
+    def _fold(self, turns: list):
+        try:
+            summary = self.summarizer(self.state["summary"], turns)
+        except Exception:
+            summary = ""
+        if not summary:
+            summary = fallback_summarizer(self.state["summary"], turns)
+        max_chars = SUMMARY_TOKEN_BUDGET * 4
+        self.state["summary"] = summary[-max_chars:]
+        self.state["folded_turns"] += len(turns)
+
+    def build_prompt(self, history: list, user_input: str, knowledge: str = "") -> str:
+        """`knowledge` (e.g. retrieved openings) goes right before the new turn, after the stable prefix."""
+        window = history[self.state["folded_turns"]:]
+        tail = f"{knowledge}User: {user_input}\nBot:"
+        prompt = self._render(window, tail)
+        if estimate_tokens(prompt) <= self.budget or not window:
+            return prompt
+
+        # Fold enough of the oldest turns to get well under budget, so the next fold is a while away
+        target = self.budget * FOLD_TARGET
+        fold = 1
+        while fold < len(window) and estimate_tokens(self._render(window[fold:], tail)) > target:
+            fold += 1
+        self._fold(window[:fold])
+        return self._render(window[fold:], tail)
@@ -1,11 +1,41 @@
+import hashlib
+import re
+import time
 import streamlit as st
-from utils.session_state_handler import get_session_data, update_chat_history
-from llm_utils.local_llm_runner import run_local_llm  # Assuming this is how you call Mistral
+from utils.session_state_handler import get_session_data, update_chat_history, get_chat_context_state
+from utils.chat_context import ConversationContext, estimate_tokens
+from llm_utils.local_llm_runner import run_local_llm, get_prompt_template, completion_options  # Assuming this is how you call Mistral
+from llm_utils.llm_registry import get_llm, get_client
+from llm_utils.response_cache import response_cache
+from chroma_db.position_index import position_context
+
+# Chat answers that do not depend on the conversation are cached under this mode, scoped by the listings
+FAQ_CACHE_MODE = "chat_faq"
+# Words that point back into the conversation ("is it remote?"); such turns are never shared
+_FOLLOW_UP = re.compile(r"\b(it|its|that|this|these|those|they|them|their|he|she|above|previous|earlier|same)\b", re.I)
+
+
+def faq_scope(user_input: str, knowledge: str, first_turn: bool):
+    """Cache scope for a turn whose answer does not depend on the conversation, or None.
+
+    That is the first turn of a session, or a self-contained question the
+    position index found listings for. The scope fingerprints those listings,
+    so near-duplicate questions only share an answer grounded in the same openings.
+    """
+    if not first_turn and (not knowledge or _FOLLOW_UP.search(user_input)):
+        return None
+    return hashlib.sha256(knowledge.encode("utf-8")).hexdigest()[:16]
+
+
+def _session_faq_scope(user_input: str, knowledge: str):
+    first_turn = not get_session_data().get("chat_history") and not get_chat_context_state().get("summary")
+    return faq_scope(user_input, knowledge, first_turn)
+
+
 def chatbot_interface(user_input: str):
     from langchain.agents import initialize_agent, AgentType
-    from langchain.llms import Ollama  # Or your LLM wrapper
 
-    llm = Ollama(model="mistral")  # or whatever you're using
+    llm = get_llm("chat")  # shared across reruns and sessions
 
     # agent = initialize_agent(
     #     tools=[],  # Empty is okay with CHAT_ZERO_SHOT
@@ -13,20 +43,95 @@ def chatbot_interface(user_input: str):
     #     agent_type=AgentType.CHAT_ZERO_SHOT_REACT_DESCRIPTION,
     #     verbose=True
     # )
-    response = llm(user_input)
+    # Ground answers about openings in hr_collection instead of the model's imagination
+    knowledge = position_context(user_input)
+    prompt = f"{knowledge}\n{user_input}" if knowledge else user_input
+    # No history goes into this prompt, so every question is a first turn
+    scope = faq_scope(user_input, knowledge, first_turn=True)
+    cached = response_cache.get(FAQ_CACHE_MODE, user_input, scope=scope)
+    if cached is not None:
+        return cached
+    response = llm(prompt)
+    response_cache.put(FAQ_CACHE_MODE, user_input, response, scope=scope)
 
     return response
 
-def process_user_input(user_input: str):
+def build_chat_prompt(user_input: str, knowledge: str = None) -> str:
     session_data = get_session_data()
     history = session_data.get("chat_history", [])
 
-    # Build context (simple example - customize as needed)
-    context = "\n".join([f"User: {turn['user']}\nBot: {turn['bot']}" for turn in history])
+    # Recent turns verbatim, older ones folded into a summary, all under a token budget
+    context = ConversationContext(get_chat_context_state())
+    if knowledge is None:
+        knowledge = position_context(user_input)
+    return context.build_prompt(history, user_input, knowledge=knowledge)
 
-    # Call the local LLM with context
-    prompt = f"{context}\nUser: {user_input}\nBot:"
-    response = run_local_llm(prompt)  # Your wrapper around Ollama/Mistral
+def process_user_input(user_input: str):
+    knowledge = position_context(user_input)
+    scope = _session_faq_scope(user_input, knowledge)
+    response = response_cache.get(FAQ_CACHE_MODE, user_input, scope=scope) if scope is not None else None
+    if response is None:
+        # Call the local LLM with context; a whole-prompt key would almost never repeat, so skip that cache
+        prompt = build_chat_prompt(user_input, knowledge)
+        response = run_local_llm(prompt, use_cache=False)  # Your wrapper around Ollama/Mistral
+        if scope is not None:
+            response_cache.put(FAQ_CACHE_MODE, user_input, response, scope=scope)
 
     update_chat_history(user_input, response)
     return response
+
+def stream_user_input(user_input: str, metrics: dict = None):
+    """Same flow as process_user_input, but yields tokens as Ollama produces them.
+
+    History is recorded once the stream finishes. If `metrics` is given it is filled
+    with prompt_tokens, time_to_first_token, tokens and tokens_per_second.
+    """
+    metrics = metrics if metrics is not None else {}
+    start = time.perf_counter()
+
+    knowledge = position_context(user_input)
+    scope = _session_faq_scope(user_input, knowledge)  # same key as process_user_input
+    cached = response_cache.get(FAQ_CACHE_MODE, user_input, scope=scope) if scope is not None else None
+    if cached is not None:
+        yield cached
+        update_chat_history(user_input, cached)
+        elapsed = time.perf_counter() - start
+        metrics.update({"prompt_tokens": 0, "time_to_first_token": elapsed, "tokens": 0,
+                        "tokens_per_second": 0.0, "total_seconds": elapsed, "cached": True})
+        return
+
+    chat_prompt = build_chat_prompt(user_input, knowledge)
+    prompt = get_prompt_template("chat").format(user_input=chat_prompt)
+
+    first_token_at = None
+    tokens = 0
+    prompt_tokens = estimate_tokens(prompt)
+    parts = []
+    for chunk in get_client().stream(prompt, options=completion_options("chat")):
+        piece = chunk.get("response", "")
+        if piece:
+            if first_token_at is None:
+                first_token_at = time.perf_counter()
+            tokens += 1
+            parts.append(piece)
+            yield piece
+        if chunk.get("done"):
+            tokens = chunk.get("eval_count", tokens)
+            prompt_tokens = chunk.get("prompt_eval_count", prompt_tokens)
+    end = time.perf_counter()
+
+    response = "".join(parts).strip()
+    update_chat_history(user_input, response)
+    if scope is not None:
+        response_cache.put(FAQ_CACHE_MODE, user_input, response, scope=scope)
+
+    ttft = (first_token_at or end) - start
+    generation = end - (first_token_at or end)
+    metrics.update({
+        "prompt_tokens": prompt_tokens,
+        "time_to_first_token": ttft,
+        "tokens": tokens,
+        "tokens_per_second": tokens / generation if generation > 0 else 0.0,
+        "total_seconds": end - start,
+        "cached": False,
+    })
@@ -0,0 +1,24 @@
+import threading
+
+# Minimal in-process publish/subscribe so the DB layer can announce writes
+# without importing the caches that depend on them.
+_listeners = {}
+_lock = threading.Lock()
+
+HR_CHANGED = "hr_changed"
+APPLICANT_CHANGED = "applicant_changed"
+
+
+def subscribe(event: str, callback):
+    with _lock:
+        _listeners.setdefault(event, []).append(callback)
+
+
+def publish(event: str, **payload):
+    with _lock:
+        callbacks = list(_listeners.get(event, []))
+    for callback in callbacks:
+        try:
+            callback(**payload)
+        except Exception as e:
+            print(f"⚠️ {event} listener failed: {e}")
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import uuid
 
@@ -15,3 +16,16 @@ def save_uploaded_file(uploaded_file):
         f.write(uploaded_file.getbuffer())
 
     return filepath
+
+
+def save_upload_bytes(data: bytes, file_name: str):
+    """Store uploaded bytes under their SHA-256; returns (path, digest). A resubmitted file is written once."""
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    digest = hashlib.sha256(data).hexdigest()
+    filepath = os.path.join(UPLOAD_DIR, f"{digest}.{file_name.split('.')[-1].lower()}")
+    if not os.path.exists(filepath):
+        tmp_path = f"{filepath}.{uuid.uuid4().hex[:8]}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, filepath)  # a worker never sees a half-written file
+    return filepath, digest
@@ -0,0 +1,338 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import List, Optional
+from zoneinfo import ZoneInfo, available_timezones
+from pydantic import BaseModel
+
+INTERVIEWS_PATH = os.getenv("INTERVIEWS_PATH", "data/interviews.sqlite3")
+INTERVIEW_MINUTES = int(os.getenv("INTERVIEW_MINUTES", "45"))
+INTERVIEW_STEP_MINUTES = int(os.getenv("INTERVIEW_STEP_MINUTES", "15"))  # slots start on this grid
+INTERVIEW_TIMEZONE = os.getenv("INTERVIEW_TIMEZONE", "Asia/Kolkata")
+INTERVIEW_HOURS = os.getenv("INTERVIEW_HOURS", "09:00-17:00")  # recruiter's local working hours
+INTERVIEW_SEARCH_DAYS = int(os.getenv("INTERVIEW_SEARCH_DAYS", "60"))
+TIMEZONES = sorted(available_timezones())
+
+
+# -------------------------
+# 📦 Models
+# -------------------------
+class WorkingHours(BaseModel):
+    """When a recruiter takes interviews, in their own time zone. Weekdays: Monday is 0."""
+    timezone: str = INTERVIEW_TIMEZONE
+    hours: str = INTERVIEW_HOURS
+    weekdays: List[int] = [0, 1, 2, 3, 4]
+
+    def next_open(self, t: float, duration: float) -> Optional[float]:
+        """Earliest start >= t (epoch seconds) whose whole interview falls inside working hours."""
+        tz = ZoneInfo(self.timezone)
+        opens, closes = (datetime.strptime(part.strip(), "%H:%M").time() for part in self.hours.split("-"))
+        day = datetime.fromtimestamp(t, tz).date()
+        for _ in range(INTERVIEW_SEARCH_DAYS + 1):
+            if day.weekday() in self.weekdays:
+                start = datetime.combine(day, opens, tz).timestamp()
+                end = datetime.combine(day, closes, tz).timestamp()
+                if max(t, start) + duration <= end:
+                    return max(t, start)
+            day += timedelta(days=1)
+        return None
+
+
+class Interview(BaseModel):
+    app_id: str
+    recruiter: str
+    applicant: str
+    start: float  # epoch seconds, UTC
+    end: float
+    revision: str = ""  # version of the application it was booked for
+
+    def local(self, tz_name: str = INTERVIEW_TIMEZONE) -> str:
+        """The slot as the given time zone sees it, e.g. "Tue 03 Nov 2026, 10:00-10:45 IST"."""
+        tz = ZoneInfo(tz_name or INTERVIEW_TIMEZONE)
+        start = datetime.fromtimestamp(self.start, tz)
+        end = datetime.fromtimestamp(self.end, tz)
+        return f"{start:%a %d %b %Y, %H:%M}-{end:%H:%M} {start:%Z}"
+
+
+def preferred_start(applicant: dict, default_tz: str = INTERVIEW_TIMEZONE) -> float:
+    """The applicant's free date/time from the form, read in their own time zone; now if not given."""
+    now = time.time()
+    free_date = applicant.get("free_date")
+    if not free_date:
+        return now
+    tz = ZoneInfo(applicant.get("timezone") or default_tz)
+    free_time = applicant.get("free_time") or "00:00:00"
+    local = datetime.strptime(f"{free_date} {free_time}", "%Y-%m-%d %H:%M:%S").replace(tzinfo=tz)
+    return max(now, local.timestamp())
+
+
+# -------------------------
+# 📅 Busy-block index
+# -------------------------
+class BusyIndex:
+    """One calendar's booked time as sorted, non-overlapping blocks (two parallel arrays).
+
+    Touching or overlapping bookings are merged into one block, so the first
+    free gap after any instant is found with one bisect plus a hop per block
+    that is too short to fit an interview.
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def add(self, start: float, end: float):
+        first = bisect_left(self.ends, start)  # first block that ends at or after `start`
+        last = bisect_right(self.starts, end)  # blocks from here on start after `end`
+        if first < last:
+            start = min(start, self.starts[first])
+            end = max(end, self.ends[last - 1])
+        self.starts[first:last] = [start]
+        self.ends[first:last] = [end]
+
+    def next_free(self, t: float, duration: float) -> float:
+        """Earliest s >= t with [s, s + duration) clear of every block."""
+        while True:
+            i = bisect_right(self.ends, t)  # first block still busy after t
+            if i == len(self.starts) or self.starts[i] >= t + duration:
+                return t
+            t = self.ends[i]
+
+    def __len__(self):
+        return len(self.starts)
+
+
+# -------------------------
+# 🗓️ Interview scheduler
+# -------------------------
+class InterviewScheduler:
+    """Books interviews into the earliest slot free for both the recruiter and the applicant.
+
+    Bookings persist in SQLite and are indexed in memory per calendar
+    (recruiter id or email, applicant email). A slot must fall within the
+    recruiter's working hours in their time zone and start on the
+    INTERVIEW_STEP_MINUTES grid. Booking is idempotent per application
+    revision: a resubmitted application (new revision) gives up its old slot
+    and is booked again from its new availability.
+
+    Other processes (a CLI run of the scheduling agent, another app replica)
+    may book into the same file: every booking runs under BEGIN IMMEDIATE,
+    reloads the index when the table changed (PRAGMA data_version) and checks
+    the chosen slot against the table before inserting it.
+    """
+
+    def __init__(self, path: str = INTERVIEWS_PATH, duration_minutes: int = INTERVIEW_MINUTES,
+                 step_minutes: int = INTERVIEW_STEP_MINUTES):
+        self.duration = duration_minutes * 60
+        self.step = step_minutes * 60
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS interviews (app_id TEXT PRIMARY KEY, recruiter TEXT NOT NULL, "
+            "applicant TEXT NOT NULL, start REAL NOT NULL, end REAL NOT NULL, created_at REAL NOT NULL, "
+            "revision TEXT NOT NULL DEFAULT '');"
+            "CREATE TABLE IF NOT EXISTS availability (recruiter TEXT PRIMARY KEY, hours TEXT NOT NULL);"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(interviews)")}
+        if "revision" not in columns:  # bookings made before revisions were tracked
+            self._conn.execute("ALTER TABLE interviews ADD COLUMN revision TEXT NOT NULL DEFAULT ''")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_interviews_recruiter ON interviews (recruiter, start)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_interviews_applicant ON interviews (applicant, start)")
+        self._conn.commit()
+        self._data_version = None
+        with self._lock:
+            self._sync_locked()
+
+    def _load_locked(self):
+        self._busy = {}
+        self._interviews = {}
+        self._hours = {}
+        for app_id, recruiter, applicant, start, end, revision in self._conn.execute(
+                "SELECT app_id, recruiter, applicant, start, end, revision FROM interviews"):
+            self._index(Interview(app_id=app_id, recruiter=recruiter, applicant=applicant, start=start, end=end,
+                                  revision=revision))
+        for recruiter, hours in self._conn.execute("SELECT recruiter, hours FROM availability"):
+            self._hours[recruiter] = WorkingHours.model_validate_json(hours)
+
+    def _sync_locked(self):
+        # data_version only moves when another connection commits, so this is one pragma when nothing changed
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            self._load_locked()
+            self._data_version = version
+
+    @contextmanager
+    def _write(self):
+        """Lock, take SQLite's write lock, catch up with other processes' bookings; commit on exit."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._sync_locked()
+                yield
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    def _overlaps(self, recruiter: str, applicant: str, start: float, end: float) -> bool:
+        calendars = (recruiter, applicant)
+        return self._conn.execute(
+            "SELECT 1 FROM interviews WHERE (recruiter IN (?, ?) OR applicant IN (?, ?)) "
+            "AND start < ? AND end > ? LIMIT 1",
+            (*calendars, *calendars, end, start),
+        ).fetchone() is not None
+
+    def _index(self, interview: Interview):
+        self._interviews[interview.app_id] = interview
+        for calendar in (interview.recruiter, interview.applicant):
+            self._busy.setdefault(calendar, BusyIndex()).add(interview.start, interview.end)
+
+    def _cancel_locked(self, app_id: str) -> Optional[Interview]:
+        interview = self._interviews.pop(app_id, None)
+        if interview is None:
+            return None
+        self._conn.execute("DELETE FROM interviews WHERE app_id = ?", (app_id,))
+        # Merged blocks cannot be split, so both calendars are rebuilt from their remaining bookings
+        for calendar in (interview.recruiter, interview.applicant):
+            self._busy[calendar] = BusyIndex()
+        for other in self._interviews.values():
+            for calendar in (other.recruiter, other.applicant):
+                if calendar in (interview.recruiter, interview.applicant):
+                    self._busy[calendar].add(other.start, other.end)
+        return interview
+
+    def cancel(self, app_id: str) -> Optional[Interview]:
+        """Free an application's slot; returns the cancelled booking, if any."""
+        with self._write():
+            return self._cancel_locked(app_id)
+
+    def _align(self, t: float) -> float:
+        return -(-t // self.step) * self.step
+
+    def set_availability(self, recruiter: str, hours: WorkingHours):
+        with self._lock:
+            self._hours[recruiter] = hours
+            self._conn.execute("INSERT OR REPLACE INTO availability (recruiter, hours) VALUES (?, ?)",
+                               (recruiter, hours.model_dump_json()))
+            self._conn.commit()
+
+    def availability(self, recruiter: str, default_tz: str = None) -> WorkingHours:
+        with self._lock:
+            self._sync_locked()
+        if recruiter in self._hours:
+            return self._hours[recruiter]
+        return WorkingHours(timezone=default_tz or INTERVIEW_TIMEZONE)
+
+    def _find(self, calendars: list, hours: WorkingHours, earliest: float) -> Optional[float]:
+        # Alternate between working hours and each calendar until none of them moves the start
+        t = self._align(earliest)
+        deadline = earliest + INTERVIEW_SEARCH_DAYS * 86400
+        while t <= deadline:
+            opened = hours.next_open(t, self.duration)
+            if opened is None:
+                return None
+            candidate = self._align(opened)
+            for calendar in calendars:
+                candidate = self._align(calendar.next_free(candidate, self.duration))
+            if candidate == t:
+                return t
+            t = candidate
+        return None
+
+    def _slot(self, recruiter: str, applicant: str, earliest: float, hours: WorkingHours) -> Optional[float]:
+        calendars = [self._busy[c] for c in (recruiter, applicant) if c in self._busy]
+        return self._find(calendars, hours, earliest)
+
+    def find_slot(self, recruiter: str, applicant: str, earliest: float,
+                  hours: WorkingHours = None) -> Optional[float]:
+        """Earliest slot start (epoch seconds) free for both calendars, or None within the search window."""
+        hours = hours or self.availability(recruiter)
+        with self._lock:
+            self._sync_locked()
+            return self._slot(recruiter, applicant, earliest, hours)
+
+    def _book_locked(self, app_id: str, recruiter: str, applicant: str, earliest: float,
+                     hours: WorkingHours, revision: str = None) -> Optional[Interview]:
+        existing = self._interviews.get(app_id)
+        if existing is not None:
+            if revision is None or existing.revision == revision:
+                return existing
+            self._cancel_locked(app_id)  # the application was resubmitted; its old slot no longer applies
+        start = self._slot(recruiter, applicant, earliest, hours)
+        if start is not None and self._overlaps(recruiter, applicant, start, start + self.duration):
+            # The table holds a booking the index missed; rebuild it and search once more
+            self._load_locked()
+            start = self._slot(recruiter, applicant, earliest, hours)
+            if start is not None and self._overlaps(recruiter, applicant, start, start + self.duration):
+                raise RuntimeError(f"Interview index out of step with {recruiter}/{applicant} bookings")
+        if start is None:
+            return None
+        interview = Interview(app_id=app_id, recruiter=recruiter, applicant=applicant,
+                              start=start, end=start + self.duration, revision=revision or "")
+        self._index(interview)
+        self._conn.execute(
+            "INSERT INTO interviews (app_id, recruiter, applicant, start, end, created_at, revision) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (app_id, recruiter, applicant, interview.start, interview.end, time.time(), interview.revision),
+        )
+        return interview
+
+    def book(self, app_id: str, recruiter: str, applicant: str, earliest: float,
+             hours: WorkingHours = None, revision: str = None) -> Optional[Interview]:
+        """Book the earliest mutually free slot at or after `earliest`.
+
+        A repeat call returns the same booking unless `revision` differs from
+        the one it was booked for; then the old slot is released and re-booked.
+        """
+        hours = hours or self.availability(recruiter)
+        with self._write():
+            return self._book_locked(app_id, recruiter, applicant, earliest, hours, revision)
+
+    def assign_batch(self, recruiter: str, requests: list, hours: WorkingHours = None) -> dict:
+        """Book a shortlist with one recruiter: [(app_id, applicant, earliest), ...] -> {app_id: Interview or None}.
+
+        Requests are placed in order of each applicant's earliest acceptable
+        time, all under one lock and one commit.
+        """
+        hours = hours or self.availability(recruiter)
+        with self._write():
+            return {
+                app_id: self._book_locked(app_id, recruiter, applicant, earliest, hours)
+                for app_id, applicant, earliest in sorted(requests, key=lambda request: request[2])
+            }
+
+    def get(self, app_id: str) -> Optional[Interview]:
+        with self._lock:
+            self._sync_locked()
+            return self._interviews.get(app_id)
+
+    def count(self) -> int:
+        with self._lock:
+            self._sync_locked()
+            return len(self._interviews)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def recruiter_key(hr: dict) -> str:
+    # Recruiter ID is optional on the HR form; fall back to the email
+    return hr.get("recruiter_id") or hr.get("email") or ""
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_interview_scheduler() -> InterviewScheduler:
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = InterviewScheduler()
+        return _scheduler
@@ -0,0 +1,238 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+JOBS_PATH = os.getenv("JOBS_PATH", "data/jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+BACKOFF_BASE_SECONDS = 5.0
+BACKOFF_MAX_SECONDS = 300.0
+IDLE_POLL_SECONDS = 1.0
+# A running job not heard from for this long is presumed abandoned by a dead process; renewed after every stage
+CLAIM_LEASE_SECONDS = float(os.getenv("JOB_CLAIM_LEASE_SECONDS", "900"))
+
+
+class StopPipeline(Exception):
+    """Raised by a stage to finish the job early without failing it (e.g. candidate not eligible)."""
+
+    def __init__(self, result=None):
+        super().__init__(result)
+        self.result = result
+
+
+class PermanentFailure(Exception):
+    """Raised by a stage when retrying cannot help (e.g. a PDF with no text); the job fails at once."""
+
+
+# -------------------------
+# 🧵 Durable multi-stage job queue
+# -------------------------
+class JobQueue:
+    """SQLite-backed queue of multi-stage jobs drained by a pool of worker threads.
+
+    `stages` is an ordered list of (name, fn) where fn(payload, results) returns a
+    JSON-serialisable result; `results` holds the earlier stages' results. With a
+    `context_factory`, fn(payload, results, context) also gets the object it built
+    from the payload, once per run of the job. Each stage's status is persisted as
+    it runs, so a retried or resumed job skips the stages that already finished.
+    Jobs are deduplicated by idempotency key. Several processes may share one
+    file: a job is claimed atomically under a lease, and only jobs whose lease
+    has expired are taken over.
+    """
+
+    def __init__(self, stages: list, path: str = JOBS_PATH, workers: int = JOB_WORKERS,
+                 max_attempts: int = JOB_MAX_ATTEMPTS, name: str = "jobs", context_factory=None,
+                 lease_seconds: float = CLAIM_LEASE_SECONDS):
+        self.stages = list(stages)
+        self.context_factory = context_factory
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.name = name
+        self.lease_seconds = lease_seconds
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                idempotency_key TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'queued',
+                stages TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL,
+                last_error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL,
+                claimed_by TEXT
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        if "claimed_by" not in columns:  # queues created before claims were leased
+            self._conn.execute("ALTER TABLE jobs ADD COLUMN claimed_by TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_due ON jobs (status, next_attempt_at)")
+        self._conn.commit()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _initial_stages(self) -> dict:
+        return {name: {"status": "pending"} for name, _ in self.stages}
+
+    def enqueue(self, idempotency_key: str, payload: dict) -> int:
+        """Queue a job, or return the id of the job already queued under this key."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO jobs (idempotency_key, payload, stages, next_attempt_at, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (idempotency_key, json.dumps(payload), json.dumps(self._initial_stages()), now, now, now),
+            )
+            self._conn.commit()
+            job_id = self._conn.execute(
+                "SELECT id FROM jobs WHERE idempotency_key = ?", (idempotency_key,)
+            ).fetchone()[0]
+        self.start()
+        self._wakeup.set()
+        return job_id
+
+    def _claim(self):
+        now = time.time()
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front, so two processes never claim the same job
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Jobs a dead process was running resume from their first unfinished stage
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'queued', claimed_by = NULL WHERE status = 'running' AND updated_at < ?",
+                    (now - self.lease_seconds,),
+                )
+                row = self._conn.execute(
+                    "UPDATE jobs SET status = 'running', claimed_by = ?, updated_at = ? "
+                    "WHERE status = 'queued' AND id = (SELECT id FROM jobs "
+                    "WHERE status = 'queued' AND next_attempt_at <= ? ORDER BY id LIMIT 1) "
+                    "RETURNING id, payload, stages, attempts",
+                    (self.owner, now, now),
+                ).fetchone()
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]), json.loads(row[2]), row[3]
+
+    def _save(self, job_id: int, stages: dict, **fields) -> bool:
+        """Persist progress and renew the lease; False if another process has taken the job over."""
+        if fields.get("status", "running") != "running":
+            fields["claimed_by"] = None
+        sets = ", ".join(f"{k} = ?" for k in fields)
+        with self._lock:
+            cur = self._conn.execute(
+                f"UPDATE jobs SET stages = ?, updated_at = ?{', ' + sets if sets else ''} "
+                f"WHERE id = ? AND claimed_by = ?",
+                (json.dumps(stages), time.time(), *fields.values(), job_id, self.owner),
+            )
+            self._conn.commit()
+        return cur.rowcount > 0
+
+    def run_once(self) -> bool:
+        """Claim one due job and run its remaining stages. Returns False when nothing was due."""
+        claimed = self._claim()
+        if claimed is None:
+            return False
+        job_id, payload, stages, attempts = claimed
+        results = {name: state.get("result") for name, state in stages.items() if state["status"] == "done"}
+        context = None
+
+        for name, fn in self.stages:
+            state = stages.setdefault(name, {"status": "pending"})
+            if state["status"] in ("done", "skipped"):
+                continue
+            state.update(status="running", started_at=time.time())
+            if not self._save(job_id, stages):
+                print(f"⚠️ Job {job_id} lease expired and was taken over; abandoning it here")
+                return True
+            try:
+                if self.context_factory is None:
+                    result = fn(payload, results)
+                else:
+                    if context is None:
+                        context = self.context_factory(payload)
+                    result = fn(payload, results, context)
+            except StopPipeline as stop:
+                state.update(status="done", result=stop.result, finished_at=time.time())
+                for later, _ in self.stages:
+                    if stages[later]["status"] == "pending":
+                        stages[later]["status"] = "skipped"
+                self._save(job_id, stages, status="done")
+                return True
+            except PermanentFailure as e:
+                self._fail(job_id, stages, name, attempts, e, retry=False)
+                return True
+            except Exception as e:
+                self._fail(job_id, stages, name, attempts, e)
+                return True
+            state.update(status="done", result=result, finished_at=time.time())
+            state.pop("error", None)
+            results[name] = result
+            self._save(job_id, stages)
+
+        self._save(job_id, stages, status="done")
+        return True
+
+    def _fail(self, job_id: int, stages: dict, stage: str, attempts: int, error: Exception, retry: bool = True):
+        attempts += 1
+        message = f"{stage}: {error}"
+        print(f"⚠️ Job {job_id} failed in {stage} (attempt {attempts}): {error}")
+        stages[stage].update(status="failed", error=str(error), finished_at=time.time())
+        if not retry or attempts >= self.max_attempts:
+            status, next_at = "failed", time.time()
+        else:
+            delay = min(BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)), BACKOFF_MAX_SECONDS)
+            status, next_at = "queued", time.time() + delay
+        self._save(job_id, stages, status=status, attempts=attempts, next_attempt_at=next_at, last_error=message)
+
+    def _run(self):
+        while not self._stop.is_set():
+            if not self.run_once():
+                self._wakeup.wait(IDLE_POLL_SECONDS)
+                self._wakeup.clear()
+
+    def start(self):
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            if self._threads:
+                return
+            self._stop.clear()
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"{self.name}-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5):
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+
+    def status(self, job_id: int):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, stages, attempts, last_error FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if not row:
+            return None
+        return {"status": row[0], "stages": json.loads(row[1]), "attempts": row[2], "last_error": row[3]}
+
+    def counts(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return dict(rows)
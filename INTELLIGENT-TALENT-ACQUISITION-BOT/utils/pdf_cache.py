@@ -0,0 +1,96 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+CACHE_DIR = "data/pdf_text_cache/"
+MEMORY_LIMIT_BYTES = int(os.getenv("PDF_CACHE_MEMORY_BYTES", str(64 * 1024 * 1024)))
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# -------------------------
+# 🗃️ Content-addressed extraction cache
+# -------------------------
+class ExtractionCache:
+    """Extracted PDF text keyed by SHA-256 of the PDF bytes.
+
+    Two layers: an in-memory LRU bounded by total text size, backed by one
+    UTF-8 file per digest on disk.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, memory_limit: int = MEMORY_LIMIT_BYTES):
+        self.cache_dir = cache_dir
+        self.memory_limit = memory_limit
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bytes_saved = 0  # PDF bytes we did not have to parse again
+
+    def _disk_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.txt")
+
+    def _remember(self, digest: str, text: str):
+        size = len(text.encode("utf-8"))
+        if size > self.memory_limit:
+            return
+        if digest in self._memory:
+            self._memory_bytes -= len(self._memory.pop(digest).encode("utf-8"))
+        self._memory[digest] = text
+        self._memory_bytes += size
+        while self._memory_bytes > self.memory_limit:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted.encode("utf-8"))
+
+    def get(self, digest: str, pdf_size: int = 0):
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                self.memory_hits += 1
+                self.bytes_saved += pdf_size
+                return self._memory[digest]
+
+        path = self._disk_path(digest)
+        if not os.path.exists(path):
+            with self._lock:
+                self.misses += 1
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        with self._lock:
+            self.disk_hits += 1
+            self.bytes_saved += pdf_size
+            self._remember(digest, text)
+        return text
+
+    def put(self, digest: str, text: str):
+        path = self._disk_path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._remember(digest, text)
+
+    def stats(self) -> dict:
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+            }
+
+
+extraction_cache = ExtractionCache()
@@ -1,11 +1,29 @@
 import fitz  # PyMuPDF
+from utils.pdf_cache import extraction_cache, sha256_bytes
+
+
+def _parse_pdf_bytes(data: bytes) -> str:
+    text = ""
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        for page in doc:
+            text += page.get_text()
+    return text
+
+
+def extract_text_from_bytes(data: bytes) -> str:
+    # Byte-identical resumes are only ever parsed once
+    digest = sha256_bytes(data)
+    cached = extraction_cache.get(digest, pdf_size=len(data))
+    if cached is not None:
+        return cached
+    text = _parse_pdf_bytes(data)
+    extraction_cache.put(digest, text)
+    return text
+
 
 def extract_text_from_pdf(pdf_path):
     try:
-        text = ""
-        with fitz.open(pdf_path) as doc:
-            for page in doc:
-                text += page.get_text()
-        return text
+        with open(pdf_path, "rb") as f:
+            return extract_text_from_bytes(f.read())
     except Exception as e:
         return f"Error extracting PDF text: {e}"
@@ -0,0 +1,69 @@
+import re
+
+MAX_CHUNK_CHARS = 800
+CHUNK_OVERLAP_CHARS = 120
+
+# Header line → canonical section name
+SECTION_HEADERS = {
+    "summary": ["summary", "profile", "objective", "about me", "professional summary"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "work history",
+                   "internships", "internship"],
+    "skills": ["skills", "technical skills", "core competencies", "technologies", "tech stack"],
+    "education": ["education", "academic background", "academics", "qualifications"],
+    "projects": ["projects", "personal projects", "academic projects"],
+    "certifications": ["certifications", "certificates", "courses", "achievements", "awards"],
+}
+_HEADER_LOOKUP = {alias: name for name, aliases in SECTION_HEADERS.items() for alias in aliases}
+_HEADER_RE = re.compile(r"^\s*([A-Za-z][A-Za-z &/]{2,40}?)\s*:?\s*$")
+
+
+def _section_for(line: str):
+    match = _HEADER_RE.match(line)
+    if not match:
+        return None
+    return _HEADER_LOOKUP.get(match.group(1).strip().lower())
+
+
+def split_sections(resume_text: str) -> list:
+    """[(section, text), ...] in document order; text before the first header is "header"."""
+    sections, current, lines = [], "header", []
+    for line in (resume_text or "").splitlines():
+        name = _section_for(line)
+        if name:
+            if any(l.strip() for l in lines):
+                sections.append((current, "\n".join(lines).strip()))
+            current, lines = name, []
+        else:
+            lines.append(line)
+    if any(l.strip() for l in lines):
+        sections.append((current, "\n".join(lines).strip()))
+    return sections
+
+
+def _windows(text: str, max_chars: int, overlap: int) -> list:
+    if len(text) <= max_chars:
+        return [text]
+    pieces, start = [], 0
+    while start < len(text):
+        end = min(start + max_chars, len(text))
+        if end < len(text):
+            # Prefer breaking on a line, then a sentence, then a space
+            for sep in ("\n", ". ", " "):
+                cut = text.rfind(sep, start + max_chars // 2, end)
+                if cut != -1:
+                    end = cut + len(sep)
+                    break
+        pieces.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+    return [p for p in pieces if p]
+
+
+def chunk_resume(resume_text: str, max_chars: int = MAX_CHUNK_CHARS, overlap: int = CHUNK_OVERLAP_CHARS) -> list:
+    """Section-aware chunks: [{"section": ..., "text": ...}, ...]."""
+    chunks = []
+    for section, text in split_sections(resume_text):
+        for piece in _windows(text, max_chars, overlap):
+            chunks.append({"section": section, "text": piece})
+    return chunks
@@ -0,0 +1,183 @@
+import re
+import numpy as np
+import scipy.sparse as sp
+
+# Skills we recognise in job descriptions and resumes (unigrams and bigrams only)
+KNOWN_SKILLS = {
+    "python", "java", "javascript", "typescript", "c++", "c#", "golang", "rust", "scala",
+    "sql", "nosql", "postgresql", "mysql", "mongodb", "redis", "spark", "hadoop", "kafka",
+    "machine learning", "deep learning", "nlp", "computer vision", "data analysis", "statistics",
+    "pytorch", "tensorflow", "keras", "scikit-learn", "pandas", "numpy",
+    "django", "flask", "fastapi", "react", "angular", "node.js", "rest", "graphql", "microservices",
+    "docker", "kubernetes", "aws", "azure", "gcp", "linux", "git", "ci/cd", "terraform",
+    "excel", "tableau", "power bi", "communication", "leadership",
+}
+
+# Used when a job text names none of KNOWN_SKILLS (e.g. HR entries with only a title)
+DEFAULT_REQUIRED_SKILLS = ["python", "sql", "machine learning"]
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "in", "is", "it",
+    "of", "on", "or", "our", "the", "to", "we", "with", "you", "your", "will", "this", "that", "who",
+    "hiring", "looking", "years", "year", "experience", "role", "team", "work",
+}
+
+# Reference resume length for BM25's length normalisation; fixed so a score never depends on the batch
+AVG_RESUME_TOKENS = 450
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#./-]*[a-z0-9+#]|[a-z0-9]")
+
+
+def tokenize(text: str) -> list:
+    return _TOKEN_RE.findall((text or "").lower())
+
+
+def _terms(tokens: list) -> list:
+    """Unigrams plus bigrams, so multi-word skills are single features."""
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+# -------------------------
+# 📐 Vectorised resume-vs-job scorer
+# -------------------------
+class ResumeScorer:
+    """Scores every resume against every job in one sparse matrix pass.
+
+    final = skill_weight * exact-skill coverage + (1 - skill_weight) * normalised BM25
+
+    idf is fitted once over the job texts (terms shared by many positions
+    weigh less) and lengths are normalised against `avgdl`, so a resume
+    scores the same alone or in a batch.
+    """
+
+    def __init__(self, job_texts: list, k1: float = 1.5, b: float = 0.75, skill_weight: float = 0.6,
+                 avgdl: float = AVG_RESUME_TOKENS):
+        self.k1 = k1
+        self.b = b
+        self.skill_weight = skill_weight
+        self.avgdl = avgdl
+
+        job_tokens = [tokenize(text) for text in job_texts]
+        job_skills = []
+        for tokens in job_tokens:
+            found = sorted(set(_terms(tokens)) & KNOWN_SKILLS)
+            job_skills.append(found or list(DEFAULT_REQUIRED_SKILLS))
+
+        self.skills = sorted({skill for skills in job_skills for skill in skills})
+        skill_pos = {skill: i for i, skill in enumerate(self.skills)}
+        job_words = {t for tokens in job_tokens for t in tokens if t not in STOPWORDS}
+        self.terms = sorted(job_words | set(self.skills))
+        self.term_index = {term: i for i, term in enumerate(self.terms)}
+        self.skill_columns = np.array([self.term_index[s] for s in self.skills], dtype=np.int64)
+
+        # Binary job × term query matrix and job × skill requirement matrix
+        self.job_terms = self._encode(job_tokens, binary=True)
+        self.job_skills = sp.csr_matrix(
+            (
+                np.ones(sum(len(s) for s in job_skills)),
+                (
+                    np.repeat(np.arange(len(job_skills)), [len(s) for s in job_skills]),
+                    [skill_pos[s] for skills in job_skills for s in skills],
+                ),
+            ),
+            shape=(len(job_skills), len(self.skills)),
+        )
+        self.required_counts = np.asarray(self.job_skills.sum(axis=1)).ravel()
+
+        n_jobs = self.job_terms.shape[0]
+        df = np.bincount(self.job_terms.indices, minlength=len(self.terms))
+        self.idf = np.log1p((n_jobs - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    def _encode(self, token_lists: list, binary: bool = False) -> sp.csr_matrix:
+        rows, cols = [], []
+        for row, tokens in enumerate(token_lists):
+            for term in _terms(tokens):
+                col = self.term_index.get(term)
+                if col is not None:
+                    rows.append(row)
+                    cols.append(col)
+        matrix = sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.float32), (rows, cols)),
+            shape=(len(token_lists), len(self.terms)),
+        )
+        matrix.sum_duplicates()
+        if binary:
+            matrix.data[:] = 1.0
+        return matrix
+
+    def encode_resumes(self, resumes: list):
+        """Returns (term-frequency matrix, document lengths in tokens)."""
+        token_lists = [tokenize(text) for text in resumes]
+        lengths = np.array([len(tokens) for tokens in token_lists], dtype=np.float32)
+        return self._encode(token_lists), lengths
+
+    def score(self, resumes: list) -> dict:
+        """Applicants × positions matrices: "bm25", "coverage", "score" (all in [0, 1])."""
+        tf, lengths = self.encode_resumes(resumes)
+        idf = self.idf
+
+        # BM25 term weights computed directly on the sparse data array
+        row_norm = self.k1 * (1 - self.b + self.b * lengths / self.avgdl)
+        weights = tf.copy()
+        freq = weights.data
+        weights.data = freq * (self.k1 + 1) / (freq + np.repeat(row_norm, np.diff(weights.indptr)))
+        bm25 = np.asarray((weights @ sp.diags(idf) @ self.job_terms.T).todense())
+        # Normalise so one occurrence of every job term in an average-length resume scores 1.0
+        upper = np.asarray(self.job_terms @ idf).ravel()
+        bm25 = np.clip(np.divide(bm25, upper, out=np.zeros_like(bm25), where=upper > 0), 0.0, 1.0)
+
+        has_skill = tf[:, self.skill_columns]
+        has_skill.data[:] = 1.0
+        matched = np.asarray((has_skill @ self.job_skills.T).todense())
+        coverage = np.divide(matched, self.required_counts, out=np.zeros_like(matched),
+                             where=self.required_counts > 0)
+
+        return {
+            "bm25": bm25,
+            "coverage": coverage,
+            "score": self.skill_weight * coverage + (1 - self.skill_weight) * bm25,
+            "resume_skills": has_skill,
+        }
+
+    def skill_breakdown(self, resume_skills: sp.csr_matrix, applicant: int, job: int):
+        """(required, found, missing) skill names for one applicant/job pair."""
+        required = [self.skills[i] for i in self.job_skills[job].indices]
+        have = {self.skills[i] for i in resume_skills[applicant].indices}
+        found = [s for s in required if s in have]
+        missing = [s for s in required if s not in have]
+        return required, found, missing
+
+
+def job_text_from_entry(metadata: dict, document: str = "") -> str:
+    metadata = metadata or {}
+    return " ".join(filter(None, [metadata.get("position"), metadata.get("job_description"), document]))
+
+
+# -------------------------
+# 📊 Bulk ranking over the stored collections
+# -------------------------
+def rank_applicants(top_k: int = 10) -> dict:
+    """Rank every stored applicant against every open position.
+
+    Returns {position_id: [(applicant_id, score, coverage), ...]} best first.
+    """
+    from chroma_db.db_handler import get_all_open_positions, get_all_applicants
+
+    positions = get_all_open_positions()
+    applicants = get_all_applicants()
+    if not positions["ids"] or not applicants["ids"]:
+        return {}
+
+    scorer = ResumeScorer([
+        job_text_from_entry(meta, doc) for meta, doc in zip(positions["metadatas"], positions["documents"])
+    ])
+    result = scorer.score(applicants["documents"])
+    scores, coverage = result["score"], result["coverage"]
+
+    ranking = {}
+    for job, position_id in enumerate(positions["ids"]):
+        order = np.argsort(-scores[:, job])[:top_k]
+        ranking[position_id] = [
+            (applicants["ids"][i], float(scores[i, job]), float(coverage[i, job])) for i in order
+        ]
+    return ranking
@@ -9,6 +9,8 @@ def initialize_session():
         st.session_state.applicant_details = {}
     if 'chat_history' not in st.session_state:
         st.session_state.chat_history = []
+    if 'chat_context' not in st.session_state:
+        st.session_state.chat_context = {}
 
 def get_session_data():
     return {
@@ -25,3 +27,9 @@ def update_chat_history(user_input, bot_response):
         "user": user_input,
         "bot": bot_response
     })
+
+def get_chat_context_state():
+    # Running summary + number of turns already folded into it (see utils.chat_context)
+    if 'chat_context' not in st.session_state:
+        st.session_state.chat_context = {}
+    return st.session_state.chat_context
@@ -0,0 +1,46 @@
+import time
+from contextlib import contextmanager
+
+
+# -------------------------
+# ⏱️ Per-rerun timing
+# -------------------------
+class RerunTimer:
+    """Collects wall-clock time per named section of one Streamlit rerun."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.sections = []  # [(label, seconds)] in execution order
+
+    def lap(self, label: str):
+        """Attribute the time since the previous lap (or the start) to `label`."""
+        now = time.perf_counter()
+        self.sections.append((label, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def section(self, label: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.sections.append((label, self._last - start))
+
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def rows(self) -> list:
+        total = self.total()
+        rows = [
+            {"section": label, "ms": round(seconds * 1000, 1), "share": f"{seconds / total:.0%}" if total else "-"}
+            for label, seconds in self.sections
+        ]
+        rows.append({"section": "total", "ms": round(total * 1000, 1), "share": "100%"})
+        return rows
+
+    def render(self):
+        import streamlit as st
+        with st.expander("⏱️ Rerun timings"):
+            st.table(self.rows())
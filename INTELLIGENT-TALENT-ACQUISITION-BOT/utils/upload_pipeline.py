@@ -0,0 +1,72 @@
+import hashlib
+import json
+import os
+import threading
+from agents.pipeline import enqueue_application
+from chroma_db.db_handler import entry_id, save_applicant_to_db
+from utils.helper import save_upload_bytes
+from utils.job_queue import JobQueue, PermanentFailure
+from utils.pdf_parser import extract_text_from_bytes
+
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", "2"))
+# Its own file: JobQueue workers claim any queued row in their table
+UPLOAD_JOBS_PATH = os.getenv("UPLOAD_JOBS_PATH", "data/upload_jobs.sqlite3")
+
+
+def _resume_text(path: str) -> str:
+    with open(path, "rb") as f:
+        return extract_text_from_bytes(f.read())
+
+
+# -------------------------
+# 🧩 Ingestion stages
+# -------------------------
+def extract_stage(payload: dict, results: dict) -> dict:
+    text = _resume_text(payload["path"])
+    if not text.strip():
+        raise PermanentFailure("No text could be extracted from the resume (is it a scanned image?)")
+    return {"characters": len(text)}
+
+
+def save_stage(payload: dict, results: dict) -> str:
+    # The text comes back from the extraction cache the previous stage filled
+    return save_applicant_to_db(payload["applicant"], _resume_text(payload["path"]))
+
+
+def handoff_stage(payload: dict, results: dict) -> int:
+    return enqueue_application(results["save"], payload.get("revision", payload["digest"][:16]))
+
+
+UPLOAD_STAGES = [
+    ("extract", extract_stage),
+    ("save", save_stage),
+    ("handoff", handoff_stage),
+]
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_upload_queue() -> JobQueue:
+    """Process-wide ingestion queue; UPLOAD_WORKERS threads extract, embed and write uploads."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = JobQueue(UPLOAD_STAGES, path=UPLOAD_JOBS_PATH, workers=UPLOAD_WORKERS, name="upload")
+        return _queue
+
+
+def submit_application(applicant_data: dict, file_name: str, data: bytes, queue: JobQueue = None) -> int:
+    """Store the resume bytes and queue the rest; returns the ingestion job id.
+
+    Only the file write happens on the caller's thread. Submitting the same
+    file with the same form values again returns the existing job; changing
+    either (a corrected yoe, a new free date) queues a new one, which
+    overwrites the application and screens it again.
+    """
+    path, digest = save_upload_bytes(data, file_name)
+    form = json.dumps(applicant_data, sort_keys=True, default=str)
+    revision = hashlib.sha256(f"{digest}\0{form}".encode("utf-8")).hexdigest()[:16]
+    key = f"upload:{entry_id('app', applicant_data.get('email'), applicant_data.get('position'))}:{revision}"
+    payload = {"path": path, "digest": digest, "revision": revision, "applicant": applicant_data}
+    return (queue or get_upload_queue()).enqueue(key, payload)